@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from uuid import UUID
 
@@ -22,6 +23,7 @@ from app.multi_agent.factories.ai_model_factory import AIModelFactory
 from app.multi_agent.models.message_dynamodb import MessageDynamoDB as Message, MessageTypesDynamoDB as MessageTypes
 from app.multi_agent.utils.helpers import StreamWriter as ConversationStreamWriter
 from app.multi_agent.databases.dynamodb import get_db_session_with_context
+from app.multi_agent.utils.streams import iterate_in_thread
 
 async def chat_knowledgebase_node(
     state: ConversationState, config: RunnableConfig, writer: StreamWriter
@@ -65,7 +67,10 @@ async def chat_knowledgebase_node(
             f"[CONVERSATION_CHAT_NODE] - LENGTH_OF_CONTEXT_MESSAGES: {len(context_messages)}, conversation_id: {conversation_id}"
         )
 
-        response = BEDROCK_KNOWLEDGEBASE.retrieve_and_generate_stream(
+        # boto3 blocks on the request and between stream events; keep both off the
+        # event loop so each chunk reaches the SSE response as soon as it arrives
+        response = await asyncio.to_thread(
+            BEDROCK_KNOWLEDGEBASE.retrieve_and_generate_stream,
             input={"text": state.messages[-1]},
             retrieveAndGenerateConfiguration={
                 "knowledgeBaseConfiguration": {
@@ -75,7 +80,7 @@ async def chat_knowledgebase_node(
                 "type": "KNOWLEDGE_BASE",
             },
         )
-        for event in response["stream"]:
+        async for event in iterate_in_thread(response["stream"]):
             output = event.get("output")
             if output and "text" in output:
                 writer(
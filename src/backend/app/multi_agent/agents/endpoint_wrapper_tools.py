@@ -12,6 +12,8 @@ from fastapi import UploadFile
 from datetime import datetime
 from uuid import uuid4
 
+from app.multi_agent.utils.uploads import get_file_extension
+
 logger = logging.getLogger(__name__)
 
 @tool
@@ -31,7 +33,7 @@ def compliance_document_tool(query: str, file_data: Optional[Dict[str, Any]] = N
             try:
                 file_content = file_data.get('raw_bytes')
                 filename = file_data.get('filename', 'document.pdf')
-                file_extension = os.path.splitext(filename)[1].lower()
+                file_extension = get_file_extension(filename)
 
                 # Extract text from document using service
                 text_service = TextSummaryService()
@@ -186,7 +188,7 @@ def text_summary_document_tool(query: str, file_data: Optional[Dict[str, Any]] =
             try:
                 file_content = file_data.get('raw_bytes')
                 filename = file_data.get('filename', 'document.pdf')
-                file_extension = os.path.splitext(filename)[1].lower()
+                file_extension = get_file_extension(filename)
 
                 # Use TextSummaryService directly
                 text_service = TextSummaryService()
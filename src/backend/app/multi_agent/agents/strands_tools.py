@@ -5,15 +5,20 @@ Multi-Agent Hackathon 2025 - Group 181
 Strands Agent tools that wrap existing API agent logic for supervisor agent integration
 """
 
+import hashlib
 import json
 import logging
-from typing import Dict, Any, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
 from strands import Agent, tool
 from strands.models import BedrockModel
 from strands_tools import retrieve, http_request
 from botocore.config import Config as BotocoreConfig
 
 # Import existing services
+from app.multi_agent.config import BEDROCK_MAX_POOL_CONNECTIONS
 from app.multi_agent.services.compliance_service import ComplianceValidationService
 from app.multi_agent.services.risk_service import assess_risk
 from app.multi_agent.models.risk import RiskAssessmentRequest
@@ -22,10 +27,30 @@ from app.multi_agent.models.risk import RiskAssessmentRequest
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Progress hook for streaming callers: receives (event, data), e.g. ("agent_start", {...}).
+# Invoked from worker threads, so implementations must be thread-safe.
+AgentEventCallback = Callable[[str, Dict[str, Any]], None]
+
 # ============================================================================
 # BEDROCK MODEL CONFIGURATION
 # ============================================================================
 
+def _prompt_cache_kwargs() -> Dict[str, Any]:
+    """
+    BedrockModel arguments that cache the static system prompt and tool
+    definitions across requests. CacheConfig(tools_ttl=...) only exists in
+    recent strands-agents; older releases take the cache_prompt/cache_tools kwargs.
+    """
+    try:
+        from strands.models import CacheConfig
+        return {"cache_config": CacheConfig(strategy="auto", tools_ttl=True)}
+    except (ImportError, TypeError):
+        return {"cache_prompt": "default", "cache_tools": "default"}
+
+
+_PROMPT_CACHE_KWARGS = _prompt_cache_kwargs()
+
+
 def create_bedrock_model(temperature: float = 0.3) -> BedrockModel:
     """
     Create a properly configured Bedrock model for Strands Agents
@@ -42,7 +67,10 @@ def create_bedrock_model(temperature: float = 0.3) -> BedrockModel:
             retries={"max_attempts": 3, "mode": "standard"},
             connect_timeout=10,
             read_timeout=120,
-            region_name="us-east-1"  # Ensure region is set
+            region_name="us-east-1",  # Ensure region is set
+            # Supervisor fan-out issues several sub-agent calls at once; keep them on warm connections
+            max_pool_connections=BEDROCK_MAX_POOL_CONNECTIONS,
+            tcp_keepalive=True
         )
         
         # Create configured Bedrock model
@@ -53,6 +81,7 @@ def create_bedrock_model(temperature: float = 0.3) -> BedrockModel:
             top_p=0.9,
             max_tokens=4096,
             boto_client_config=boto_config,
+            **_PROMPT_CACHE_KWARGS,
         )
         
         logger.info("✅ Bedrock model configured successfully")
@@ -527,8 +556,12 @@ Always provide clear, actionable insights for Vietnamese banking operations.
 """
 
 # Create the supervisor agent with Bedrock model
-def create_supervisor_agent():
-    """Create supervisor agent with proper Bedrock model configuration"""
+def create_supervisor_agent(callback_handler: Optional[Callable[..., None]] = None):
+    """
+    Create supervisor agent with proper Bedrock model configuration.
+    ``callback_handler`` replaces the default Strands handler (e.g. to forward token deltas).
+    """
+    agent_kwargs = {"callback_handler": callback_handler} if callback_handler else {}
     try:
         bedrock_model = create_bedrock_model(temperature=0.4)  # Balanced temperature for orchestration
         
@@ -540,7 +573,8 @@ def create_supervisor_agent():
                     compliance_validation_agent,
                     risk_assessment_agent, 
                     document_intelligence_agent
-                ]
+                ],
+                **agent_kwargs
             )
         else:
             # Fallback without Bedrock model
@@ -550,7 +584,8 @@ def create_supervisor_agent():
                     compliance_validation_agent,
                     risk_assessment_agent, 
                     document_intelligence_agent
-                ]
+                ],
+                **agent_kwargs
             )
     except Exception as e:
         logger.error(f"❌ Failed to create supervisor agent: {str(e)}")
@@ -561,7 +596,8 @@ def create_supervisor_agent():
                 compliance_validation_agent,
                 risk_assessment_agent, 
                 document_intelligence_agent
-            ]
+            ],
+            **agent_kwargs
         )
 
 # Create the supervisor agent instance
@@ -590,6 +626,71 @@ def vpbank_supervisor_agent(user_request: str, context: Optional[Dict[str, Any]]
     Returns:
         Comprehensive response with agent coordination results
     """
+    return run_supervisor(user_request, context)
+
+
+_DOCUMENT_START = "--- DOCUMENT CONTENT ---"
+_DOCUMENT_END = "--- END DOCUMENT ---"
+
+# SHA-256 of documents recently sent to the supervisor. Only a repeat document gets
+# a cache point, so one-off uploads do not pay the cache-write premium.
+_SEEN_DOCUMENTS: "OrderedDict[str, None]" = OrderedDict()
+_SEEN_DOCUMENTS_MAX = 512
+_SEEN_DOCUMENTS_LOCK = threading.Lock()
+
+
+def _split_document_content(enhanced_request: str) -> Tuple[str, str]:
+    """Split ``--- DOCUMENT CONTENT ---`` blocks out of a request: returns (document, remaining text)"""
+    start_idx = enhanced_request.find(_DOCUMENT_START)
+    end_idx = enhanced_request.find(_DOCUMENT_END)
+    if start_idx == -1 or end_idx == -1:
+        return "", enhanced_request
+    document_content = enhanced_request[start_idx + len(_DOCUMENT_START):end_idx].strip()
+    before, after = enhanced_request[:start_idx].strip(), enhanced_request[end_idx + len(_DOCUMENT_END):].strip()
+    remaining = "\n\n".join(part for part in (before, after) if part)
+    return document_content, remaining
+
+
+def _document_seen_before(document_content: str) -> bool:
+    digest = hashlib.sha256(document_content.encode("utf-8")).hexdigest()
+    with _SEEN_DOCUMENTS_LOCK:
+        seen = digest in _SEEN_DOCUMENTS
+        _SEEN_DOCUMENTS[digest] = None
+        _SEEN_DOCUMENTS.move_to_end(digest)
+        if len(_SEEN_DOCUMENTS) > _SEEN_DOCUMENTS_MAX:
+            _SEEN_DOCUMENTS.popitem(last=False)
+    return seen
+
+
+def _build_supervisor_prompt(document_content: str, request_text: str) -> Union[str, List[Dict[str, Any]]]:
+    """
+    Order the supervisor prompt as document block, then the user request. When the
+    same document was seen recently, a Bedrock cache point follows the document so
+    its prefill is reused.
+    """
+    if not document_content:
+        return request_text
+    blocks: List[Dict[str, Any]] = [{"text": f"{_DOCUMENT_START}\n{document_content}\n{_DOCUMENT_END}"}]
+    if _document_seen_before(document_content):
+        blocks.append({"cachePoint": {"type": "default"}})
+    if request_text:
+        blocks.append({"text": request_text})
+    return blocks
+
+
+def run_supervisor(
+    user_request: str,
+    context: Optional[Dict[str, Any]] = None,
+    parallel: bool = True,
+    on_event: Optional[AgentEventCallback] = None,
+    supervisor: Optional[Agent] = None
+) -> str:
+    """
+    Supervisor workflow behind vpbank_supervisor_agent. ``parallel`` controls
+    whether routed specialist agents run concurrently in the fallback path;
+    ``on_event`` receives agent progress and model text deltas as they happen.
+    ``supervisor`` is an agent prebuilt with create_supervisor_agent(), built here if omitted.
+    """
     try:
         logger.info(f"🎯 Supervisor Agent: Processing request - {user_request[:100]}...")
         
@@ -598,11 +699,23 @@ def vpbank_supervisor_agent(user_request: str, context: Optional[Dict[str, Any]]
         if context:
             enhanced_request += f"\n\nContext Information: {json.dumps(context, ensure_ascii=False)}"
         
-        # Get or create supervisor agent
-        current_supervisor = create_supervisor_agent()
+        # Document first and the question last, so repeat questions about the same
+        # upload share a cacheable prompt prefix
+        document_content, request_text = _split_document_content(enhanced_request)
+        prompt = _build_supervisor_prompt(document_content, request_text)
+        
+        # Get or create supervisor agent; streaming callers get model text deltas forwarded
+        invoke_kwargs = {}
+        if on_event:
+            def callback_handler(**kwargs):
+                if kwargs.get("data"):
+                    on_event("delta", {"agent": "supervisor_orchestrator", "text": kwargs["data"]})
+            invoke_kwargs["callback_handler"] = callback_handler
+            on_event("agent_start", {"agent": "supervisor_orchestrator"})
+        current_supervisor = supervisor or create_supervisor_agent()
         
         # Process through supervisor agent
-        supervisor_response = current_supervisor(enhanced_request)
+        supervisor_response = current_supervisor(prompt, **invoke_kwargs)
         
         # Structure the response
         final_result = {
@@ -630,18 +743,10 @@ def vpbank_supervisor_agent(user_request: str, context: Optional[Dict[str, Any]]
             logger.info("🔄 Attempting enhanced fallback processing with agent routing...")
             
             # Extract document content from enhanced request
-            document_content = ""
-            if "--- DOCUMENT CONTENT ---" in enhanced_request:
-                start_marker = "--- DOCUMENT CONTENT ---"
-                end_marker = "--- END DOCUMENT ---"
-                start_idx = enhanced_request.find(start_marker)
-                end_idx = enhanced_request.find(end_marker)
-                
-                if start_idx != -1 and end_idx != -1:
-                    document_content = enhanced_request[start_idx + len(start_marker):end_idx].strip()
+            document_content, _ = _split_document_content(enhanced_request)
             
             # Intelligent routing based on request content and context
-            routing_results = perform_intelligent_routing(user_request, document_content, context)
+            routing_results = perform_intelligent_routing(user_request, document_content, context, parallel, on_event)
             
             # Combine all agent results
             final_analysis = synthesize_agent_results(routing_results, user_request, document_content, context)
@@ -681,7 +786,56 @@ def vpbank_supervisor_agent(user_request: str, context: Optional[Dict[str, Any]]
 # INTELLIGENT ROUTING AND AGENT COORDINATION
 # ============================================================================
 
-def perform_intelligent_routing(user_request: str, document_content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+_AGENT_LABELS = {
+    "document_intelligence": "Document Intelligence Agent",
+    "compliance_validation": "Compliance Validation Agent",
+    "risk_assessment": "Risk Assessment Agent",
+}
+
+
+def _call_agent(
+    agent_name: str,
+    call: Callable[[], str],
+    on_event: Optional[AgentEventCallback] = None
+) -> Tuple[str, Dict[str, Any], bool]:
+    """Invoke one agent tool and decode its JSON result; failures become error results"""
+    label = _AGENT_LABELS[agent_name]
+    if on_event:
+        on_event("agent_start", {"agent": agent_name})
+    try:
+        result = json.loads(call())
+        logger.info(f"✅ {label} completed")
+        outcome = agent_name, result, True
+    except Exception as e:
+        logger.error(f"❌ {label} failed: {str(e)}")
+        outcome = agent_name, {"status": "error", "message": str(e)}, False
+    if on_event:
+        on_event("agent_complete", {"agent": agent_name, "succeeded": outcome[2], "result": outcome[1]})
+    return outcome
+
+
+def _run_agent_calls(
+    agent_calls: List[Tuple[str, Callable[[], str]]],
+    parallel: bool = True,
+    on_event: Optional[AgentEventCallback] = None
+) -> List[Tuple[str, Dict[str, Any], bool]]:
+    """
+    Run the routed agent calls, concurrently in threads when ``parallel`` is set,
+    so wall time is the slowest agent rather than the sum. Results keep call order.
+    """
+    if not parallel or len(agent_calls) < 2:
+        return [_call_agent(name, call, on_event) for name, call in agent_calls]
+    with ThreadPoolExecutor(max_workers=len(agent_calls)) as executor:
+        return list(executor.map(lambda item: _call_agent(*item, on_event), agent_calls))
+
+
+def perform_intelligent_routing(
+    user_request: str,
+    document_content: str,
+    context: Dict[str, Any],
+    parallel: bool = True,
+    on_event: Optional[AgentEventCallback] = None
+) -> Dict[str, Any]:
     """
     Perform intelligent routing to appropriate agent tools based on request analysis
     
@@ -689,6 +843,8 @@ def perform_intelligent_routing(user_request: str, document_content: str, contex
         user_request: User's request
         document_content: Extracted document content
         context: Request context
+        parallel: Run the selected agents concurrently
+        on_event: Optional progress hook notified as each agent starts and completes
         
     Returns:
         Dictionary with routing decisions and agent results
@@ -699,6 +855,7 @@ def perform_intelligent_routing(user_request: str, document_content: str, contex
         routing_decisions = {}
         agent_results = {}
         agents_used = []
+        agent_calls = []
         
         # Analyze request to determine which agents to call
         request_lower = user_request.lower()
@@ -713,14 +870,10 @@ def perform_intelligent_routing(user_request: str, document_content: str, contex
                 "priority": 1
             }
             
-            try:
-                doc_result = document_intelligence_agent(document_content, context.get("document_type"))
-                agent_results["document_intelligence"] = json.loads(doc_result)
-                agents_used.append("document_intelligence")
-                logger.info("✅ Document Intelligence Agent completed")
-            except Exception as e:
-                logger.error(f"❌ Document Intelligence Agent failed: {str(e)}")
-                agent_results["document_intelligence"] = {"status": "error", "message": str(e)}
+            agent_calls.append((
+                "document_intelligence",
+                lambda: document_intelligence_agent(document_content, context.get("document_type"))
+            ))
         
         # 2. Compliance Validation Agent - For banking/LC documents
         should_check_compliance = (
@@ -741,14 +894,10 @@ def perform_intelligent_routing(user_request: str, document_content: str, contex
                 "priority": 2
             }
             
-            try:
-                compliance_result = compliance_validation_agent(document_content, context.get("document_type"))
-                agent_results["compliance_validation"] = json.loads(compliance_result)
-                agents_used.append("compliance_validation")
-                logger.info("✅ Compliance Validation Agent completed")
-            except Exception as e:
-                logger.error(f"❌ Compliance Validation Agent failed: {str(e)}")
-                agent_results["compliance_validation"] = {"status": "error", "message": str(e)}
+            agent_calls.append((
+                "compliance_validation",
+                lambda: compliance_validation_agent(document_content, context.get("document_type"))
+            ))
         
         # 3. Risk Assessment Agent - For credit/loan/financial analysis
         should_assess_risk = (
@@ -772,13 +921,14 @@ def perform_intelligent_routing(user_request: str, document_content: str, contex
                 "priority": 3
             }
             
-            try:
-                # Extract basic info for risk assessment
-                applicant_name = context.get("applicant_name", "Unknown Company")
-                business_type = context.get("business_type", "general")
-                requested_amount = context.get("loan_amount", 1000000000)  # Default 1B VND
-                
-                risk_result = risk_assessment_agent(
+            # Extract basic info for risk assessment
+            applicant_name = context.get("applicant_name", "Unknown Company")
+            business_type = context.get("business_type", "general")
+            requested_amount = context.get("loan_amount", 1000000000)  # Default 1B VND
+            
+            agent_calls.append((
+                "risk_assessment",
+                lambda: risk_assessment_agent(
                     applicant_name=applicant_name,
                     business_type=business_type,
                     requested_amount=requested_amount,
@@ -786,12 +936,14 @@ def perform_intelligent_routing(user_request: str, document_content: str, contex
                     loan_term=context.get("loan_term", 12),
                     financial_documents=document_content[:1000] if document_content else ""
                 )
-                agent_results["risk_assessment"] = json.loads(risk_result)
-                agents_used.append("risk_assessment")
-                logger.info("✅ Risk Assessment Agent completed")
-            except Exception as e:
-                logger.error(f"❌ Risk Assessment Agent failed: {str(e)}")
-                agent_results["risk_assessment"] = {"status": "error", "message": str(e)}
+            ))
+        
+        # Run the selected agents; they are independent I/O-bound calls, so run them
+        # concurrently and keep results in priority order
+        for agent_name, outcome, succeeded in _run_agent_calls(agent_calls, parallel, on_event):
+            agent_results[agent_name] = outcome
+            if succeeded:
+                agents_used.append(agent_name)
         
         # Return routing results
         return {
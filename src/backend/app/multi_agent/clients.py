@@ -0,0 +1,86 @@
+"""
+Shared boto3 clients for health/dependency probes.
+
+One session and one client per service, created on first use and reused by
+every probe so each check rides an open keep-alive connection instead of
+paying a TLS handshake. Timeouts are short and retries few: a probe should
+report a slow dependency, not wait it out.
+"""
+import asyncio
+import logging
+
+import boto3
+from botocore.config import Config as BotocoreConfig
+
+from app.multi_agent.config import (
+    AWS_ACCESS_KEY_ID,
+    AWS_BEDROCK_REGION,
+    AWS_REGION,
+    AWS_SECRET_ACCESS_KEY,
+    AWS_SESSION_TOKEN,
+    VERIFY_HTTPS,
+)
+
+logger = logging.getLogger(__name__)
+
+PROBE_CLIENT_CONFIG = BotocoreConfig(
+    tcp_keepalive=True,
+    connect_timeout=1,
+    read_timeout=2,
+    retries={"mode": "standard", "max_attempts": 2},
+)
+
+# Interval (seconds) of the keep-warm ping on the DynamoDB probe connection
+KEEP_WARM_INTERVAL = 30
+
+_session = None
+_clients = {}
+
+
+def _get_session() -> boto3.Session:
+    global _session
+    if _session is None:
+        _session = boto3.Session(
+            aws_access_key_id=AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+            aws_session_token=AWS_SESSION_TOKEN,
+        )
+    return _session
+
+
+def _get_client(service_name: str, region_name: str):
+    client = _clients.get(service_name)
+    if client is None:
+        client = _get_session().client(
+            service_name,
+            region_name=region_name,
+            verify=VERIFY_HTTPS,
+            config=PROBE_CLIENT_CONFIG,
+        )
+        _clients[service_name] = client
+    return client
+
+
+def get_dynamodb_probe_client():
+    """DynamoDB client shared by the health probes."""
+    return _get_client("dynamodb", AWS_REGION)
+
+
+def get_s3_probe_client():
+    """S3 client shared by the health probes."""
+    return _get_client("s3", AWS_REGION)
+
+
+def get_bedrock_probe_client():
+    """Bedrock control-plane client shared by the health probes."""
+    return _get_client("bedrock", AWS_BEDROCK_REGION)
+
+
+async def keep_probe_connections_warm(interval: float = KEEP_WARM_INTERVAL) -> None:
+    """Ping DynamoDB periodically so the probe connection stays open. Runs until cancelled."""
+    while True:
+        try:
+            await asyncio.to_thread(get_dynamodb_probe_client().describe_endpoints)
+        except Exception as e:
+            logger.debug("Keep-warm ping failed: %s", e)
+        await asyncio.sleep(interval)
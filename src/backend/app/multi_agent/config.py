@@ -1,6 +1,8 @@
+import logging
 import os
 
 import boto3
+from botocore.config import Config as BotocoreConfig
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -18,6 +20,53 @@ CONVERSATION_CHAT_TEMPERATURE = os.getenv("CONVERSATION_CHAT_TEMPERATURE")
 AWS_REGION = os.getenv("AWS_REGION")  # Default region for DynamoDB, S3, etc.
 AWS_BEDROCK_REGION = os.getenv("AWS_BEDROCK_REGION", "us-east-1")  # Bedrock specific region
 
+# Bedrock concurrency limits - size to the provisioned throughput / TPS quota
+BEDROCK_MAX_CONCURRENCY = int(os.getenv("BEDROCK_MAX_CONCURRENCY", "8"))
+BEDROCK_QUEUE_TIMEOUT = float(os.getenv("BEDROCK_QUEUE_TIMEOUT", "30"))  # seconds to wait for a slot
+
+# Process-wide cap on in-flight supervisor/summary LLM requests; beyond LLM_QUEUE_LIMIT
+# waiters, new requests are shed with 503 instead of queueing
+MAX_INFLIGHT_LLM = int(os.getenv("MAX_INFLIGHT_LLM", "16"))
+LLM_QUEUE_LIMIT = int(os.getenv("LLM_QUEUE_LIMIT", "32"))
+
+# Upper bound for a single health probe so a hung dependency cannot stall /health
+HEALTH_CHECK_TIMEOUT = float(os.getenv("HEALTH_CHECK_TIMEOUT", "5.0"))
+
+# Dependency probe cache: results stay fresh for DEPENDENCY_PROBE_MIN_TTL..MAX_TTL seconds;
+# on probe failure the last good result is served when STALE_ON_ERROR is enabled
+DEPENDENCY_PROBE_MIN_TTL = float(os.getenv("DEPENDENCY_PROBE_MIN_TTL", "30"))
+DEPENDENCY_PROBE_MAX_TTL = float(os.getenv("DEPENDENCY_PROBE_MAX_TTL", "60"))
+STALE_ON_ERROR = os.getenv("STALE_ON_ERROR", "true").lower() == "true"
+
+# Summary response cache: identical text + parameters reuse the stored summary
+SUMMARY_CACHE_TTL = float(os.getenv("SUMMARY_CACHE_TTL", "86400"))  # seconds
+SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "1024"))
+
+# Knowledge-base regulation lookups made during compliance validation
+REGULATION_CACHE_TTL = float(os.getenv("REGULATION_CACHE_TTL", "3600"))  # seconds
+REGULATION_CACHE_MAX_ENTRIES = int(os.getenv("REGULATION_CACHE_MAX_ENTRIES", "1024"))
+
+# Extracted document text cache, keyed on the uploaded file's SHA-256
+EXTRACTION_CACHE_TTL = float(os.getenv("EXTRACTION_CACHE_TTL", "86400"))  # seconds
+EXTRACTION_CACHE_MAX_ENTRIES = int(os.getenv("EXTRACTION_CACHE_MAX_ENTRIES", "256"))
+EXTRACTION_CACHE_MAX_CHARS = int(os.getenv("EXTRACTION_CACHE_MAX_CHARS", str(64 * 1024 * 1024)))
+
+# Worker processes for CPU-bound PDF/OCR extraction
+EXTRACTOR_POOL_WORKERS = int(os.getenv("EXTRACTOR_POOL_WORKERS", str(os.cpu_count() or 1)))
+
+# Large PDFs are split into page batches extracted in parallel across the pool;
+# in-flight batches are capped since each submission copies the file to a worker
+PDF_PAGE_BATCH_SIZE = int(os.getenv("PDF_PAGE_BATCH_SIZE", "16"))
+PDF_MAX_INFLIGHT_BATCHES = int(os.getenv("PDF_MAX_INFLIGHT_BATCHES", str(2 * EXTRACTOR_POOL_WORKERS)))
+
+# /risk/assess-file admission: concurrent extractions and how many may wait before shedding with 503
+ASSESS_CONCURRENCY = int(os.getenv("ASSESS_CONCURRENCY", "4"))
+ASSESS_QUEUE_LIMIT = int(os.getenv("ASSESS_QUEUE_LIMIT", "32"))
+
+# Response compression: bodies of at least GZIP_MINIMUM_SIZE bytes are gzipped
+GZIP_MINIMUM_SIZE = int(os.getenv("GZIP_MINIMUM_SIZE", "1024"))
+GZIP_COMPRESS_LEVEL = int(os.getenv("GZIP_COMPRESS_LEVEL", "5"))
+
 # AWS Credentials
 AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
@@ -40,6 +89,49 @@ MODEL_MAPPING = {
 }
 
 # Amazon Bedrock Configuration
+# "optimized" requests latency-optimized inference; only some models/regions
+# support it (e.g. Claude 3.5 Haiku in us-east-2), others reject the request
+BEDROCK_LATENCY_MODE = os.getenv("BEDROCK_LATENCY_MODE", "standard")
+# Compliance validation opts in; models outside LATENCY_OPTIMIZED_MODELS fall back to standard
+COMPLIANCE_LATENCY_MODE = os.getenv("COMPLIANCE_LATENCY_MODE", "optimized")
+# Trade documents checked per Bedrock prompt by ComplianceValidationService.validate_documents_batch
+COMPLIANCE_BATCH_SIZE = int(os.getenv("COMPLIANCE_BATCH_SIZE", "5"))
+# Output cap for a single-document validation reply (one JSON verdict)
+COMPLIANCE_VALIDATION_MAX_TOKENS = int(os.getenv("COMPLIANCE_VALIDATION_MAX_TOKENS", "2048"))
+# Classification and field extraction scan the first HEAD + last TAIL characters of
+# long OCR text (headers, parties and signature blocks); 0 for HEAD scans everything
+COMPLIANCE_SCAN_HEAD_CHARS = int(os.getenv("COMPLIANCE_SCAN_HEAD_CHARS", "8192"))
+COMPLIANCE_SCAN_TAIL_CHARS = int(os.getenv("COMPLIANCE_SCAN_TAIL_CHARS", "2048"))
+LATENCY_OPTIMIZED_MODELS = frozenset({
+    "anthropic.claude-3-5-haiku-20241022-v1:0",
+    "us.anthropic.claude-3-5-haiku-20241022-v1:0",
+    "us.meta.llama3-1-70b-instruct-v1:0",
+    "us.meta.llama3-1-405b-instruct-v1:0",
+    "us.amazon.nova-pro-v1:0",
+})
+
+# In-process cache of deterministic (temperature 0) LLM responses; 0 disables it
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024"))
+BEDROCK_MAX_POOL_CONNECTIONS = int(os.getenv("BEDROCK_MAX_POOL_CONNECTIONS", "64"))
+BEDROCK_CONNECT_TIMEOUT = float(os.getenv("BEDROCK_CONNECT_TIMEOUT", "3"))
+BEDROCK_READ_TIMEOUT = float(os.getenv("BEDROCK_READ_TIMEOUT", "120"))
+BEDROCK_KB_MAX_ATTEMPTS = int(os.getenv("BEDROCK_KB_MAX_ATTEMPTS", "5"))
+BEDROCK_KB_READ_TIMEOUT = float(os.getenv("BEDROCK_KB_READ_TIMEOUT", "60"))
+
+# Worker threads behind asyncio.to_thread (blocking boto3 KB/Bedrock calls, parsing);
+# the stdlib default of min(32, cpus + 4) would cap concurrent AWS calls below the pool
+BLOCKING_IO_THREADS = int(os.getenv("BLOCKING_IO_THREADS", str(BEDROCK_MAX_POOL_CONNECTIONS)))
+
+# Shared botocore config for Bedrock clients: the default pool of 10 connections
+# would queue concurrent summary/agent calls behind fresh TLS handshakes
+BEDROCK_CLIENT_CONFIG = BotocoreConfig(
+    max_pool_connections=BEDROCK_MAX_POOL_CONNECTIONS,
+    retries={"max_attempts": 2, "mode": "adaptive"},
+    connect_timeout=BEDROCK_CONNECT_TIMEOUT,
+    read_timeout=BEDROCK_READ_TIMEOUT,
+    tcp_keepalive=True,
+)
+
 bedrock_endpoint_url = os.getenv("BEDROCK_ENDPOINT_URL")
 if bedrock_endpoint_url and bedrock_endpoint_url.strip():
     BEDROCK_RT = boto3.client(
@@ -50,6 +142,7 @@ if bedrock_endpoint_url and bedrock_endpoint_url.strip():
         aws_session_token=AWS_SESSION_TOKEN,  # Add session token for temporary credentials
         endpoint_url=bedrock_endpoint_url,
         verify=VERIFY_HTTPS,  # Add SSL verification setting
+        config=BEDROCK_CLIENT_CONFIG,
     )
 else:
     BEDROCK_RT = boto3.client(
@@ -59,8 +152,31 @@ else:
         aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
         aws_session_token=AWS_SESSION_TOKEN,  # Add session token for temporary credentials
         verify=VERIFY_HTTPS,  # Add SSL verification setting
+        config=BEDROCK_CLIENT_CONFIG,
     )
 
+# Knowledge base calls have no side effects, so they retry harder than model
+# invocations; the shorter read timeout fails a stalled connection over sooner
+BEDROCK_KB_CLIENT_CONFIG = BEDROCK_CLIENT_CONFIG.merge(BotocoreConfig(
+    retries={"max_attempts": BEDROCK_KB_MAX_ATTEMPTS, "mode": "adaptive"},
+    read_timeout=BEDROCK_KB_READ_TIMEOUT,
+))
+
+
+def _log_kb_retry(attempts, response=None, caught_exception=None, operation=None, **kwargs):
+    # Observability only: returning None leaves the retry decision to botocore
+    if caught_exception is not None:
+        reason = repr(caught_exception)
+    elif response is not None and response[0].status_code >= 400:
+        reason = f"HTTP {response[0].status_code}"
+    else:
+        return None
+    logging.warning(
+        f"Bedrock knowledge base {getattr(operation, 'name', '')} attempt {attempts} failed: {reason}"
+    )
+    return None
+
+
 # Only create BEDROCK_KNOWLEDGEBASE client if region is provided
 if AWS_KNOWLEDGEBASE_REGION and AWS_KNOWLEDGEBASE_REGION.strip():
     BEDROCK_KNOWLEDGEBASE = boto3.client(
@@ -69,7 +185,9 @@ if AWS_KNOWLEDGEBASE_REGION and AWS_KNOWLEDGEBASE_REGION.strip():
         aws_access_key_id=AWS_KNOWLEDGEBASE_ACCESS_KEY_ID,
         aws_secret_access_key=AWS_KNOWLEDGEBASE_SECRET_ACCESS_KEY,
         verify=VERIFY_HTTPS,
+        config=BEDROCK_KB_CLIENT_CONFIG,
     )
+    BEDROCK_KNOWLEDGEBASE.meta.events.register("needs-retry.bedrock-agent-runtime", _log_kb_retry)
 else:
     BEDROCK_KNOWLEDGEBASE = None
 LLM_MAX_TOKENS = os.getenv("LLM_MAX_TOKENS")
@@ -101,3 +219,12 @@ DYNAMODB_WRITES_TABLE = os.getenv("DYNAMODB_WRITES_TABLE", "checkpoint_writes")
 DYNAMODB_REGION = os.getenv("DYNAMODB_REGION", AWS_REGION)
 DYNAMODB_CONVERSATION_TABLE = os.getenv("DYNAMODB_CONVERSATION_TABLE", "conversations")
 DYNAMODB_MESSAGE_TABLE = os.getenv("DYNAMODB_MESSAGE_TABLE", "messages")
+DYNAMODB_MAX_POOL_CONNECTIONS = int(os.getenv("DYNAMODB_MAX_POOL_CONNECTIONS", "50"))
+
+# Shared botocore config for DynamoDB clients: keep connections alive and pooled
+# so each PutItem reuses an open TLS connection instead of a fresh handshake
+DYNAMODB_CLIENT_CONFIG = BotocoreConfig(
+    max_pool_connections=DYNAMODB_MAX_POOL_CONNECTIONS,
+    retries={"mode": "adaptive"},
+    tcp_keepalive=True,
+)
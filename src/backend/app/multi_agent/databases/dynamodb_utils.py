@@ -6,7 +6,14 @@ import os
 from datetime import datetime
 from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.base import CheckpointMetadata
-from app.multi_agent.config import AWS_REGION, AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_SESSION_TOKEN, VERIFY_HTTPS
+from app.multi_agent.config import (
+    AWS_REGION,
+    AWS_ACCESS_KEY_ID,
+    AWS_SECRET_ACCESS_KEY,
+    AWS_SESSION_TOKEN,
+    VERIFY_HTTPS,
+    DYNAMODB_CLIENT_CONFIG,
+)
 
 _dynamodb_client = None
 _dynamodb_resource = None
@@ -23,7 +30,8 @@ def get_dynamodb_client():
         # Simple configuration with SSL verification disabled
         client_kwargs = {
             "region_name": AWS_REGION,
-            "verify": False  # Disable SSL verification completely
+            "verify": False,  # Disable SSL verification completely
+            "config": DYNAMODB_CLIENT_CONFIG,
         }
         
         # Add credentials if available
@@ -52,7 +60,8 @@ def get_dynamodb_resource():
         # Simple configuration with SSL verification disabled
         resource_kwargs = {
             "region_name": AWS_REGION,
-            "verify": False  # Disable SSL verification completely
+            "verify": False,  # Disable SSL verification completely
+            "config": DYNAMODB_CLIENT_CONFIG,
         }
         
         # Add credentials if available
@@ -189,22 +189,21 @@ class DocumentChunkingHelper:
             return await self._process_sequential(chunks, bedrock_service, summary_type, language)
     
     async def _process_parallel(self, chunks, bedrock_service, summary_type, language, max_parallel):
-        """Parallel processing with semaphore"""
+        """Parallel processing as one batch capped at max_parallel in-flight calls"""
         logger.info("⚡ Parallel processing")
-        semaphore = asyncio.Semaphore(max_parallel)
+        prompts = [self._create_chunk_prompt(chunk, summary_type, language) for chunk in chunks]
+        responses = await bedrock_service.ai_abatch(prompts, max_concurrency=max_parallel)
         
-        async def process_chunk(chunk):
-            async with semaphore:
-                try:
-                    prompt = self._create_chunk_prompt(chunk, summary_type, language)
-                    response = await bedrock_service.ai_ainvoke(prompt)
-                    return self._extract_response_text(response)
-                except Exception as e:
-                    logger.error(f"❌ Chunk {chunk.chunk_id} failed: {e}")
-                    return f"[Lỗi chunk {chunk.chunk_id}: {str(e)}]"
-        
-        tasks = [process_chunk(chunk) for chunk in chunks]
-        return await asyncio.gather(*tasks, return_exceptions=False)
+        results = []
+        for chunk, response in zip(chunks, responses):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                results.append(self._extract_response_text(response))
+            except Exception as e:
+                logger.error(f"❌ Chunk {chunk.chunk_id} failed: {e}")
+                results.append(f"[Lỗi chunk {chunk.chunk_id}: {str(e)}]")
+        return results
     
     async def _process_sequential(self, chunks, bedrock_service, summary_type, language):
         """Sequential processing with rate limiting"""
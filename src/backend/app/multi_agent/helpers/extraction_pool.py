@@ -0,0 +1,121 @@
+"""
+Process pool for CPU-bound PDF/OCR text extraction.
+
+PyPDF2 parsing and Tesseract OCR hold the GIL for most of their runtime, so
+running them on the event loop (or a thread) stalls every other request.
+The worker functions below are top-level so they can be pickled, and each
+worker process keeps its own extractor instances across calls.
+"""
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+from app.multi_agent.config import (
+    EXTRACTOR_POOL_WORKERS,
+    PDF_MAX_INFLIGHT_BATCHES,
+    PDF_PAGE_BATCH_SIZE
+)
+
+logger = logging.getLogger(__name__)
+
+_POOL: Optional[ProcessPoolExecutor] = None
+
+# Per-process singletons, created lazily inside each worker
+_PDF_EXTRACTOR = None
+_OCR = None
+
+
+def _pdf_extractor():
+    global _PDF_EXTRACTOR
+    if _PDF_EXTRACTOR is None:
+        from app.multi_agent.helpers.improved_pdf_extractor import ImprovedPDFExtractor
+        _PDF_EXTRACTOR = ImprovedPDFExtractor()
+    return _PDF_EXTRACTOR
+
+
+def extract_pdf(file_bytes: bytes, max_pages: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Run ImprovedPDFExtractor (text layer with OCR fallback) and return its full
+    result dict (text, source, method, ...). Runs in a worker process.
+    """
+    return _pdf_extractor().extract_text_from_pdf(file_bytes, max_pages=max_pages)
+
+
+def extract_pdf_page_range(file_bytes: bytes, start: int, stop: int) -> str:
+    """Text layer of pages [start, stop). Runs in a worker process."""
+    return _pdf_extractor().extract_page_range(file_bytes, start, stop)
+
+
+async def extract_pdf_async(file_bytes: bytes, max_pages: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Extract a PDF in the pool. PDFs spanning more than one page batch have their
+    text layer decoded batch-by-batch across workers (at most PDF_MAX_INFLIGHT_BATCHES
+    at once) and reassembled in page order; if that yields no usable text the
+    whole file goes through extract_pdf, which includes the OCR fallback.
+    """
+    loop = asyncio.get_running_loop()
+    pool = get_extractor_pool()
+    extractor = _pdf_extractor()
+    
+    try:
+        page_count = await asyncio.to_thread(extractor.count_pages, file_bytes)
+    except Exception as e:
+        # Malformed PDFs: extract_pdf has its own recovery (including OCR)
+        logger.warning("Could not count PDF pages, extracting in one call: %s", e)
+        page_count = 0
+    if max_pages:
+        page_count = min(page_count, max_pages)
+    
+    if EXTRACTOR_POOL_WORKERS > 1 and page_count > PDF_PAGE_BATCH_SIZE:
+        inflight = asyncio.Semaphore(PDF_MAX_INFLIGHT_BATCHES)
+        
+        async def run_batch(start: int) -> str:
+            async with inflight:
+                return await loop.run_in_executor(
+                    pool, extract_pdf_page_range, file_bytes, start, min(start + PDF_PAGE_BATCH_SIZE, page_count)
+                )
+        
+        try:
+            batches = await asyncio.gather(*(run_batch(start) for start in range(0, page_count, PDF_PAGE_BATCH_SIZE)))
+            result = await asyncio.to_thread(extractor.build_text_result, "".join(batches), max_pages)
+        except Exception as e:
+            logger.warning("Parallel PDF batch extraction failed, extracting in one call: %s", e)
+            result = None
+        if result is not None:
+            logger.info("PDF text extracted in %s parallel batches (%s pages)", len(batches), page_count)
+            return result
+    
+    return await loop.run_in_executor(pool, extract_pdf, file_bytes, max_pages)
+
+
+def extract_pdf_text(file_bytes: bytes) -> str:
+    """Extract text from a PDF (text layer with OCR fallback). Runs in a worker process."""
+    return extract_pdf(file_bytes).get('text', '').strip()
+
+
+def extract_ocr_text(file_bytes: bytes) -> str:
+    """Run lightweight OCR over a document. Runs in a worker process."""
+    global _OCR
+    if _OCR is None:
+        from app.multi_agent.helpers.lightweight_ocr import LightweightOCR
+        _OCR = LightweightOCR()
+    result = _OCR.extract_text_from_pdf(file_bytes)
+    return result.get('text', '').strip() if isinstance(result, dict) else ''
+
+
+def get_extractor_pool() -> ProcessPoolExecutor:
+    """Return the shared extraction pool, creating it on first use."""
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=EXTRACTOR_POOL_WORKERS)
+        logger.info("Extractor process pool started with %s workers", EXTRACTOR_POOL_WORKERS)
+    return _POOL
+
+
+def shutdown_extractor_pool() -> None:
+    """Stop the extraction pool, if it was started."""
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(cancel_futures=True)
+        _POOL = None
@@ -74,6 +74,35 @@ class ImprovedPDFExtractor:
         # If all methods failed, raise detailed error
         raise ValueError(self._generate_error_message(file_content))
     
+    def count_pages(self, file_content: bytes) -> int:
+        """Number of pages in the PDF"""
+        return len(self._create_pdf_reader(file_content, strict=False).pages)
+    
+    def extract_page_range(self, file_content: bytes, start: int, stop: int) -> str:
+        """
+        Text layer of pages [start, stop), one line break per page, skipping pages
+        that fail to decode. Used to split large PDFs across worker processes.
+        """
+        pdf_reader = self._create_pdf_reader(file_content, strict=False)
+        text, _ = self._extract_pages_with_stats(pdf_reader.pages[start:stop], apply_max_pages=False)
+        return text
+    
+    def build_text_result(self, text: str, max_pages: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Wrap text-layer output in the extract_text_from_pdf result shape, or return
+        None when it is not meaningful text (e.g. a scanned PDF that needs OCR)
+        """
+        if not self._is_valid_text(text):
+            return None
+        cleaned_text = self._clean_extracted_text(text)
+        return {
+            'text': cleaned_text,
+            'source': 'pypdf2',
+            'method': 'PyPDF2 parallel page extraction',
+            'pages_processed': max_pages or 'all',
+            'char_count': len(cleaned_text)
+        }
+    
     def _try_ocr_extraction(self, file_content: bytes) -> str:
         """Try OCR extraction for scanned PDFs with optimized flow"""
         max_pages_info = f" (max {self.max_pages} pages)" if self.max_pages else " (all pages)"
@@ -219,11 +248,11 @@ Gợi ý giải pháp:
                 continue
         return text
     
-    def _extract_pages_with_stats(self, pages) -> Tuple[str, int]:
+    def _extract_pages_with_stats(self, pages, apply_max_pages: bool = True) -> Tuple[str, int]:
         """Extract text from pages and return statistics"""
         text = ""
         successful_pages = 0
-        max_pages = getattr(self, 'max_pages', None)
+        max_pages = getattr(self, 'max_pages', None) if apply_max_pages else None
         pages_to_process = pages[:max_pages] if max_pages else pages
         
         for page_num, page in enumerate(pages_to_process):
@@ -6,10 +6,9 @@ import logging
 from typing import Dict, Any, List, Optional
 from io import BytesIO
 import PyPDF2
-import boto3
 from botocore.exceptions import ClientError
 
-from app.multi_agent.helpers.s3_config import get_s3_config
+from app.multi_agent.helpers.s3_config import get_s3_client, get_s3_config
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +25,7 @@ class PDFS3Reader:
         """
         self.s3_config = get_s3_config()
         self.region_name = region_name or self.s3_config.region_name
-        self.s3_client = boto3.client('s3', region_name=self.region_name)
+        self.s3_client = get_s3_client(self.region_name)
     
     def download_pdf_from_s3(self, bucket_name: str, file_key: str) -> bytes:
         """
@@ -3,8 +3,13 @@ S3 Configuration Helper
 Simplified configuration for S3 operations using IAM roles or default credentials
 """
 
+from functools import lru_cache
 from typing import Optional
 from dataclasses import dataclass
+
+import boto3
+from botocore.config import Config as BotocoreConfig
+
 from app.multi_agent.config import (
     AWS_REGION,
     EXTRACTED_CONTENT_BUCKET
@@ -43,3 +48,20 @@ def get_s3_config() -> S3Config:
         S3Config instance
     """
     return S3Config.from_env()
+
+
+@lru_cache(maxsize=None)
+def get_s3_client(region_name: str):
+    """
+    Get the process-wide S3 client for a region
+
+    Loaders and readers are created per request; sharing one client keeps its
+    connection pool (and TLS sessions) alive across them.
+
+    Args:
+        region_name: AWS region name
+
+    Returns:
+        boto3 S3 client
+    """
+    return boto3.client('s3', region_name=region_name, config=BotocoreConfig(tcp_keepalive=True))
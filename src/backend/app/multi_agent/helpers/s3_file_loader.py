@@ -6,12 +6,13 @@ Simplified functions to load PDF and CSV files from AWS S3 bucket using IAM role
 import io
 import logging
 from typing import Optional, Dict, Any, List
-import boto3
 import pandas as pd
 from botocore.exceptions import ClientError, NoCredentialsError
 import PyPDF2
 from io import BytesIO
 
+from app.multi_agent.helpers.s3_config import get_s3_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,7 +27,7 @@ class S3FileLoader:
             region_name: AWS region name
         """
         try:
-            self.s3_client = boto3.client('s3', region_name=region_name)
+            self.s3_client = get_s3_client(region_name)
             self.region_name = region_name
         except NoCredentialsError:
             logger.error("AWS credentials not found. Please configure IAM role or AWS credentials.")
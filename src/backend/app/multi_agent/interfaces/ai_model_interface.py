@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
+from typing import Optional, Union
 
 
 class AIModelInterface(ABC):
     @abstractmethod
-    def user_prompt_with_image(self, prompt_text: str, image_base64: str) -> dict:
+    def user_prompt_with_image(self, prompt_text: str, image: Union[bytes, str]) -> dict:
         pass
 
     @abstractmethod
@@ -11,9 +12,13 @@ class AIModelInterface(ABC):
         pass
 
     @abstractmethod
-    def ai_astream(self, prompt):
+    def ai_astream(self, prompt, max_tokens: Optional[int] = None):
         pass
 
     @abstractmethod
     async def ai_ainvoke(self, prompt) -> str:
         pass
+
+    @abstractmethod
+    async def ai_abatch(self, prompts, max_concurrency: int = 10) -> list:
+        pass
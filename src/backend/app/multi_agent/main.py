@@ -13,6 +13,7 @@ This is the refactored main FastAPI application with improved:
 import warnings
 import logging
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import Dict, Any
 
@@ -21,17 +22,27 @@ warnings.filterwarnings("ignore", category=UserWarning, module="pydantic._intern
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi_pagination import add_pagination
 import uvicorn
 
 # Import custom modules
 from app.multi_agent.middleware.custom_middleware import CustomMiddleware
-from app.multi_agent.routes.v1_routes import router as v1_router
+from app.multi_agent.middleware.compression import CompressionMiddleware
+from app.multi_agent.routes.v1_routes import build_router as build_v1_router
 from app.multi_agent.routes.v1_public_routes import router as v1_public_routes
 from app.multi_agent.databases.dynamodb import initiate_dynamodb
 from app.multi_agent.models.message_dynamodb import MessageDynamoDB
-from app.multi_agent.config import AWS_REGION, DEFAULT_MODEL_NAME
+from app.multi_agent.config import (
+    AWS_REGION,
+    BLOCKING_IO_THREADS,
+    DEFAULT_MODEL_NAME,
+    GZIP_COMPRESS_LEVEL,
+    GZIP_MINIMUM_SIZE,
+)
+from app.multi_agent.helpers.extraction_pool import get_extractor_pool, shutdown_extractor_pool
+from app.multi_agent.clients import keep_probe_connections_warm
+from app.multi_agent.services.text_service import TextSummaryService
 
 # Import Strands Agent routes
 try:
@@ -61,12 +72,23 @@ logger = logging.getLogger(__name__)
 # Get application settings
 # settings = get_settings()  # Commented out since get_settings doesn't exist
 
+# Background task keeping the health-probe AWS connections open
+_keep_warm_task = None
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager for startup and shutdown events"""
     # Startup
     logger.info("🚀 Starting VPBank K-MULT Agent Studio...")
     
+    # Size the to_thread pool for I/O-bound boto3 calls rather than CPU count
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=BLOCKING_IO_THREADS, thread_name_prefix="blocking-io")
+    )
+    
+    # One TextSummaryService shared by all requests (see get_text_service)
+    app.state.text_service = TextSummaryService()
+    
     try:
         # Initialize DynamoDB
         await initiate_dynamodb()
@@ -96,12 +118,16 @@ async def initialize_services():
     """Initialize all application services"""
     # Add any service initialization here
     # For example: AI model loading, cache warming, etc.
-    pass
+    global _keep_warm_task
+    get_extractor_pool()
+    _keep_warm_task = asyncio.create_task(keep_probe_connections_warm())
 
 async def cleanup_services():
     """Cleanup services on shutdown"""
     # Add cleanup logic here
-    pass
+    if _keep_warm_task is not None:
+        _keep_warm_task.cancel()
+    shutdown_extractor_pool()
 
 # Create FastAPI application with lifespan
 app = FastAPI(
@@ -146,6 +172,7 @@ app = FastAPI(
         "name": "Multi-Agent Hackathon 2025 - Group 181",
     },
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json"
@@ -172,6 +199,11 @@ app.add_middleware(
     allow_headers=["Content-Type", "Authorization", "X-Request-ID"],
 )
 
+# Compress large JSON payloads (summaries, document info); SSE streams pass through uncompressed.
+# Registered before CustomMiddleware so it sits inside it: BaseHTTPMiddleware re-sends
+# every body as a stream, which would bypass minimum_size
+app.add_middleware(CompressionMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=GZIP_COMPRESS_LEVEL)
+
 # Custom middleware
 app.add_middleware(CustomMiddleware)
 
@@ -235,7 +267,7 @@ app.include_router(
 )
 
 app.include_router(
-    v1_router, 
+    build_v1_router(), 
     prefix="/mutil_agent/api", 
     tags=["Private APIs"]
 )
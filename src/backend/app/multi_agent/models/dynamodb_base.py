@@ -13,6 +13,7 @@ from app.multi_agent.config import (
     AWS_REGION,
     AWS_ACCESS_KEY_ID,
     AWS_SECRET_ACCESS_KEY,
+    DYNAMODB_CLIENT_CONFIG,
 )
 
 
@@ -53,6 +54,7 @@ class DynamoDBModel(BaseModel):
                 "aws_access_key_id": AWS_ACCESS_KEY_ID,
                 "aws_secret_access_key": AWS_SECRET_ACCESS_KEY,
                 "verify": VERIFY_HTTPS,  # Use SSL verification setting from config
+                "config": DYNAMODB_CLIENT_CONFIG,  # Pooled keep-alive connections
             }
             
             # Add session token if available
@@ -74,6 +76,7 @@ class DynamoDBModel(BaseModel):
                 "aws_access_key_id": AWS_ACCESS_KEY_ID,
                 "aws_secret_access_key": AWS_SECRET_ACCESS_KEY,
                 "verify": VERIFY_HTTPS,  # Use SSL verification setting from config
+                "config": DYNAMODB_CLIENT_CONFIG,  # Pooled keep-alive connections
             }
             
             # Add session token if available
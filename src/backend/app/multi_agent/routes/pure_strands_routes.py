@@ -6,9 +6,10 @@ Single endpoint handles both file and non-file requests
 from fastapi import APIRouter, File, UploadFile, Form, HTTPException
 from typing import Optional, Union
 import logging
-import json
 from datetime import datetime
 
+import orjson
+
 # Import Pure Strands system
 from app.multi_agent.agents.pure_strands_vpbank_system import (
     process_pure_strands_request
@@ -96,9 +97,9 @@ async def process_request(
         parsed_context = {}
         if context:
             try:
-                parsed_context = json.loads(context)
+                parsed_context = orjson.loads(context)
                 logger.info(f"[UNIFIED_ENDPOINT] Context parsed: {len(parsed_context)} keys")
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.warning(f"[UNIFIED_ENDPOINT] Context parse error: {e}")
                 parsed_context = {"raw_context": context}
         
@@ -1,10 +1,20 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 import logging
 import time
 import uuid
 
+import orjson
+
+from app.multi_agent.utils.http_cache import (
+    cache_headers,
+    compute_etag,
+    etag_matches,
+    not_modified,
+)
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -34,33 +44,125 @@ class AgentListResponse(BaseModel):
     active_agents: int
     agents: List[Dict[str, Any]]
 
+# Static agent registry - single source of truth for agent ids
+_AGENTS_LIST = [
+    {
+        "agent_id": "supervisor",
+        "name": "Supervisor Agent",
+        "status": "active",
+        "current_task": None,
+        "load_percentage": 15.5,
+        "last_activity": "2025-07-19T16:45:00Z",
+        "capabilities": ["workflow_orchestration", "task_distribution", "coordination"],
+        "description": "Orchestrates workflow and coordinates other agents"
+    },
+    {
+        "agent_id": "document-intelligence",
+        "name": "Document Intelligence Agent",
+        "status": "active",
+        "current_task": "ocr_processing",
+        "load_percentage": 45.2,
+        "last_activity": "2025-07-19T16:50:00Z",
+        "capabilities": ["ocr", "text_extraction", "vietnamese_nlp", "document_classification"],
+        "description": "Advanced OCR with deep Vietnamese NLP capabilities"
+    },
+    {
+        "agent_id": "risk-assessment",
+        "name": "Risk Assessment Agent",
+        "status": "active",
+        "current_task": None,
+        "load_percentage": 22.8,
+        "last_activity": "2025-07-19T16:48:00Z",
+        "capabilities": ["credit_scoring", "financial_analysis", "risk_prediction"],
+        "description": "Automated financial analysis and predictive risk modeling"
+    },
+    {
+        "agent_id": "compliance-validation",
+        "name": "Compliance Validation Agent",
+        "status": "active",
+        "current_task": "regulation_check",
+        "load_percentage": 33.1,
+        "last_activity": "2025-07-19T16:49:00Z",
+        "capabilities": ["ucp600_validation", "isbp821_validation", "sbv_compliance"],
+        "description": "Validates against banking regulations (UCP 600, ISBP 821, SBV)"
+    },
+    {
+        "agent_id": "decision-synthesis",
+        "name": "Decision Synthesis Agent",
+        "status": "active",
+        "current_task": None,
+        "load_percentage": 18.7,
+        "last_activity": "2025-07-19T16:47:00Z",
+        "capabilities": ["evidence_analysis", "recommendation_generation", "confidence_scoring"],
+        "description": "Generates evidence-based recommendations with confidence scores"
+    },
+    {
+        "agent_id": "process-automation",
+        "name": "Process Automation Agent",
+        "status": "active",
+        "current_task": "workflow_execution",
+        "load_percentage": 28.4,
+        "last_activity": "2025-07-19T16:51:00Z",
+        "capabilities": ["lc_processing", "credit_proposals", "document_routing"],
+        "description": "End-to-end workflow automation and system integration"
+    }
+]
+
+_AGENT_INDEX = {agent["agent_id"]: agent for agent in _AGENTS_LIST}
+_VALID_AGENT_IDS = frozenset(_AGENT_INDEX)
+
+# The registry is static, so the list response is built once at import
+_LIST_RESPONSE = AgentListResponse(
+    total_agents=len(_AGENTS_LIST),
+    active_agents=sum(1 for a in _AGENTS_LIST if a["status"] == "active"),
+    agents=_AGENTS_LIST
+)
+_LIST_BYTES = orjson.dumps(_LIST_RESPONSE.model_dump())
+_LIST_ETAG = compute_etag(_LIST_BYTES)
+_LIST_HEADERS = cache_headers(_LIST_ETAG)
+
+_HEALTH_BODY = {
+    "status": "healthy",
+    "service": "multi_agent_coordination",
+    "version": "1.0.0",
+    "features": {
+        "agent_coordination": True,
+        "task_distribution": True,
+        "workflow_management": True,
+        "real_time_monitoring": True
+    },
+    "agents": {
+        "supervisor_agent": "active",
+        "document_intelligence_agent": "active",
+        "risk_assessment_agent": "active",
+        "compliance_validation_agent": "active",
+        "decision_synthesis_agent": "active",
+        "process_automation_agent": "active"
+    },
+    "total_agents": 6,
+    "active_agents": 6,
+    "coordination_engine": "langchain"
+}
+# Weak ETag: the body only differs from the cached copy by its timestamp
+_HEALTH_ETAG = compute_etag(_HEALTH_BODY, weak=True)
+_HEALTH_HEADERS = cache_headers(_HEALTH_ETAG)
+
+
+def _agent_list_response(request: Request) -> Response:
+    if etag_matches(request, _LIST_ETAG):
+        return not_modified(_LIST_ETAG)
+    return Response(content=_LIST_BYTES, media_type="application/json", headers=_LIST_HEADERS)
+
 # Health check endpoint
 @router.get("/health")
-async def agents_health_check():
+async def agents_health_check(request: Request):
     """Health check for multi-agent coordination service"""
-    return {
-        "status": "healthy",
-        "service": "multi_agent_coordination",
-        "timestamp": int(time.time()),
-        "version": "1.0.0",
-        "features": {
-            "agent_coordination": True,
-            "task_distribution": True,
-            "workflow_management": True,
-            "real_time_monitoring": True
-        },
-        "agents": {
-            "supervisor_agent": "active",
-            "document_intelligence_agent": "active",
-            "risk_assessment_agent": "active",
-            "compliance_validation_agent": "active",
-            "decision_synthesis_agent": "active",
-            "process_automation_agent": "active"
-        },
-        "total_agents": 6,
-        "active_agents": 6,
-        "coordination_engine": "langchain"
-    }
+    if etag_matches(request, _HEALTH_ETAG):
+        return not_modified(_HEALTH_ETAG)
+    return ORJSONResponse(
+        {**_HEALTH_BODY, "timestamp": int(time.time())},
+        headers=_HEALTH_HEADERS
+    )
 
 @router.post("/coordinate", response_model=AgentCoordinationResponse)
 async def coordinate_agents(request: AgentCoordinationRequest):
@@ -112,82 +214,22 @@ async def coordinate_agents(request: AgentCoordinationRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/status", response_model=AgentListResponse)
-async def get_agents_status():
+async def get_agents_status(request: Request):
     """Get status of all agents in the system"""
-    try:
-        agents = [
-            {
-                "agent_id": "supervisor",
-                "name": "Supervisor Agent",
-                "status": "active",
-                "current_task": None,
-                "load_percentage": 15.5,
-                "last_activity": "2025-07-19T16:45:00Z",
-                "capabilities": ["workflow_orchestration", "task_distribution", "coordination"],
-                "description": "Orchestrates workflow and coordinates other agents"
-            },
-            {
-                "agent_id": "document-intelligence",
-                "name": "Document Intelligence Agent",
-                "status": "active",
-                "current_task": "ocr_processing",
-                "load_percentage": 45.2,
-                "last_activity": "2025-07-19T16:50:00Z",
-                "capabilities": ["ocr", "text_extraction", "vietnamese_nlp", "document_classification"],
-                "description": "Advanced OCR with deep Vietnamese NLP capabilities"
-            },
-            {
-                "agent_id": "risk-assessment",
-                "name": "Risk Assessment Agent",
-                "status": "active",
-                "current_task": None,
-                "load_percentage": 22.8,
-                "last_activity": "2025-07-19T16:48:00Z",
-                "capabilities": ["credit_scoring", "financial_analysis", "risk_prediction"],
-                "description": "Automated financial analysis and predictive risk modeling"
-            },
-            {
-                "agent_id": "compliance-validation",
-                "name": "Compliance Validation Agent",
-                "status": "active",
-                "current_task": "regulation_check",
-                "load_percentage": 33.1,
-                "last_activity": "2025-07-19T16:49:00Z",
-                "capabilities": ["ucp600_validation", "isbp821_validation", "sbv_compliance"],
-                "description": "Validates against banking regulations (UCP 600, ISBP 821, SBV)"
-            },
-            {
-                "agent_id": "decision-synthesis",
-                "name": "Decision Synthesis Agent",
-                "status": "active",
-                "current_task": None,
-                "load_percentage": 18.7,
-                "last_activity": "2025-07-19T16:47:00Z",
-                "capabilities": ["evidence_analysis", "recommendation_generation", "confidence_scoring"],
-                "description": "Generates evidence-based recommendations with confidence scores"
-            },
-            {
-                "agent_id": "process-automation",
-                "name": "Process Automation Agent",
-                "status": "active",
-                "current_task": "workflow_execution",
-                "load_percentage": 28.4,
-                "last_activity": "2025-07-19T16:51:00Z",
-                "capabilities": ["lc_processing", "credit_proposals", "document_routing"],
-                "description": "End-to-end workflow automation and system integration"
-            }
-        ]
-        
-        active_agents = len([a for a in agents if a["status"] == "active"])
-        
-        return AgentListResponse(
-            total_agents=len(agents),
-            active_agents=active_agents,
-            agents=agents
-        )
-    except Exception as e:
-        logger.error(f"Error getting agent status: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return _agent_list_response(request)
+
+@router.get("/status/stream")
+async def stream_agents_status():
+    """
+    Stream agent status as NDJSON, one agent per line.
+    Constant memory per request regardless of fleet size; registered before
+    /status/{agent_id} so "stream" is not treated as an agent id.
+    """
+    async def generate():
+        for agent in _AGENTS_LIST:
+            yield orjson.dumps(agent) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 @router.get("/status/{agent_id}", response_model=AgentStatusResponse)
 async def get_agent_status(agent_id: str):
@@ -230,10 +272,7 @@ async def assign_task_to_agent(
     """Assign a specific task to a specific agent"""
     try:
         # Validate agent exists
-        valid_agents = ["supervisor", "document-intelligence", "risk-assessment", 
-                       "compliance-validation", "decision-synthesis", "process-automation"]
-        
-        if agent_id not in valid_agents:
+        if agent_id not in _VALID_AGENT_IDS:
             raise HTTPException(status_code=404, detail=f"Agent {agent_id} not found")
         
         # Generate task assignment
@@ -254,6 +293,6 @@ async def assign_task_to_agent(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/list", response_model=AgentListResponse)
-async def list_agents():
+async def list_agents(request: Request):
     """List all available agents with their capabilities"""
-    return await get_agents_status()
+    return _agent_list_response(request)
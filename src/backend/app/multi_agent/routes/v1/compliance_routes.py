@@ -1,31 +1,92 @@
+import hashlib
 import json
 import logging
-import os
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Body
-from fastapi.responses import JSONResponse
+from typing import Annotated, Optional, Dict, Any, List
 
+import orjson
+from pydantic import BaseModel, Field, StringConstraints
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Body, Request
+from fastapi.responses import ORJSONResponse, Response
+
+from app.multi_agent.config import BEDROCK_MAX_CONCURRENCY, BEDROCK_QUEUE_TIMEOUT
 from app.multi_agent.schemas.base import ResponseStatus
 from app.multi_agent.services.compliance_service import ComplianceValidationService
-from app.multi_agent.services.compliance_config import ComplianceConfig
+from app.multi_agent.services.compliance_config import DOCUMENT_TYPE_DEFINITIONS
+from app.multi_agent.services.text_service import TextSummaryService, get_text_service
+from app.multi_agent.utils.http_cache import (
+    cache_headers,
+    compute_etag,
+    etag_matches,
+    not_modified,
+)
+from app.multi_agent.utils.concurrency import ConcurrencyLimiter
+from app.multi_agent.utils.singleflight import SingleFlight
+from app.multi_agent.utils.uploads import get_file_extension
 
 router = APIRouter()
 
-# Initialize logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the application entrypoint
 logger = logging.getLogger(__name__)
 
+# Accepted upload formats, built once for O(1) membership checks
+_ALLOWED_EXT = frozenset({'.txt', '.pdf', '.docx', '.doc', '.csv'})
+_ALLOWED_EXT_STR = ', '.join(sorted(_ALLOWED_EXT))
+
+# Document type definitions are static config: serialize the /types payload
+# once at import so the handler does no per-request object construction
+_TYPES_BYTES = orjson.dumps({
+    "status": ResponseStatus.SUCCESS,
+    "data": {
+        "supported_types": dict(DOCUMENT_TYPE_DEFINITIONS),
+        "total_types": len(DOCUMENT_TYPE_DEFINITIONS)
+    },
+    "message": "Danh sách loại tài liệu được hỗ trợ"
+})
+_TYPES_ETAG = compute_etag(_TYPES_BYTES)
+_TYPES_HEADERS = cache_headers(_TYPES_ETAG, max_age=3600)
+
+# Concurrent /validate calls for the same document share one Bedrock round trip
+_VALIDATION_FLIGHTS = SingleFlight()
+
+# Caps in-flight Bedrock/KB work so bursts queue here instead of tripping
+# Bedrock throttling; waits longer than the queue timeout are shed with 503
+_BEDROCK_LIMITER = ConcurrencyLimiter(BEDROCK_MAX_CONCURRENCY, BEDROCK_QUEUE_TIMEOUT)
+
+
+def _validation_key(text: str, document_type: Optional[str]) -> bytes:
+    digest = hashlib.sha256(text.encode("utf-8"))
+    digest.update(b"\0" + (document_type or "").encode("utf-8"))
+    return digest.digest()
+
+
+async def _validate_limited(text: str, document_type: Optional[str]) -> Dict[str, Any]:
+    async with _BEDROCK_LIMITER.slot():
+        return await ComplianceValidationService().validate_document_compliance(
+            ocr_text=text,
+            document_type=document_type
+        )
+
 
 class ComplianceValidationRequest(BaseModel):
     """Request model for compliance validation - simplified for UCP 600 focus"""
-    text: str = Field(..., description="Document text (from OCR or direct input)")
+    text: Annotated[str, StringConstraints(strip_whitespace=True, min_length=50)] = Field(
+        ..., description="Document text (from OCR or direct input)"
+    )
     document_type: Optional[str] = Field(None, description="Document type (auto-detected if not provided)")
 
 
+class ComplianceBatchValidationRequest(BaseModel):
+    """Request model for validating several documents at once"""
+    documents: List[ComplianceValidationRequest] = Field(
+        ..., min_length=1, max_length=50, description="Documents to validate"
+    )
+
+
 class UCPQueryRequest(BaseModel):
     """Request model for UCP 600 knowledge base queries"""
-    query: str = Field(..., description="Question about UCP 600 regulations")
+    query: Annotated[str, StringConstraints(strip_whitespace=True, min_length=5)] = Field(
+        ..., description="Question about UCP 600 regulations"
+    )
 
 
 @router.post("/validate", response_model=dict)
@@ -40,26 +101,16 @@ async def validate_document_compliance(request: ComplianceValidationRequest = Bo
         JSON response with compliance validation results
     """
     try:
-        # Validate input text
-        if not request.text or len(request.text.strip()) < 50:
-            raise HTTPException(
-                status_code=400,
-                detail="Văn bản quá ngắn để kiểm tra tuân thủ (tối thiểu 50 ký tự)"
-            )
-        
-        # Initialize compliance service
-        compliance_service = ComplianceValidationService()
-        
-        # Perform compliance validation
-        validation_result = await compliance_service.validate_document_compliance(
-            ocr_text=request.text,
-            document_type=request.document_type
+        # Perform compliance validation, coalescing identical in-flight requests
+        validation_result = await _VALIDATION_FLIGHTS.do(
+            _validation_key(request.text, request.document_type),
+            lambda: _validate_limited(request.text, request.document_type)
         )
         
         # Log result for debugging
-        logger.info(f"Compliance validation completed: {validation_result.get('compliance_status')}")
+        logger.info("Compliance validation completed: %s", validation_result.get("compliance_status"))
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "status": ResponseStatus.SUCCESS,
@@ -71,8 +122,56 @@ async def validate_document_compliance(request: ComplianceValidationRequest = Bo
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in compliance validation: {str(e)}")
-        return JSONResponse(
+        logger.error("Error in compliance validation: %s", e)
+        return ORJSONResponse(
+            status_code=500,
+            content={
+                "status": ResponseStatus.ERROR,
+                "message": f"Lỗi khi kiểm tra tuân thủ: {str(e)}"
+            }
+        )
+
+
+@router.post("/validate/batch", response_model=dict)
+async def validate_documents_compliance_batch(request: ComplianceBatchValidationRequest = Body(...)):
+    """
+    Validate several documents against UCP 600 regulations
+    
+    Trade documents share knowledge base lookups and are checked several per
+    Bedrock call; results are returned in request order. Each of those calls
+    takes its own Bedrock limiter slot.
+    
+    Args:
+        request: ComplianceBatchValidationRequest with the documents' text
+        
+    Returns:
+        JSON response with one compliance validation result per document
+    """
+    try:
+        validation_results = await ComplianceValidationService().validate_documents_batch(
+            [(document.text, document.document_type) for document in request.documents],
+            limiter=_BEDROCK_LIMITER
+        )
+        
+        logger.info("Batch compliance validation completed for %d documents", len(validation_results))
+        
+        return ORJSONResponse(
+            status_code=200,
+            content={
+                "status": ResponseStatus.SUCCESS,
+                "data": {
+                    "results": validation_results,
+                    "total_documents": len(validation_results)
+                },
+                "message": "Kiểm tra tuân thủ hoàn tất"
+            }
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error in batch compliance validation: %s", e)
+        return ORJSONResponse(
             status_code=500,
             content={
                 "status": ResponseStatus.ERROR,
@@ -93,23 +192,17 @@ async def query_ucp_regulations(request: UCPQueryRequest = Body(...)):
         JSON response with regulation information
     """
     try:
-        # Validate query
-        if not request.query or len(request.query.strip()) < 5:
-            raise HTTPException(
-                status_code=400,
-                detail="Câu hỏi quá ngắn (tối thiểu 5 ký tự)"
-            )
-        
         # Initialize compliance service
         compliance_service = ComplianceValidationService()
         
         # Query regulations
-        query_result = await compliance_service.query_regulations_directly(request.query)
+        async with _BEDROCK_LIMITER.slot():
+            query_result = await compliance_service.query_regulations_directly(request.query)
         
         # Log result
-        logger.info(f"UCP query completed: {len(query_result.get('answer', ''))} characters")
+        logger.info("UCP query completed: %d characters", len(query_result.get("answer", "")))
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "status": ResponseStatus.SUCCESS,
@@ -121,8 +214,8 @@ async def query_ucp_regulations(request: UCPQueryRequest = Body(...)):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in UCP query: {str(e)}")
-        return JSONResponse(
+        logger.error("Error in UCP query: %s", e)
+        return ORJSONResponse(
             status_code=500,
             content={
                 "status": ResponseStatus.ERROR,
@@ -134,7 +227,8 @@ async def query_ucp_regulations(request: UCPQueryRequest = Body(...)):
 @router.post("/document", response_model=dict)
 async def validate_document_file(
     file: UploadFile = File(..., description="Document file to validate"),
-    document_type: Optional[str] = Form(None, description="Document type (auto-detected if not provided)")
+    document_type: Optional[str] = Form(None, description="Document type (auto-detected if not provided)"),
+    text_service: TextSummaryService = Depends(get_text_service)
 ):
     """
     Validate document file compliance (PDF, TXT, DOCX)
@@ -163,22 +257,18 @@ async def validate_document_file(
             )
         
         # Check file type
-        allowed_extensions = ['.txt', '.pdf', '.docx', '.doc', '.csv']
-        file_extension = os.path.splitext(file.filename)[1].lower()
+        file_extension = get_file_extension(file.filename)
         
-        if file_extension not in allowed_extensions:
+        if file_extension not in _ALLOWED_EXT:
             raise HTTPException(
                 status_code=400,
-                detail=f"Định dạng file không được hỗ trợ. Chỉ chấp nhận: {', '.join(allowed_extensions)}"
+                detail=f"Định dạng file không được hỗ trợ. Chỉ chấp nhận: {_ALLOWED_EXT_STR}"
             )
         
         # Initialize compliance service
         compliance_service = ComplianceValidationService()
         
         # Extract text from document (reuse text service logic)
-        from app.multi_agent.services.text_service import TextSummaryService
-        text_service = TextSummaryService()
-        
         extracted_text = await text_service.extract_text_from_document(
             file_content=file_content,
             file_extension=file_extension,
@@ -193,10 +283,11 @@ async def validate_document_file(
             )
         
         # Perform compliance validation
-        validation_result = await compliance_service.validate_document_compliance(
-            ocr_text=extracted_text,
-            document_type=document_type
-        )
+        async with _BEDROCK_LIMITER.slot():
+            validation_result = await compliance_service.validate_document_compliance(
+                ocr_text=extracted_text,
+                document_type=document_type
+            )
         
         # Add file info to result
         validation_result["file_info"] = {
@@ -207,9 +298,13 @@ async def validate_document_file(
         }
         
         # Log result
-        logger.info(f"Document file validation completed: {file.filename} - {validation_result.get('compliance_status')}")
+        logger.info(
+            "Document file validation completed: %s - %s",
+            file.filename,
+            validation_result.get("compliance_status"),
+        )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "status": ResponseStatus.SUCCESS,
@@ -221,8 +316,8 @@ async def validate_document_file(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in document file validation: {str(e)}")
-        return JSONResponse(
+        logger.error("Error in document file validation: %s", e)
+        return ORJSONResponse(
             status_code=500,
             content={
                 "status": ResponseStatus.ERROR,
@@ -232,7 +327,7 @@ async def validate_document_file(
 
 
 @router.get("/health", response_model=dict)
-async def health_check():
+async def health_check(request: Request):
     """
     Health check endpoint for compliance service
     """
@@ -246,24 +341,30 @@ async def health_check():
         # Check bedrock service
         bedrock_status = "available" if compliance_service.bedrock_service else "not_configured"
         
-        return JSONResponse(
+        content = {
+            "status": ResponseStatus.SUCCESS,
+            "data": {
+                "service": "compliance_validation",
+                "status": "healthy",
+                "knowledge_base_status": kb_status,
+                "bedrock_status": bedrock_status,
+                "knowledge_base_id": compliance_service.knowledge_base_id
+            },
+            "message": "Compliance service is healthy"
+        }
+        etag = compute_etag(content)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        
+        return ORJSONResponse(
             status_code=200,
-            content={
-                "status": ResponseStatus.SUCCESS,
-                "data": {
-                    "service": "compliance_validation",
-                    "status": "healthy",
-                    "knowledge_base_status": kb_status,
-                    "bedrock_status": bedrock_status,
-                    "knowledge_base_id": compliance_service.knowledge_base_id
-                },
-                "message": "Compliance service is healthy"
-            }
+            content=content,
+            headers=cache_headers(etag)
         )
         
     except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
-        return JSONResponse(
+        logger.error("Health check failed: %s", e)
+        return ORJSONResponse(
             status_code=500,
             content={
                 "status": ResponseStatus.ERROR,
@@ -273,31 +374,11 @@ async def health_check():
 
 
 @router.get("/types", response_model=dict)
-async def get_supported_document_types():
+async def get_supported_document_types(request: Request):
     """
     Get list of supported document types for compliance validation
     """
-    try:
-        document_types = ComplianceConfig.DOCUMENT_TYPE_DEFINITIONS
-        
-        return JSONResponse(
-            status_code=200,
-            content={
-                "status": ResponseStatus.SUCCESS,
-                "data": {
-                    "supported_types": document_types,
-                    "total_types": len(document_types)
-                },
-                "message": "Danh sách loại tài liệu được hỗ trợ"
-            }
-        )
-        
-    except Exception as e:
-        logger.error(f"Error getting document types: {str(e)}")
-        return JSONResponse(
-            status_code=500,
-            content={
-                "status": ResponseStatus.ERROR,
-                "message": f"Lỗi khi lấy danh sách loại tài liệu: {str(e)}"
-            }
-        )
+    if etag_matches(request, _TYPES_ETAG):
+        return not_modified(_TYPES_ETAG, max_age=3600)
+    
+    return Response(content=_TYPES_BYTES, media_type="application/json", headers=_TYPES_HEADERS)
@@ -1,6 +1,7 @@
+import asyncio
 import json
 import logging
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse, JSONResponse
@@ -19,6 +20,34 @@ from app.multi_agent.services.conversation_service import stream_chat
 
 router = APIRouter()
 
+_HUMAN = MessageTypes.HUMAN
+_SYSTEM = MessageTypes.SYSTEM
+
+# Strong references to in-flight background saves so they are not garbage
+# collected before completion (see asyncio.create_task docs).
+_BACKGROUND_TASKS = set()
+
+
+def _log_save_failure(task: asyncio.Task):
+    _BACKGROUND_TASKS.discard(task)
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logging.error(f"[CONVERSATION_ROUTER] - Background message save failed: {exc}")
+
+
+def _save_in_background(message: Message) -> asyncio.Task:
+    """
+    Persist a message without blocking the response. Only for messages nothing
+    reads back during this request (the human turn is awaited: the workflow
+    loads it from the history).
+    """
+    task = asyncio.create_task(message.save())
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_log_save_failure)
+    return task
+
 
 @router.post("/chat", response_model=SuccessResponse)
 async def chat(
@@ -27,11 +56,11 @@ async def chat(
     """
     This endpoint is used to create a new conversation or continue a conversation.
     """
+    conv_uuid = None
     try:
         if request.conversation_id is None:
             # For now, return a simple new conversation ID
             # TODO: Migrate ConversationRepository to DynamoDB if needed
-            from uuid import uuid4
             new_conversation = {
                 "conversation_id": str(uuid4())
             }
@@ -43,11 +72,15 @@ async def chat(
                 content={"status": ResponseStatus.SUCCESS, "data": new_conversation},
             )
 
-        # Save human message to DynamoDB (no session needed)
+        # Parse once; the error path reuses it instead of re-parsing
+        conv_uuid = UUID(request.conversation_id)
+
+        # Save human message to DynamoDB (no session needed). Awaited: the
+        # chat node reads the conversation history, which must include this turn
         message = Message(
-            conversation_id=UUID(request.conversation_id),
+            conversation_id=conv_uuid,
             message=request.message,
-            type=MessageTypes.HUMAN,
+            type=_HUMAN,
         )
         await message.save()
 
@@ -57,7 +90,7 @@ async def chat(
             messages=[request.message],
             node_name="",
             next_node="chat_knowledgebase_node",
-            type=MessageTypes.HUMAN,
+            type=_HUMAN,
         )
         print(
             f"[CONVERSATION_ROUTER] - Initial state for chat: {json.dumps(initial_state.dict())}"
@@ -84,13 +117,15 @@ async def chat(
             f"[CONVERSATION_ROUTER] - Error in chat: {str(e)} - conversation_id: {request.conversation_id}"
         )
         emitted_error = DefaultException(message="ERROR")
-        # Save error message to DynamoDB (no session needed)
-        error_message = Message(
-            conversation_id=UUID(request.conversation_id),
-            message=emitted_error.message,
-            type=MessageTypes.SYSTEM,
-        )
-        await error_message.save()
+        # Save error message to DynamoDB (no session needed). Skip it when the
+        # conversation id itself was invalid - there is nothing to attach it to.
+        if conv_uuid is not None:
+            error_message = Message(
+                conversation_id=conv_uuid,
+                message=emitted_error.message,
+                type=_SYSTEM,
+            )
+            _save_in_background(error_message)
         return JSONResponse(
             status_code=400, content={"status": ResponseStatus.ERROR, "message": str(e)}
         )
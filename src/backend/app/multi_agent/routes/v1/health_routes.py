@@ -4,6 +4,7 @@ Comprehensive health monitoring for all services and agents
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Dict, Any, List
 import asyncio
@@ -11,9 +12,24 @@ import time
 import logging
 from datetime import datetime
 
+from app.multi_agent.clients import (
+    get_bedrock_probe_client,
+    get_dynamodb_probe_client,
+    get_s3_probe_client,
+)
+from app.multi_agent.config import (
+    DEPENDENCY_PROBE_MAX_TTL,
+    DEPENDENCY_PROBE_MIN_TTL,
+    EXTRACTED_CONTENT_BUCKET,
+    HEALTH_CHECK_TIMEOUT,
+    STALE_ON_ERROR,
+)
+from app.multi_agent.utils.probe_cache import CachePolicy, PolicyCache
+from app.multi_agent.utils.response_cache import cached_json_response
+
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 class HealthStatus(BaseModel):
     status: str
@@ -41,11 +57,37 @@ class ComprehensiveHealthResponse(BaseModel):
 # Track service start time
 SERVICE_START_TIME = time.time()
 
+_FEATURES = {
+    "multi_agent_coordination": True,
+    "document_intelligence": True,
+    "risk_assessment": True,
+    "compliance_validation": True,
+    "vietnamese_nlp": True,
+    "text_summarization": True,
+    "lc_processing": True,
+    "credit_assessment": True,
+    "s3_integration": True,
+    "dynamodb_integration": True,
+    "bedrock_integration": True
+}
+
+# Cache TTLs (seconds) for the polled health payloads
+COMPREHENSIVE_HEALTH_TTL = 10
+DETAILED_HEALTH_TTL = 5
+
+# Endpoint reachability changes rarely: reuse probe results, stale-on-error
+_DEPENDENCY_POLICY = CachePolicy(min_ttl=DEPENDENCY_PROBE_MIN_TTL, max_ttl=DEPENDENCY_PROBE_MAX_TTL)
+_PROBE_CACHE = PolicyCache(stale_on_error=STALE_ON_ERROR)
+
 @router.get("/health", response_model=HealthStatus)
 async def comprehensive_health_check():
     """Comprehensive health check for the entire system"""
+    return await cached_json_response("health", COMPREHENSIVE_HEALTH_TTL, _build_comprehensive_health)
+
+async def _build_comprehensive_health() -> HealthStatus:
     try:
-        uptime = time.time() - SERVICE_START_TIME
+        now = time.time()
+        uptime = now - SERVICE_START_TIME
         
         # Check all service dependencies
         dependencies = await check_dependencies()
@@ -53,34 +95,23 @@ async def comprehensive_health_check():
         return HealthStatus(
             status="healthy",
             service="vpbank-kmult-agent-studio",
-            timestamp=int(time.time()),
+            timestamp=int(now),
             version="2.0.0",
             uptime_seconds=uptime,
-            features={
-                "multi_agent_coordination": True,
-                "document_intelligence": True,
-                "risk_assessment": True,
-                "compliance_validation": True,
-                "vietnamese_nlp": True,
-                "text_summarization": True,
-                "lc_processing": True,
-                "credit_assessment": True,
-                "s3_integration": True,
-                "dynamodb_integration": True,
-                "bedrock_integration": True
-            },
+            features=_FEATURES,
             dependencies=dependencies
         )
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         raise HTTPException(status_code=503, detail="Service unhealthy")
 
 @router.get("/health/detailed", response_model=ComprehensiveHealthResponse)
 async def detailed_health_check():
     """Detailed health check with individual service status"""
+    return await cached_json_response("health_detailed", DETAILED_HEALTH_TTL, _build_detailed_health)
+
+async def _build_detailed_health() -> ComprehensiveHealthResponse:
     try:
-        services = []
-        
         # Check each service component
         service_checks = [
             ("document_intelligence", check_document_service),
@@ -93,75 +124,115 @@ async def detailed_health_check():
             ("ai_models", check_ai_models_service)
         ]
         
-        for service_name, check_func in service_checks:
-            start_time = time.time()
-            try:
-                status, details = await check_func()
-                response_time = (time.time() - start_time) * 1000
-                
-                services.append(ServiceHealth(
-                    service_name=service_name,
-                    status=status,
-                    response_time_ms=round(response_time, 2),
-                    last_check=datetime.now().isoformat(),
-                    details=details
-                ))
-            except Exception as e:
-                services.append(ServiceHealth(
-                    service_name=service_name,
-                    status="error",
-                    response_time_ms=0,
-                    last_check=datetime.now().isoformat(),
-                    details={"error": str(e)}
-                ))
+        # One timestamp for the whole request; all checks finish within it
+        now = time.time()
+        now_iso = datetime.fromtimestamp(now).isoformat()
+        
+        # Run all checks concurrently: wall time is the slowest check, not the sum
+        services = list(await asyncio.gather(
+            *(_timed_check(service_name, check_func, now_iso) for service_name, check_func in service_checks)
+        ))
         
         # Check agent status
         agents = await check_agent_status()
         
-        # Overall status
-        overall_status = "healthy" if all(s.status == "healthy" for s in services) else "degraded"
+        # Overall status, from a single pass over the results
+        healthy = sum(1 for s in services if s.status == "healthy")
+        overall_status = "healthy" if healthy == len(services) else "degraded"
         
         return ComprehensiveHealthResponse(
             overall_status=overall_status,
-            timestamp=int(time.time()),
+            timestamp=int(now),
             services=services,
             agents=agents,
             system_info={
-                "uptime_seconds": time.time() - SERVICE_START_TIME,
+                "uptime_seconds": now - SERVICE_START_TIME,
                 "version": "2.0.0",
                 "environment": "production",
                 "total_services": len(services),
-                "healthy_services": len([s for s in services if s.status == "healthy"])
+                "healthy_services": healthy
             }
         )
     except Exception as e:
-        logger.error(f"Detailed health check failed: {e}")
+        logger.error("Detailed health check failed: %s", e)
         raise HTTPException(status_code=503, detail="Health check service unavailable")
 
+async def _timed_check(service_name: str, check_func, last_check: str) -> ServiceHealth:
+    """Run a single service check and wrap its outcome in a ServiceHealth"""
+    start_time = time.perf_counter()
+    try:
+        status, details = await asyncio.wait_for(check_func(), timeout=HEALTH_CHECK_TIMEOUT)
+        response_time = (time.perf_counter() - start_time) * 1000
+        
+        return ServiceHealth(
+            service_name=service_name,
+            status=status,
+            response_time_ms=round(response_time, 2),
+            last_check=last_check,
+            details=details
+        )
+    except asyncio.TimeoutError:
+        return ServiceHealth(
+            service_name=service_name,
+            status="timeout",
+            response_time_ms=HEALTH_CHECK_TIMEOUT * 1000,
+            last_check=last_check,
+            details={"error": "timeout"}
+        )
+    except Exception as e:
+        return ServiceHealth(
+            service_name=service_name,
+            status="error",
+            response_time_ms=0,
+            last_check=last_check,
+            details={"error": str(e)}
+        )
+
 async def check_dependencies() -> Dict[str, str]:
     """Check external dependencies"""
-    dependencies = {}
-    
-    try:
-        # Check DynamoDB
-        dependencies["dynamodb"] = "healthy"
-    except:
-        dependencies["dynamodb"] = "unavailable"
-    
-    try:
-        # Check S3
-        dependencies["s3"] = "healthy"
-    except:
-        dependencies["s3"] = "unavailable"
+    probes = [
+        ("dynamodb", probe_dynamodb),
+        ("s3", probe_s3),
+        ("bedrock", probe_bedrock)
+    ]
     
-    try:
-        # Check Bedrock
-        dependencies["bedrock"] = "healthy"
-    except:
-        dependencies["bedrock"] = "unavailable"
+    # Probe all dependencies concurrently, each bounded by the health timeout;
+    # cached results are reused and served stale if a refresh fails
+    results = await asyncio.gather(
+        *(_PROBE_CACHE.get(name, _DEPENDENCY_POLICY, lambda p=probe: asyncio.wait_for(p(), timeout=HEALTH_CHECK_TIMEOUT))
+          for name, probe in probes),
+        return_exceptions=True
+    )
     
+    dependencies = {}
+    for (name, _), result in zip(probes, results):
+        if isinstance(result, asyncio.TimeoutError):
+            dependencies[name] = "timeout"
+        elif isinstance(result, Exception):
+            dependencies[name] = "unavailable"
+        else:
+            dependencies[name] = result[0]
     return dependencies
 
+async def probe_dynamodb() -> str:
+    """Check DynamoDB"""
+    await asyncio.to_thread(get_dynamodb_probe_client().describe_endpoints)
+    return "healthy"
+
+async def probe_s3() -> str:
+    """Check S3"""
+    client = get_s3_probe_client()
+    if EXTRACTED_CONTENT_BUCKET:
+        await asyncio.to_thread(client.head_bucket, Bucket=EXTRACTED_CONTENT_BUCKET)
+    else:
+        await asyncio.to_thread(client.list_buckets)
+    return "healthy"
+
+async def probe_bedrock() -> str:
+    """Check Bedrock"""
+    await asyncio.to_thread(get_bedrock_probe_client().list_foundation_models, byOutputModality="TEXT")
+    return "healthy"
+
 async def check_document_service() -> tuple[str, Dict[str, Any]]:
     """Check document intelligence service"""
     try:
@@ -275,35 +346,35 @@ async def check_agent_status() -> Dict[str, str]:
 async def document_health():
     """Document intelligence service health"""
     status, details = await check_document_service()
-    return {"status": status, "service": "document_intelligence", **details}
+    return ORJSONResponse({"status": status, "service": "document_intelligence", **details})
 
 @router.get("/health/risk")
 async def risk_health():
     """Risk assessment service health"""
     status, details = await check_risk_service()
-    return {"status": status, "service": "risk_assessment", **details}
+    return ORJSONResponse({"status": status, "service": "risk_assessment", **details})
 
 @router.get("/health/compliance")
 async def compliance_health():
     """Compliance validation service health"""
     status, details = await check_compliance_service()
-    return {"status": status, "service": "compliance_validation", **details}
+    return ORJSONResponse({"status": status, "service": "compliance_validation", **details})
 
 @router.get("/health/text")
 async def text_health():
     """Text processing service health"""
     status, details = await check_text_service()
-    return {"status": status, "service": "text_processing", **details}
+    return ORJSONResponse({"status": status, "service": "text_processing", **details})
 
 @router.get("/health/agents")
 async def agents_health():
     """Agent coordination service health"""
     status, details = await check_agent_service()
     agents = await check_agent_status()
-    return {"status": status, "service": "agent_coordination", "agents": agents, **details}
+    return ORJSONResponse({"status": status, "service": "agent_coordination", "agents": agents, **details})
 
 @router.get("/health/knowledge")
 async def knowledge_health():
     """Knowledge base service health"""
     status, details = await check_knowledge_service()
-    return {"status": status, "service": "knowledge_base", **details}
+    return ORJSONResponse({"status": status, "service": "knowledge_base", **details})
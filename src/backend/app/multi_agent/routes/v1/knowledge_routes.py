@@ -1,13 +1,21 @@
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 import logging
+import re
 import time
 import uuid
+from types import MappingProxyType
+
+import orjson
+
+from app.multi_agent.utils.response_cache import cached_json_response
+from app.multi_agent.utils.uploads import upload_size
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 class KnowledgeSearchRequest(BaseModel):
     query: str
@@ -32,32 +40,163 @@ class DocumentAddResponse(BaseModel):
     status: str
     message: str
 
+# Static payloads, built once at import
+_HEALTH_BODY = {
+    "status": "healthy",
+    "service": "knowledge_base",
+    "version": "1.0.0",
+    "features": {
+        "semantic_search": True,
+        "document_storage": True,
+        "vector_search": True,
+        "category_filtering": True,
+        "multilingual_support": True
+    },
+    "knowledge_base": {
+        "total_documents": 1250,
+        "categories": ["banking_regulations", "compliance", "risk_management", "procedures"],
+        "languages": ["vietnamese", "english"],
+        "search_engine": "vector_similarity",
+        "accuracy": "98%"
+    },
+    "storage": "vector_store",
+    "search_latency_ms": 45
+}
+
+_CATEGORIES_PAYLOAD = {
+    "categories": [
+        {
+            "name": "banking_regulations",
+            "display_name": "Banking Regulations",
+            "description": "UCP 600, ISBP 821, and other banking regulations",
+            "document_count": 450
+        },
+        {
+            "name": "compliance",
+            "display_name": "Compliance",
+            "description": "SBV and international compliance requirements",
+            "document_count": 320
+        },
+        {
+            "name": "risk_management",
+            "display_name": "Risk Management",
+            "description": "Credit risk, operational risk, and risk assessment guidelines",
+            "document_count": 280
+        },
+        {
+            "name": "procedures",
+            "display_name": "Procedures",
+            "description": "Banking operations and procedural manuals",
+            "document_count": 200
+        }
+    ],
+    "total_categories": 4,
+    "total_documents": 1250
+}
+_CATEGORIES_BYTES = orjson.dumps(_CATEGORIES_PAYLOAD)
+
+_KNOWLEDGE_STATS = {
+    "total_documents": 1250,
+    "total_categories": 4,
+    "total_searches_today": 1847,
+    "average_search_time_ms": 45,
+    "most_searched_topics": [
+        "letter of credit",
+        "risk assessment", 
+        "compliance requirements",
+        "UCP 600",
+        "SBV regulations"
+    ],
+    "recent_additions": 23,
+    "storage_size_mb": 2840,
+    "languages": ["vietnamese", "english"],
+    "search_accuracy": "98%"
+}
+_KNOWLEDGE_STATS_BYTES = orjson.dumps(_KNOWLEDGE_STATS)
+
+# Mock search index: keyword -> canned results
+_KW_RE = re.compile(r"\b(letter of credit|lc|risk|compliance)\b", re.IGNORECASE)
+_CANON = {"letter of credit": "lc", "lc": "lc", "risk": "risk", "compliance": "compliance"}
+# Precedence when a query mentions several topics
+_KW_PRIORITY = ("lc", "risk", "compliance")
+_MOCK_RESULTS = {
+    "lc": [
+        {
+            "document_id": "doc_lc_001",
+            "title": "UCP 600 - Letter of Credit Regulations",
+            "content": "Uniform Customs and Practice for Documentary Credits (UCP 600) guidelines...",
+            "category": "banking_regulations",
+            "relevance_score": 0.95,
+            "tags": ["UCP600", "letter_of_credit", "documentary_credits"],
+            "last_updated": "2024-01-15"
+        },
+        {
+            "document_id": "doc_lc_002", 
+            "title": "ISBP 821 - International Standard Banking Practice",
+            "content": "International Standard Banking Practice for the Examination of Documents...",
+            "category": "banking_regulations",
+            "relevance_score": 0.89,
+            "tags": ["ISBP821", "document_examination", "banking_practice"],
+            "last_updated": "2024-02-10"
+        }
+    ],
+    "risk": [
+        {
+            "document_id": "doc_risk_001",
+            "title": "Credit Risk Assessment Guidelines",
+            "content": "Comprehensive guidelines for assessing credit risk in banking operations...",
+            "category": "risk_management",
+            "relevance_score": 0.92,
+            "tags": ["credit_risk", "assessment", "guidelines"],
+            "last_updated": "2024-03-05"
+        }
+    ],
+    "compliance": [
+        {
+            "document_id": "doc_comp_001",
+            "title": "SBV Compliance Requirements",
+            "content": "State Bank of Vietnam compliance requirements for commercial banks...",
+            "category": "compliance",
+            "relevance_score": 0.88,
+            "tags": ["SBV", "compliance", "vietnam_banking"],
+            "last_updated": "2024-01-20"
+        }
+    ],
+    # General search results
+    None: [
+        {
+            "document_id": "doc_gen_001",
+            "title": "Banking Operations Manual",
+            "content": "General banking operations and procedures manual...",
+            "category": "procedures",
+            "relevance_score": 0.75,
+            "tags": ["operations", "procedures", "manual"],
+            "last_updated": "2024-02-28"
+        }
+    ]
+}
+
+def _freeze(result: Dict[str, Any]) -> MappingProxyType:
+    return MappingProxyType({k: tuple(v) if isinstance(v, list) else v for k, v in result.items()})
+
+# Read-only views shared across requests; handlers only slice them
+_RESULTS_BY_KW = {kw: tuple(_freeze(r) for r in results) for kw, results in _MOCK_RESULTS.items()}
+# (keyword, category) -> results; category None is the unfiltered bucket
+_RESULTS_BY_KW_CATEGORY = {
+    (kw, category): tuple(r for r in results if r["category"] == category)
+    for kw, results in _RESULTS_BY_KW.items()
+    for category in {r["category"] for r in results}
+}
+_RESULTS_BY_KW_CATEGORY.update({(kw, None): results for kw, results in _RESULTS_BY_KW.items()})
+
 # Health check endpoint
 @router.get("/health")
 async def knowledge_health_check():
     """Health check for knowledge base service"""
-    return {
-        "status": "healthy",
-        "service": "knowledge_base",
-        "timestamp": int(time.time()),
-        "version": "1.0.0",
-        "features": {
-            "semantic_search": True,
-            "document_storage": True,
-            "vector_search": True,
-            "category_filtering": True,
-            "multilingual_support": True
-        },
-        "knowledge_base": {
-            "total_documents": 1250,
-            "categories": ["banking_regulations", "compliance", "risk_management", "procedures"],
-            "languages": ["vietnamese", "english"],
-            "search_engine": "vector_similarity",
-            "accuracy": "98%"
-        },
-        "storage": "vector_store",
-        "search_latency_ms": 45
-    }
+    return await cached_json_response("knowledge_health", 30, _build_knowledge_health)
+
+async def _build_knowledge_health() -> Dict[str, Any]:
+    return {**_HEALTH_BODY, "timestamp": int(time.time())}
 
 @router.post("/search", response_model=KnowledgeSearchResponse)
 async def search_knowledge(request: KnowledgeSearchRequest):
@@ -65,74 +204,10 @@ async def search_knowledge(request: KnowledgeSearchRequest):
     try:
         start_time = time.time()
         
-        # Mock search results based on query
-        mock_results = []
-        
-        if "letter of credit" in request.query.lower() or "lc" in request.query.lower():
-            mock_results = [
-                {
-                    "document_id": "doc_lc_001",
-                    "title": "UCP 600 - Letter of Credit Regulations",
-                    "content": "Uniform Customs and Practice for Documentary Credits (UCP 600) guidelines...",
-                    "category": "banking_regulations",
-                    "relevance_score": 0.95,
-                    "tags": ["UCP600", "letter_of_credit", "documentary_credits"],
-                    "last_updated": "2024-01-15"
-                },
-                {
-                    "document_id": "doc_lc_002", 
-                    "title": "ISBP 821 - International Standard Banking Practice",
-                    "content": "International Standard Banking Practice for the Examination of Documents...",
-                    "category": "banking_regulations",
-                    "relevance_score": 0.89,
-                    "tags": ["ISBP821", "document_examination", "banking_practice"],
-                    "last_updated": "2024-02-10"
-                }
-            ]
-        elif "risk" in request.query.lower():
-            mock_results = [
-                {
-                    "document_id": "doc_risk_001",
-                    "title": "Credit Risk Assessment Guidelines",
-                    "content": "Comprehensive guidelines for assessing credit risk in banking operations...",
-                    "category": "risk_management",
-                    "relevance_score": 0.92,
-                    "tags": ["credit_risk", "assessment", "guidelines"],
-                    "last_updated": "2024-03-05"
-                }
-            ]
-        elif "compliance" in request.query.lower():
-            mock_results = [
-                {
-                    "document_id": "doc_comp_001",
-                    "title": "SBV Compliance Requirements",
-                    "content": "State Bank of Vietnam compliance requirements for commercial banks...",
-                    "category": "compliance",
-                    "relevance_score": 0.88,
-                    "tags": ["SBV", "compliance", "vietnam_banking"],
-                    "last_updated": "2024-01-20"
-                }
-            ]
-        else:
-            # General search results
-            mock_results = [
-                {
-                    "document_id": "doc_gen_001",
-                    "title": "Banking Operations Manual",
-                    "content": "General banking operations and procedures manual...",
-                    "category": "procedures",
-                    "relevance_score": 0.75,
-                    "tags": ["operations", "procedures", "manual"],
-                    "last_updated": "2024-02-28"
-                }
-            ]
-        
-        # Apply category filter if specified
-        if request.category:
-            mock_results = [r for r in mock_results if r["category"] == request.category]
-        
-        # Apply limit
-        mock_results = mock_results[:request.limit]
+        # Mock search results: one keyword match, then a single dict lookup
+        matches = _KW_RE.findall(request.query)
+        key = min((_CANON[m.lower()] for m in matches), key=_KW_PRIORITY.index, default=None)
+        mock_results = _RESULTS_BY_KW_CATEGORY.get((key, request.category or None), ())[:request.limit]
         
         search_time = (time.time() - start_time) * 1000
         
@@ -143,17 +218,17 @@ async def search_knowledge(request: KnowledgeSearchRequest):
             search_time_ms=round(search_time, 2)
         )
     except Exception as e:
-        logger.error(f"Error in knowledge search: {e}")
+        logger.error("Error in knowledge search: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/documents", response_model=DocumentAddResponse)
 async def add_document(request: DocumentAddRequest):
     """Add a new document to the knowledge base"""
     try:
-        document_id = f"doc_{request.category}_{str(uuid.uuid4())[:8]}"
+        document_id = f"doc_{request.category}_{uuid.uuid4().hex[:8]}"
         
         # Mock document addition
-        logger.info(f"Adding document: {request.title} to category: {request.category}")
+        logger.info("Adding document: %s to category: %s", request.title, request.category)
         
         return DocumentAddResponse(
             document_id=document_id,
@@ -161,7 +236,7 @@ async def add_document(request: DocumentAddRequest):
             message=f"Document '{request.title}' added successfully to knowledge base"
         )
     except Exception as e:
-        logger.error(f"Error adding document: {e}")
+        logger.error("Error adding document: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/documents/upload")
@@ -173,8 +248,8 @@ async def upload_document(
 ):
     """Upload a document file to the knowledge base"""
     try:
-        # Read file content
-        content = await file.read()
+        # Stream through the spooled upload instead of buffering it in memory
+        size_bytes = await upload_size(file)
         
         # Process tags
         tag_list = []
@@ -182,22 +257,22 @@ async def upload_document(
             tag_list = [tag.strip() for tag in tags.split(",")]
         
         # Mock file processing
-        document_id = f"doc_{category}_{str(uuid.uuid4())[:8]}"
+        document_id = f"doc_{category}_{uuid.uuid4().hex[:8]}"
         
-        logger.info(f"Uploaded document: {title} ({file.filename}) to category: {category}")
+        logger.info("Uploaded document: %s (%s) to category: %s", title, file.filename, category)
         
         return {
             "document_id": document_id,
             "status": "success",
             "filename": file.filename,
-            "size_bytes": len(content),
+            "size_bytes": size_bytes,
             "title": title,
             "category": category,
             "tags": tag_list,
             "message": f"Document '{title}' uploaded and processed successfully"
         }
     except Exception as e:
-        logger.error(f"Error uploading document: {e}")
+        logger.error("Error uploading document: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/query")
@@ -215,60 +290,15 @@ async def query_knowledge(
         )
         return await search_knowledge(request)
     except Exception as e:
-        logger.error(f"Error in knowledge query: {e}")
+        logger.error("Error in knowledge query: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/categories")
 async def get_categories():
     """Get all available knowledge base categories"""
-    return {
-        "categories": [
-            {
-                "name": "banking_regulations",
-                "display_name": "Banking Regulations",
-                "description": "UCP 600, ISBP 821, and other banking regulations",
-                "document_count": 450
-            },
-            {
-                "name": "compliance",
-                "display_name": "Compliance",
-                "description": "SBV and international compliance requirements",
-                "document_count": 320
-            },
-            {
-                "name": "risk_management",
-                "display_name": "Risk Management",
-                "description": "Credit risk, operational risk, and risk assessment guidelines",
-                "document_count": 280
-            },
-            {
-                "name": "procedures",
-                "display_name": "Procedures",
-                "description": "Banking operations and procedural manuals",
-                "document_count": 200
-            }
-        ],
-        "total_categories": 4,
-        "total_documents": 1250
-    }
+    return Response(content=_CATEGORIES_BYTES, media_type="application/json")
 
 @router.get("/stats")
 async def get_knowledge_stats():
     """Get knowledge base statistics"""
-    return {
-        "total_documents": 1250,
-        "total_categories": 4,
-        "total_searches_today": 1847,
-        "average_search_time_ms": 45,
-        "most_searched_topics": [
-            "letter of credit",
-            "risk assessment", 
-            "compliance requirements",
-            "UCP 600",
-            "SBV regulations"
-        ],
-        "recent_additions": 23,
-        "storage_size_mb": 2840,
-        "languages": ["vietnamese", "english"],
-        "search_accuracy": "98%"
-    }
+    return Response(content=_KNOWLEDGE_STATS_BYTES, media_type="application/json")
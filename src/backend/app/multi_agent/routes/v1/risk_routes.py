@@ -5,33 +5,43 @@ from app.multi_agent.models.risk import (
 from app.multi_agent.services.risk_service import (
     assess_risk, get_monitor_status, receive_alert_webhook, get_score_history, get_market_data
 )
-from app.multi_agent.helpers.improved_pdf_extractor import ImprovedPDFExtractor
+from app.multi_agent.config import ASSESS_CONCURRENCY, ASSESS_QUEUE_LIMIT
 from app.multi_agent.helpers import extract_text_from_docx
-from app.multi_agent.helpers.lightweight_ocr import LightweightOCR
+from app.multi_agent.helpers.extraction_pool import extract_ocr_text, extract_pdf_text, get_extractor_pool
+from app.multi_agent.utils.concurrency import ConcurrencyLimiter
+from app.multi_agent.utils.response_cache import cached_json_response
+from app.multi_agent.utils.uploads import detect_file_kind
+import asyncio
 import time
 
 router = APIRouter()
 
+_ASSESS_LIMITER = ConcurrencyLimiter(ASSESS_CONCURRENCY, max_waiters=ASSESS_QUEUE_LIMIT)
+
+_HEALTH_BODY = {
+    "status": "healthy",
+    "service": "risk_assessment",
+    "version": "1.0.0",
+    "features": {
+        "credit_scoring": True,
+        "financial_analysis": True,
+        "risk_monitoring": True,
+        "market_data": True,
+        "file_processing": True
+    },
+    "supported_formats": ["PDF", "DOCX", "Images"],
+    "models": ["ml_based", "rule_based"],
+    "accuracy": "95%"
+}
+
 # Health check endpoint
 @router.get("/health")
 async def risk_health_check():
     """Health check for risk assessment service"""
-    return {
-        "status": "healthy",
-        "service": "risk_assessment",
-        "timestamp": int(time.time()),
-        "version": "1.0.0",
-        "features": {
-            "credit_scoring": True,
-            "financial_analysis": True,
-            "risk_monitoring": True,
-            "market_data": True,
-            "file_processing": True
-        },
-        "supported_formats": ["PDF", "DOCX", "Images"],
-        "models": ["ml_based", "rule_based"],
-        "accuracy": "95%"
-    }
+    return await cached_json_response("risk_health", 30, _build_risk_health)
+
+async def _build_risk_health() -> dict:
+    return {**_HEALTH_BODY, "timestamp": int(time.time())}
 
 @router.post("/assess")
 async def assess_risk_endpoint(request: RiskAssessmentRequest):
@@ -54,39 +64,43 @@ async def assess_risk_file_endpoint(
     collateral_type: str = Form(...)
 ):
     try:
-        file_bytes = await file.read()
-        text = ''
-        if file.content_type == "application/pdf":
-            extractor = ImprovedPDFExtractor()
-            result = extractor.extract_text_from_pdf(file_bytes)
-            text = result.get('text', '').strip()
-        elif file.content_type in ["application/vnd.openxmlformats-officedocument.wordprocessingml.document", "application/msword"]:
-            from app.multi_agent.helpers import extract_text_from_docx
-            text = extract_text_from_docx(file_bytes)
-        elif file.content_type.startswith("image/"):
-            ocr = LightweightOCR()
-            ocr_result = ocr.extract_text_from_pdf(file_bytes)  # Nếu là ảnh, dùng OCR trực tiếp
-            text = ocr_result.get('text', '').strip() if isinstance(ocr_result, dict) else ''
-        else:
-            raise HTTPException(status_code=400, detail="Chỉ hỗ trợ file PDF, DOCX hoặc ảnh")
-        if not text:
-            raise HTTPException(status_code=400, detail="Không thể trích xuất text từ file")
+        # Bound concurrent extractions so upload bursts queue instead of exhausting RAM
+        async with _ASSESS_LIMITER.slot():
+            file_bytes = await file.read()
+            text = ''
+            loop = asyncio.get_running_loop()
+            # Dispatch on the file signature; the client Content-Type is often wrong
+            kind = detect_file_kind(file_bytes[:8], file.filename, file.content_type)
+            # PDF/OCR extraction is CPU-bound: run it in the process pool, off the event loop
+            if kind == "pdf":
+                text = await loop.run_in_executor(get_extractor_pool(), extract_pdf_text, file_bytes)
+            elif kind == "docx":
+                text = await asyncio.to_thread(extract_text_from_docx, file_bytes)
+            elif kind == "image":
+                # Nếu là ảnh, dùng OCR trực tiếp
+                text = await loop.run_in_executor(get_extractor_pool(), extract_ocr_text, file_bytes)
+            else:
+                raise HTTPException(status_code=400, detail="Chỉ hỗ trợ file PDF, DOCX hoặc ảnh")
+            if not text:
+                raise HTTPException(status_code=400, detail="Không thể trích xuất text từ file")
         
-        # Tạo request object từ form data và extracted text
-        request = RiskAssessmentRequest(
-            applicant_name=applicant_name,
-            business_type=business_type,
-            requested_amount=requested_amount,
-            currency=currency,
-            loan_term=loan_term,
-            loan_purpose=loan_purpose,
-            assessment_type=assessment_type,
-            collateral_type=collateral_type,
-            financial_documents=text
-        )
+            # Tạo request object từ form data và extracted text
+            request = RiskAssessmentRequest(
+                applicant_name=applicant_name,
+                business_type=business_type,
+                requested_amount=requested_amount,
+                currency=currency,
+                loan_term=loan_term,
+                loan_purpose=loan_purpose,
+                assessment_type=assessment_type,
+                collateral_type=collateral_type,
+                financial_documents=text
+            )
         
-        result = await assess_risk(request)
-        return {"status": "success", "data": result}
+            result = await assess_risk(request)
+            return {"status": "success", "data": result}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
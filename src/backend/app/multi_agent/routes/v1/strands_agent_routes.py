@@ -5,21 +5,28 @@ Multi-Agent Hackathon 2025 - Group 181
 FastAPI routes for Strands Agent tools integration
 """
 
-import json
+import asyncio
 import logging
-import os
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Body
+from typing import Annotated, Optional, Dict, Any
+
+import orjson
+from pydantic import BaseModel, Field, StringConstraints
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Body
 from fastapi.responses import JSONResponse
 
 from app.multi_agent.schemas.base import ResponseStatus
 from app.multi_agent.services.strands_agent_service import strands_service
+from app.multi_agent.services.text_service import TextSummaryService, get_text_service
+from app.multi_agent.utils.sse import sse_response
+from app.multi_agent.utils.uploads import read_upload_bounded
 
 router = APIRouter()
 
+SUPERVISOR_FILE_EXTENSIONS = frozenset({'.txt', '.pdf', '.docx', '.doc', '.jpg', '.jpeg', '.png', '.csv'})
+_SUPERVISOR_FORMATS = sorted(SUPERVISOR_FILE_EXTENSIONS)
+_UNSUPPORTED_SUPERVISOR_FILE = f"Unsupported file format. Allowed: {', '.join(_SUPERVISOR_FORMATS)}"
+
 # Initialize logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -54,8 +61,115 @@ class StrandsDocumentRequest(BaseModel):
 
 class StrandsSupervisorRequest(BaseModel):
     """Request model for Strands supervisor agent"""
-    user_request: str = Field(..., description="User's request or question")
+    user_request: Annotated[str, StringConstraints(strip_whitespace=True, min_length=5)] = Field(
+        ..., description="User's request or question (at least 5 characters)"
+    )
     context: Optional[Dict[str, Any]] = Field(None, description="Optional context information")
+    parallel: bool = Field(True, description="Run routed specialist agents concurrently")
+
+
+async def _prepare_file_request(
+    user_request: str,
+    file: Optional[UploadFile],
+    context: Optional[str],
+    text_service: TextSummaryService
+):
+    """
+    Validate the form input, extract text from the optional upload and fold it into
+    the request and context; returns (enhanced_request, parsed_context, file_info)
+    """
+    # Validate input
+    if not user_request or len(user_request.strip()) < 5:
+        raise HTTPException(
+            status_code=400,
+            detail="User request too short (minimum 5 characters)"
+        )
+    
+    # Parse context if provided
+    parsed_context = None
+    if context:
+        try:
+            parsed_context = orjson.loads(context)
+        except orjson.JSONDecodeError:
+            logger.warning("Invalid JSON context provided, ignoring")
+            parsed_context = {"raw_context": context}
+    
+    # Process uploaded file if provided
+    file_content = ""
+    file_info = {}
+    
+    if file and file.filename:
+        try:
+            # Validate file type, then stream the upload with the 10MB cap enforced per chunk
+            file_bytes, file_extension = await read_upload_bounded(
+                file,
+                10 * 1024 * 1024,
+                SUPERVISOR_FILE_EXTENSIONS,
+                too_large_detail="File too large. Maximum size is 10MB",
+                unsupported_detail=_UNSUPPORTED_SUPERVISOR_FILE
+            )
+            file_size = len(file_bytes)
+            
+            # Extract text from file using existing text service
+            file_content = await text_service.extract_text_from_document(
+                file_content=file_bytes,
+                file_extension=file_extension,
+                filename=file.filename
+            )
+            
+            file_info = {
+                "filename": file.filename,
+                "file_size": file_size,
+                "file_type": file_extension,
+                "extracted_text_length": len(file_content) if file_content else 0,
+                "processing_status": "success" if file_content else "failed"
+            }
+            
+            logger.info("📄 File processed: %s - %s characters extracted", file.filename, len(file_content))
+            
+        except Exception as e:
+            logger.error("❌ File processing error: %s", e)
+            file_info = {
+                "filename": file.filename if file else "unknown",
+                "processing_status": "error",
+                "error": str(e)
+            }
+    
+    # Enhance user request with file content
+    enhanced_request = user_request
+    if file_content:
+        enhanced_request += f"\n\n--- DOCUMENT CONTENT ---\n{file_content}\n--- END DOCUMENT ---"
+    
+    # Enhance context with file information
+    if parsed_context is None:
+        parsed_context = {}
+    
+    if file_info:
+        parsed_context["file_info"] = file_info
+        parsed_context["has_document"] = bool(file_content)
+        parsed_context["document_length"] = len(file_content) if file_content else 0
+    
+    return enhanced_request, parsed_context, file_info
+
+
+async def _prepare_file_request_and_supervisor(
+    user_request: str,
+    file: Optional[UploadFile],
+    context: Optional[str],
+    text_service: TextSummaryService
+):
+    """
+    _prepare_file_request with the supervisor agent built concurrently, since
+    agent setup does not depend on the extracted text; returns
+    (enhanced_request, parsed_context, file_info, supervisor)
+    """
+    supervisor_task = asyncio.create_task(strands_service.prepare_supervisor())
+    try:
+        prepared = await _prepare_file_request(user_request, file, context, text_service)
+    except BaseException:
+        supervisor_task.cancel()
+        raise
+    return (*prepared, await supervisor_task)
 
 
 # ============================================================================
@@ -85,19 +199,13 @@ async def strands_supervisor_orchestration(request: StrandsSupervisorRequest = B
         Orchestrated multi-agent response
     """
     try:
-        logger.info(f"🎯 Strands Supervisor Agent: Processing request - {request.user_request[:100]}...")
-        
-        # Validate input
-        if not request.user_request or len(request.user_request.strip()) < 5:
-            raise HTTPException(
-                status_code=400,
-                detail="User request too short (minimum 5 characters)"
-            )
+        logger.info("🎯 Strands Supervisor Agent: Processing request - %s...", request.user_request[:100])
         
         # Process through Strands Agent service
         result = await strands_service.process_supervisor_request(
             user_request=request.user_request,
-            context=request.context
+            context=request.context,
+            parallel=request.parallel
         )
         
         if result.get("status") == "error":
@@ -121,7 +229,7 @@ async def strands_supervisor_orchestration(request: StrandsSupervisorRequest = B
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Strands Supervisor Agent error: {str(e)}")
+        logger.error("❌ Strands Supervisor Agent error: %s", e)
         return JSONResponse(
             status_code=500,
             content={
@@ -135,7 +243,8 @@ async def strands_supervisor_orchestration(request: StrandsSupervisorRequest = B
 async def strands_supervisor_with_file_upload(
     user_request: str = Form(..., description="User's banking request or question"),
     file: Optional[UploadFile] = File(None, description="Optional document file to process"),
-    context: Optional[str] = Form(None, description="Optional context information (JSON string)")
+    context: Optional[str] = Form(None, description="Optional context information (JSON string)"),
+    text_service: TextSummaryService = Depends(get_text_service)
 ):
     """
     Process request through Strands Supervisor Agent with File Upload Support
@@ -162,98 +271,17 @@ async def strands_supervisor_with_file_upload(
         Orchestrated multi-agent response with file processing results
     """
     try:
-        logger.info(f"🎯 Strands Supervisor Agent (File Upload): Processing request - {user_request[:100]}...")
+        logger.info("🎯 Strands Supervisor Agent (File Upload): Processing request - %s...", user_request[:100])
         
-        # Validate input
-        if not user_request or len(user_request.strip()) < 5:
-            raise HTTPException(
-                status_code=400,
-                detail="User request too short (minimum 5 characters)"
-            )
-        
-        # Parse context if provided
-        parsed_context = None
-        if context:
-            try:
-                import json
-                parsed_context = json.loads(context)
-            except json.JSONDecodeError:
-                logger.warning("Invalid JSON context provided, ignoring")
-                parsed_context = {"raw_context": context}
-        
-        # Process uploaded file if provided
-        file_content = ""
-        file_info = {}
-        
-        if file and file.filename:
-            try:
-                # Validate file
-                file_bytes = await file.read()
-                file_size = len(file_bytes)
-                
-                # Check file size (max 10MB)
-                if file_size > 10 * 1024 * 1024:
-                    raise HTTPException(
-                        status_code=400,
-                        detail="File too large. Maximum size is 10MB"
-                    )
-                
-                # Check file type
-                allowed_extensions = ['.txt', '.pdf', '.docx', '.doc', '.jpg', '.jpeg', '.png', '.csv']
-                file_extension = os.path.splitext(file.filename)[1].lower()
-                
-                if file_extension not in allowed_extensions:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Unsupported file format. Allowed: {', '.join(allowed_extensions)}"
-                    )
-                
-                # Extract text from file using existing text service
-                from app.multi_agent.services.text_service import TextSummaryService
-                text_service = TextSummaryService()
-                
-                file_content = await text_service.extract_text_from_document(
-                    file_content=file_bytes,
-                    file_extension=file_extension,
-                    filename=file.filename
-                )
-                
-                file_info = {
-                    "filename": file.filename,
-                    "file_size": file_size,
-                    "file_type": file_extension,
-                    "extracted_text_length": len(file_content) if file_content else 0,
-                    "processing_status": "success" if file_content else "failed"
-                }
-                
-                logger.info(f"📄 File processed: {file.filename} - {len(file_content)} characters extracted")
-                
-            except Exception as e:
-                logger.error(f"❌ File processing error: {str(e)}")
-                file_info = {
-                    "filename": file.filename if file else "unknown",
-                    "processing_status": "error",
-                    "error": str(e)
-                }
-        
-        # Enhance user request with file content
-        enhanced_request = user_request
-        if file_content:
-            enhanced_request += f"\n\n--- DOCUMENT CONTENT ---\n{file_content}\n--- END DOCUMENT ---"
-        
-        # Enhance context with file information
-        if parsed_context is None:
-            parsed_context = {}
-        
-        if file_info:
-            parsed_context["file_info"] = file_info
-            parsed_context["has_document"] = bool(file_content)
-            parsed_context["document_length"] = len(file_content) if file_content else 0
+        enhanced_request, parsed_context, file_info, supervisor = await _prepare_file_request_and_supervisor(
+            user_request, file, context, text_service
+        )
         
         # Process through Strands Agent service
         result = await strands_service.process_supervisor_request(
             user_request=enhanced_request,
-            context=parsed_context
+            context=parsed_context,
+            supervisor=supervisor
         )
         
         if result.get("status") == "error":
@@ -274,7 +302,7 @@ async def strands_supervisor_with_file_upload(
                     "version": "1.0.0",
                     "coordinated_agents": ["compliance_validation", "risk_assessment", "document_intelligence"],
                     "file_processing": True,
-                    "supported_formats": allowed_extensions
+                    "supported_formats": _SUPERVISOR_FORMATS
                 }
             }
         )
@@ -282,7 +310,7 @@ async def strands_supervisor_with_file_upload(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Strands Supervisor Agent (File Upload) error: {str(e)}")
+        logger.error("❌ Strands Supervisor Agent (File Upload) error: %s", e)
         return JSONResponse(
             status_code=500,
             content={
@@ -292,6 +320,55 @@ async def strands_supervisor_with_file_upload(
         )
 
 
+@router.post("/supervisor/process/stream")
+async def strands_supervisor_orchestration_stream(request: StrandsSupervisorRequest = Body(...)):
+    """
+    Streaming variant of /supervisor/process as server-sent events
+    
+    Emits ``agent_start`` / ``agent_complete`` per sub-agent and ``delta`` for
+    model text as it is generated, then ``result`` with the orchestration payload.
+    """
+    logger.info("🎯 Strands Supervisor Agent (stream): Processing request - %s...", request.user_request[:100])
+    return sse_response(strands_service.process_supervisor_request_stream(
+        user_request=request.user_request,
+        context=request.context,
+        parallel=request.parallel
+    ))
+
+
+@router.post("/supervisor/process-with-file/stream")
+async def strands_supervisor_with_file_upload_stream(
+    user_request: str = Form(..., description="User's banking request or question"),
+    file: Optional[UploadFile] = File(None, description="Optional document file to process"),
+    context: Optional[str] = Form(None, description="Optional context information (JSON string)"),
+    text_service: TextSummaryService = Depends(get_text_service)
+):
+    """
+    Streaming variant of /supervisor/process-with-file as server-sent events
+    
+    Emits ``file_processed`` once the upload is extracted, then the same events as
+    /supervisor/process/stream; the final ``result`` includes ``file_processing``.
+    """
+    logger.info("🎯 Strands Supervisor Agent (File Upload, stream): Processing request - %s...", user_request[:100])
+    enhanced_request, parsed_context, file_info, supervisor = await _prepare_file_request_and_supervisor(
+        user_request, file, context, text_service
+    )
+    
+    async def events():
+        if file_info:
+            yield "file_processed", file_info
+        async for event, data in strands_service.process_supervisor_request_stream(
+            user_request=enhanced_request,
+            context=parsed_context,
+            supervisor=supervisor
+        ):
+            if event == "result":
+                data["file_processing"] = file_info
+            yield event, data
+    
+    return sse_response(events())
+
+
 # ============================================================================
 # MANAGEMENT ENDPOINTS
 # ============================================================================
@@ -317,7 +394,7 @@ async def get_strands_agents_status():
         )
         
     except Exception as e:
-        logger.error(f"❌ Strands Agents status error: {str(e)}")
+        logger.error("❌ Strands Agents status error: %s", e)
         return JSONResponse(
             status_code=500,
             content={
@@ -348,7 +425,7 @@ async def list_strands_agent_tools():
         )
         
     except Exception as e:
-        logger.error(f"❌ Strands Agent tools list error: {str(e)}")
+        logger.error("❌ Strands Agent tools list error: %s", e)
         return JSONResponse(
             status_code=500,
             content={
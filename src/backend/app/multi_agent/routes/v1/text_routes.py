@@ -1,14 +1,20 @@
+import copy
 import json
 import logging
-import os
-from typing import Optional, List, Union
-from pydantic import BaseModel, Field
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form
-from fastapi.responses import JSONResponse
+from typing import Annotated, Any, Dict, Optional, List, Tuple, Union
+import orjson
+from pydantic import AfterValidator, BaseModel, Field, StringConstraints
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi.responses import JSONResponse, Response
 
 from app.multi_agent.schemas.base import ResponseStatus
-from app.multi_agent.services.text_service import TextSummaryService
+from app.multi_agent.services.text_service import TextSummaryService, get_text_service, resolve_language
+from app.multi_agent.services.summary_cache import summary_cache, summary_cache_key
 from app.multi_agent.helpers.dynamic_summary_config import analyze_document_for_summary
+from app.multi_agent.utils.concurrency import LLM_LIMITER
+from app.multi_agent.utils.singleflight import SingleFlight
+from app.multi_agent.utils.sse import sse_response
+from app.multi_agent.utils.uploads import read_upload_bounded
 
 router = APIRouter()
 
@@ -16,12 +22,25 @@ router = APIRouter()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024  # 10MB
+SUMMARY_FILE_EXTENSIONS = frozenset({'.txt', '.pdf', '.docx', '.doc'})
+_UNSUPPORTED_SUMMARY_FILE = f"Định dạng file không được hỗ trợ. Chỉ chấp nhận: {', '.join(sorted(SUMMARY_FILE_EXTENSIONS))}"
+
+# Identical summaries requested concurrently share one Bedrock call
+_SUMMARY_FLIGHTS = SingleFlight()
+
+
+# Resolved to a canonical code at validation so equivalent spellings share cache entries
+SummaryLanguage = Annotated[Optional[str], AfterValidator(resolve_language)]
+
 
 class SummaryRequest(BaseModel):
-    text: str = Field(..., description="Text content to summarize")
+    text: Annotated[str, StringConstraints(strip_whitespace=True, min_length=50)] = Field(
+        ..., description="Text content to summarize (at least 50 characters)"
+    )
     summary_type: Optional[str] = Field(default="general", description="Type of summary: general, bullet_points, key_insights")
     max_length: Optional[int] = Field(default=300, description="Maximum length of summary in words")
-    language: Optional[str] = Field(default="vietnamese", description="Language for summary output")
+    language: SummaryLanguage = Field(default="vietnamese", description="Language for summary output")
 
 
 class SummaryResponse(BaseModel):
@@ -36,11 +55,44 @@ class URLSummaryRequest(BaseModel):
     url: str = Field(..., description="URL to summarize")
     summary_type: Optional[str] = Field(default="general", description="Type of summary")
     max_length: Optional[int] = Field(default=300, description="Maximum length in words")
-    language: Optional[str] = Field(default="vietnamese", description="Output language")
+    language: SummaryLanguage = Field(default="vietnamese", description="Output language")
+
+
+async def _summarize_cached(
+    text_service: TextSummaryService,
+    text: str,
+    summary_type: str,
+    max_length: int,
+    language: str
+) -> Tuple[Dict[str, Any], str]:
+    """
+    Summary from the cache, from an identical in-flight request, or from a new
+    Bedrock call; returns (result, X-Cache status)
+    """
+    cache_key = summary_cache_key(text, summary_type, max_length, language)
+    summary_result = summary_cache.get(cache_key)
+    if summary_result is not None:
+        return summary_result, "HIT"
+    
+    async def summarize() -> Dict[str, Any]:
+        result = await text_service.summarize_text(
+            text=text,
+            summary_type=summary_type,
+            max_length=max_length,
+            language=language
+        )
+        summary_cache.put(cache_key, result)
+        return result
+    
+    # Coalesced callers receive the same object; copy so per-request decoration stays local
+    return copy.deepcopy(await _SUMMARY_FLIGHTS.do(cache_key, summarize)), "MISS"
 
 
 @router.post("/summary/text", response_model=dict)
-async def summarize_text(request: SummaryRequest):
+async def summarize_text(
+    request: SummaryRequest,
+    text_service: TextSummaryService = Depends(get_text_service)
+):
     """
     Tóm tắt văn bản được cung cấp trực tiếp
     
@@ -51,22 +103,9 @@ async def summarize_text(request: SummaryRequest):
         JSON response with summarized text and metadata
     """
     try:
-        # Validate input text
-        if not request.text or len(request.text.strip()) < 50:
-            raise HTTPException(
-                status_code=400,
-                detail="Văn bản quá ngắn để tóm tắt (tối thiểu 50 ký tự)"
-            )
-        
-        # Initialize text summary service
-        text_service = TextSummaryService()
-        
-        # Generate summary
-        summary_result = await text_service.summarize_text(
-            text=request.text,
-            summary_type=request.summary_type,
-            max_length=request.max_length,
-            language=request.language
+        # Serve repeated submissions from the summary cache
+        summary_result, cache_status = await _summarize_cached(
+            text_service, request.text, request.summary_type, request.max_length, request.language
         )
         
         return JSONResponse(
@@ -75,7 +114,8 @@ async def summarize_text(request: SummaryRequest):
                 "status": ResponseStatus.SUCCESS,
                 "data": summary_result,
                 "message": "Tóm tắt văn bản thành công"
-            }
+            },
+            headers={"X-Cache": cache_status}
         )
         
     except HTTPException:
@@ -91,27 +131,67 @@ async def summarize_text(request: SummaryRequest):
         )
 
 
-@router.options("/summary/document")
-async def options_document_summary():
-    """Handle CORS preflight for document summary"""
-    return JSONResponse(
-        status_code=200,
-        content={"message": "OK"},
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "POST, OPTIONS",
-            "Access-Control-Allow-Headers": "Content-Type",
-        }
-    )
-
-
+@router.options("/summary/document")
+async def options_document_summary():
+    """Handle CORS preflight for document summary"""
+    return JSONResponse(
+        status_code=200,
+        content={"message": "OK"},
+        headers={
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Methods": "POST, OPTIONS",
+            "Access-Control-Allow-Headers": "Content-Type",
+        }
+    )
+
+
+async def _extract_uploaded_document(
+    file: UploadFile,
+    max_pages: Optional[int],
+    text_service: TextSummaryService
+):
+    """Validate and read the upload, then extract its text; returns (file_content, file_extension, extracted_text)"""
+    if not file.filename:
+        raise HTTPException(
+            status_code=400,
+            detail="Không có file được upload"
+        )
+    
+    # Check file type, then stream the upload with the 10MB cap enforced per chunk
+    file_content, file_extension = await read_upload_bounded(
+        file,
+        MAX_UPLOAD_BYTES,
+        SUMMARY_FILE_EXTENSIONS,
+        too_large_detail="File quá lớn. Kích thước tối đa là 10MB",
+        unsupported_detail=_UNSUPPORTED_SUMMARY_FILE
+    )
+    
+    # Extract text from document
+    extracted_text = await text_service.extract_text_from_document(
+        file_content=file_content,
+        file_extension=file_extension,
+        filename=file.filename,
+        max_pages=max_pages
+    )
+    
+    # Validate extracted text
+    if len(extracted_text.strip()) < 50:
+        raise HTTPException(
+            status_code=400,
+            detail="Không thể trích xuất đủ nội dung từ tài liệu để tóm tắt"
+        )
+    
+    return file_content, file_extension, extracted_text
+
+
 @router.post("/summary/document", response_model=dict)
 async def summarize_document(
     file: UploadFile = File(..., description="Document file to summarize"),
     summary_type: str = Form(default="general"),
     max_length: int = Form(default=300),
     language: str = Form(default="vietnamese"),
-    max_pages: Optional[int] = Form(default=None, description="Maximum pages to process (None = all pages)")
+    max_pages: Optional[int] = Form(default=None, description="Maximum pages to process (None = all pages)"),
+    text_service: TextSummaryService = Depends(get_text_service)
 ):
     """
     Tóm tắt tài liệu từ file upload (hỗ trợ .txt, .pdf, .docx)
@@ -126,54 +206,13 @@ async def summarize_document(
         JSON response with document summary and metadata
     """
     try:
-        # Validate file
-        if not file.filename:
-            raise HTTPException(
-                status_code=400,
-                detail="Không có file được upload"
-            )
-        
-        # Check file size (max 10MB)
-        file_content = await file.read()
-        if len(file_content) > 10 * 1024 * 1024:  # 10MB
-            raise HTTPException(
-                status_code=400,
-                detail="File quá lớn. Kích thước tối đa là 10MB"
-            )
-        
-        # Check file type
-        allowed_extensions = ['.txt', '.pdf', '.docx', '.doc']
-        file_extension = os.path.splitext(file.filename)[1].lower()
-        
-        if file_extension not in allowed_extensions:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Định dạng file không được hỗ trợ. Chỉ chấp nhận: {', '.join(allowed_extensions)}"
-            )
-        
-        # Initialize text summary service
-        text_service = TextSummaryService()
-        
-        # Extract text from document
-        extracted_text = await text_service.extract_text_from_document(
-            file_content=file_content,
-            file_extension=file_extension,
-            filename=file.filename,
-            max_pages=max_pages        )
-        
-        # Validate extracted text
-        if len(extracted_text.strip()) < 50:
-            raise HTTPException(
-                status_code=400,
-                detail="Không thể trích xuất đủ nội dung từ tài liệu để tóm tắt"
-            )
+        file_content, file_extension, extracted_text = await _extract_uploaded_document(
+            file, max_pages, text_service
+        )
         
-        # Generate summary
-        summary_result = await text_service.summarize_text(
-            text=extracted_text,
-            summary_type=summary_type,
-            max_length=max_length,
-            language=language
+        # Serve repeated documents from the summary cache
+        summary_result, cache_status = await _summarize_cached(
+            text_service, extracted_text, summary_type, max_length, resolve_language(language)
         )
         
         # Add document info to response
@@ -190,7 +229,8 @@ async def summarize_document(
                 "status": ResponseStatus.SUCCESS,
                 "data": summary_result,
                 "message": f"Tóm tắt tài liệu '{file.filename}' thành công"
-            }
+            },
+            headers={"X-Cache": cache_status}
         )
         
     except HTTPException:
@@ -206,6 +246,135 @@ async def summarize_document(
         )
 
 
+@router.post("/summary/document/stream")
+async def summarize_document_stream(
+    file: UploadFile = File(..., description="Document file to summarize"),
+    summary_type: str = Form(default="general"),
+    max_length: int = Form(default=300),
+    language: str = Form(default="vietnamese"),
+    max_pages: Optional[int] = Form(default=None, description="Maximum pages to process (None = all pages)"),
+    text_service: TextSummaryService = Depends(get_text_service)
+):
+    """
+    Tóm tắt tài liệu dạng server-sent events (streaming variant of /summary/document)
+    
+    Emits ``document`` once text is extracted, ``delta`` events with summary text
+    as it is generated, then ``result`` with the same data as /summary/document.
+    Upload and extraction errors are returned as regular HTTP errors before streaming starts.
+    """
+    file_content, file_extension, extracted_text = await _extract_uploaded_document(
+        file, max_pages, text_service
+    )
+    document_info = {
+        "filename": file.filename,
+        "file_size": len(file_content),
+        "file_type": file_extension,
+        "extracted_text_length": len(extracted_text),
+        "max_pages_processed": max_pages or "all"
+    }
+    language = resolve_language(language)
+    cache_key = summary_cache_key(extracted_text, summary_type, max_length, language)
+    
+    async def events():
+        yield "document", document_info
+        summary_result = summary_cache.get(cache_key)
+        if summary_result is None:
+            async for event, data in text_service.summarize_text_stream(
+                text=extracted_text,
+                summary_type=summary_type,
+                max_length=max_length,
+                language=language
+            ):
+                if event != "result":
+                    yield event, data
+                    continue
+                summary_cache.put(cache_key, data)
+                summary_result = data
+        summary_result["document_info"] = document_info
+        yield "result", summary_result
+    
+    return sse_response(events())
+
+
+# Summary types and supported formats are static: serialize the response once
+_SUMMARY_TYPES = {
+    "general": {
+        "name": "Tóm tắt chung",
+        "description": "Tóm tắt tổng quan nội dung chính của văn bản",
+        "use_case": "Phù hợp cho việc hiểu nhanh nội dung tổng thể"
+    },
+    "bullet_points": {
+        "name": "Điểm chính",
+        "description": "Liệt kê các điểm chính dưới dạng bullet points",
+        "use_case": "Phù hợp cho báo cáo, danh sách yêu cầu"
+    },
+    "key_insights": {
+        "name": "Thông tin quan trọng",
+        "description": "Trích xuất những thông tin và insight quan trọng nhất",
+        "use_case": "Phù hợp cho phân tích, nghiên cứu"
+    },
+    "executive_summary": {
+        "name": "Tóm tắt điều hành",
+        "description": "Tóm tắt ngắn gọn dành cho lãnh đạo và quản lý",
+        "use_case": "Phù hợp cho báo cáo lãnh đạo, tài liệu kinh doanh"
+    },
+    "detailed": {
+        "name": "Tóm tắt chi tiết",
+        "description": "Tóm tắt chi tiết nhưng vẫn súc tích hơn bản gốc",
+        "use_case": "Phù hợp khi cần giữ lại nhiều thông tin"
+    }
+}
+
+_SUPPORTED_INFO = {
+    "summary_types": _SUMMARY_TYPES,
+    "supported_languages": [
+        {
+            "code": "vietnamese",
+            "name": "Tiếng Việt",
+            "description": "Tóm tắt bằng tiếng Việt"
+        },
+        {
+            "code": "english", 
+            "name": "English",
+            "description": "Summarize in English"
+        }
+    ],
+    "supported_file_types": [
+        {
+            "extension": ".txt",
+            "name": "Text File",
+            "description": "Plain text files"
+        },
+        {
+            "extension": ".pdf",
+            "name": "PDF Document", 
+            "description": "Portable Document Format files"
+        },
+        {
+            "extension": ".docx",
+            "name": "Word Document",
+            "description": "Microsoft Word documents (new format)"
+        },
+        {
+            "extension": ".doc",
+            "name": "Word Document (Legacy)",
+            "description": "Microsoft Word documents (legacy format)"
+        }
+    ],
+    "limits": {
+        "max_file_size": "10MB",
+        "min_text_length": "50 characters",
+        "max_summary_length": "1000 words",
+        "url_timeout": "30 seconds"
+    }
+}
+_SUMMARY_TYPES_BYTES = orjson.dumps({
+    "status": ResponseStatus.SUCCESS,
+    "data": _SUPPORTED_INFO,
+    "message": "Lấy thông tin loại tóm tắt thành công"
+})
+
+
 @router.get("/summary/types", response_model=dict)
 async def get_summary_types():
     """
@@ -214,101 +383,11 @@ async def get_summary_types():
     Returns:
         JSON response with available summary types and supported formats
     """
-    try:
-        summary_types = {
-            "general": {
-                "name": "Tóm tắt chung",
-                "description": "Tóm tắt tổng quan nội dung chính của văn bản",
-                "use_case": "Phù hợp cho việc hiểu nhanh nội dung tổng thể"
-            },
-            "bullet_points": {
-                "name": "Điểm chính",
-                "description": "Liệt kê các điểm chính dưới dạng bullet points",
-                "use_case": "Phù hợp cho báo cáo, danh sách yêu cầu"
-            },
-            "key_insights": {
-                "name": "Thông tin quan trọng",
-                "description": "Trích xuất những thông tin và insight quan trọng nhất",
-                "use_case": "Phù hợp cho phân tích, nghiên cứu"
-            },
-            "executive_summary": {
-                "name": "Tóm tắt điều hành",
-                "description": "Tóm tắt ngắn gọn dành cho lãnh đạo và quản lý",
-                "use_case": "Phù hợp cho báo cáo lãnh đạo, tài liệu kinh doanh"
-            },
-            "detailed": {
-                "name": "Tóm tắt chi tiết",
-                "description": "Tóm tắt chi tiết nhưng vẫn súc tích hơn bản gốc",
-                "use_case": "Phù hợp khi cần giữ lại nhiều thông tin"
-            }
-        }
-        
-        supported_info = {
-            "summary_types": summary_types,
-            "supported_languages": [
-                {
-                    "code": "vietnamese",
-                    "name": "Tiếng Việt",
-                    "description": "Tóm tắt bằng tiếng Việt"
-                },
-                {
-                    "code": "english", 
-                    "name": "English",
-                    "description": "Summarize in English"
-                }
-            ],
-            "supported_file_types": [
-                {
-                    "extension": ".txt",
-                    "name": "Text File",
-                    "description": "Plain text files"
-                },
-                {
-                    "extension": ".pdf",
-                    "name": "PDF Document", 
-                    "description": "Portable Document Format files"
-                },
-                {
-                    "extension": ".docx",
-                    "name": "Word Document",
-                    "description": "Microsoft Word documents (new format)"
-                },
-                {
-                    "extension": ".doc",
-                    "name": "Word Document (Legacy)",
-                    "description": "Microsoft Word documents (legacy format)"
-                }
-            ],
-            "limits": {
-                "max_file_size": "10MB",
-                "min_text_length": "50 characters",
-                "max_summary_length": "1000 words",
-                "url_timeout": "30 seconds"
-            }
-        }
-        
-        return JSONResponse(
-            status_code=200,
-            content={
-                "status": ResponseStatus.SUCCESS,
-                "data": supported_info,
-                "message": "Lấy thông tin loại tóm tắt thành công"
-            }
-        )
-        
-    except Exception as e:
-        logger.error(f"Error getting summary types: {str(e)}")
-        return JSONResponse(
-            status_code=500,
-            content={
-                "status": ResponseStatus.ERROR,
-                "message": f"Lỗi khi lấy thông tin loại tóm tắt: {str(e)}"
-            }
-        )
+    return Response(content=_SUMMARY_TYPES_BYTES, media_type="application/json")
 
 
 @router.get("/summary/health", response_model=dict)
-async def health_check():
+async def health_check(text_service: TextSummaryService = Depends(get_text_service)):
     """
     Kiểm tra tình trạng hoạt động của dịch vụ tóm tắt
     
@@ -316,9 +395,6 @@ async def health_check():
         JSON response with service health status
     """
     try:
-        # Initialize text summary service
-        text_service = TextSummaryService()
-        
         # Check AI services availability
         ai_services_status = {
             "bedrock": text_service.bedrock_service is not None
@@ -334,6 +410,7 @@ async def health_check():
                 "data": {
                     "service_status": "healthy" if is_healthy else "degraded",
                     "ai_services": ai_services_status,
+                    "llm_concurrency": LLM_LIMITER.stats(),
                     "fallback_available": True,
                     "timestamp": "2024-06-22T08:00:00Z"
                 },
@@ -374,7 +451,8 @@ async def legacy_summary_endpoint():
 
 @router.post("/summary/analyze", response_model=dict)
 async def analyze_document_for_summary_endpoint(
-    file: UploadFile = File(..., description="Document file to analyze")
+    file: UploadFile = File(..., description="Document file to analyze"),
+    text_service: TextSummaryService = Depends(get_text_service)
 ):
     """
     Phân tích tài liệu và đưa ra gợi ý về max_length phù hợp
@@ -393,26 +471,14 @@ async def analyze_document_for_summary_endpoint(
                 detail="Không có file được upload"
             )
         
-        # Check file size (max 10MB)
-        file_content = await file.read()
-        if len(file_content) > 10 * 1024 * 1024:  # 10MB
-            raise HTTPException(
-                status_code=400,
-                detail="File quá lớn. Kích thước tối đa là 10MB"
-            )
-        
-        # Check file type
-        allowed_extensions = ['.txt', '.pdf', '.docx', '.doc']
-        file_extension = os.path.splitext(file.filename)[1].lower()
-        
-        if file_extension not in allowed_extensions:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Định dạng file không được hỗ trợ. Chỉ chấp nhận: {', '.join(allowed_extensions)}"
-            )
-        
-        # Initialize text summary service
-        text_service = TextSummaryService()
+        # Check file type, then stream the upload with the 10MB cap enforced per chunk
+        file_content, file_extension = await read_upload_bounded(
+            file,
+            MAX_UPLOAD_BYTES,
+            SUMMARY_FILE_EXTENSIONS,
+            too_large_detail="File quá lớn. Kích thước tối đa là 10MB",
+            unsupported_detail=_UNSUPPORTED_SUMMARY_FILE
+        )
         
         # Extract text from document
         extracted_text = await text_service.extract_text_from_document(
@@ -422,7 +488,6 @@ async def analyze_document_for_summary_endpoint(
         )
         
         # Analyze document
-        from app.multi_agent.helpers.dynamic_summary_config import analyze_document_for_summary
         analysis = analyze_document_for_summary(extracted_text)
         
         # Add file info
@@ -3,143 +3,183 @@ Refactored V1 Routes for VPBank K-MULT Agent Studio
 Improved API organization with comprehensive health checks
 """
 
-from fastapi import APIRouter
+from fastapi import Request
+from fastapi.responses import ORJSONResponse, Response
 
-# Import all route modules
-from app.multi_agent.routes.v1.conversation_routes import router as conversation_router
-from app.multi_agent.routes.v1.text_routes import router as text_router
-from app.multi_agent.routes.v1.risk_routes import router as risk_router
-from app.multi_agent.routes.v1.compliance_routes import router as compliance_router
-from app.multi_agent.routes.v1.agents_routes import router as agents_router
-from app.multi_agent.routes.v1.knowledge_routes import router as knowledge_router
-from app.multi_agent.routes.pure_strands_routes import pure_strands_router
-from app.multi_agent.routes.v1.health_routes import router as health_router
+import orjson
 
-router = APIRouter()
+from app.multi_agent.utils.http_cache import cache_headers, compute_etag, etag_matches, not_modified
+from app.multi_agent.utils.routing import FlatAPIRouter
 
-# Health endpoints - highest priority
-router.include_router(
-    health_router, 
-    prefix="/v1/health", 
-    tags=["Health Checks"]
-)
+# Comprehensive API info payload, serialized once at import
+_API_INFO = {
+    "api_version": "v1",
+    "service": "VPBank K-MULT Agent Studio",
+    "version": "2.0.0",
+    "description": "Multi-Agent AI for Banking Process Automation",
+    "endpoints": {
+        "health": {
+            "comprehensive": "/v1/health/health",
+            "detailed": "/v1/health/health/detailed",
+            "document": "/v1/health/health/document",
+            "risk": "/v1/health/health/risk",
+            "compliance": "/v1/health/health/compliance",
+            "text": "/v1/health/health/text",
+            "agents": "/v1/health/health/agents",
+            "knowledge": "/v1/health/health/knowledge"
+        },
+        "conversation": {
+            "create": "/v1/conversation/create",
+            "list": "/v1/conversation/list",
+            "get": "/v1/conversation/{conversation_id}",
+            "send_message": "/v1/conversation/{conversation_id}/message"
+        },
+        "text": {
+            "summarize_document": "/v1/text/summary/document",
+            "extract_text": "/v1/text/extract",
+            "analyze": "/v1/text/analyze",
+            "health": "/v1/text/summary/health"
+        },
+        "risk": {
+            "assess": "/v1/risk/assess",
+            "assess_file": "/v1/risk/assess-file",
+            "monitor": "/v1/risk/monitor",
+            "history": "/v1/risk/history",
+            "market_data": "/v1/risk/market-data"
+        },
+        "compliance": {
+            "validate": "/v1/compliance/validate",
+            "validate_lc": "/v1/compliance/validate-lc",
+            "check_regulations": "/v1/compliance/regulations",
+            "health": "/v1/compliance/health"
+        },
+        "agents": {
+            "coordinate": "/v1/agents/coordinate",
+            "status": "/v1/agents/status",
+            "list": "/v1/agents/list",
+            "assign_task": "/v1/agents/assign"
+        },
+        "knowledge": {
+            "search": "/v1/knowledge/search",
+            "add_document": "/v1/knowledge/documents",
+            "query": "/v1/knowledge/query"
+        }
+    },
+    "features": {
+        "multi_agent_coordination": True,
+        "document_intelligence": True,
+        "risk_assessment": True,
+        "compliance_validation": True,
+        "vietnamese_nlp": True,
+        "text_summarization": True,
+        "lc_processing": True,
+        "credit_assessment": True
+    },
+    "supported_formats": {
+        "documents": ["PDF", "DOCX", "TXT"],
+        "images": ["JPG", "PNG", "TIFF"],
+        "languages": ["Vietnamese", "English"]
+    },
+    "performance_metrics": {
+        "processing_time_reduction": "60-80%",
+        "error_rate": "<1%",
+        "ocr_accuracy": "99.5%",
+        "availability": "99.9%"
+    }
+}
+_API_INFO_BYTES = orjson.dumps(_API_INFO)
+_API_INFO_ETAG = compute_etag(_API_INFO_BYTES)
+_API_INFO_HEADERS = cache_headers(_API_INFO_ETAG, max_age=3600)
 
-# Core service endpoints
-router.include_router(
-    conversation_router, 
-    prefix="/v1/conversation", 
-    tags=["Conversation Management"]
-)
 
-router.include_router(
-    text_router, 
-    prefix="/v1/text", 
-    tags=["Text Processing & NLP"]
-)
+async def api_info(request: Request):
+    """Get comprehensive API information"""
+    if etag_matches(request, _API_INFO_ETAG):
+        return not_modified(_API_INFO_ETAG, max_age=3600)
+    
+    return Response(content=_API_INFO_BYTES, media_type="application/json", headers=_API_INFO_HEADERS)
 
-router.include_router(
-    risk_router, 
-    prefix="/v1/risk", 
-    tags=["Risk Assessment"]
-)
 
-router.include_router(
-    compliance_router, 
-    prefix="/v1/compliance", 
-    tags=["Compliance Validation"]
-)
+def build_router() -> FlatAPIRouter:
+    """
+    Compose the v1 router. Sub-route modules (and the services, models and SDKs
+    they pull in) are imported here rather than at module import, so the app
+    factory decides when that cost is paid
+    """
+    from app.multi_agent.routes.v1.conversation_routes import router as conversation_router
+    from app.multi_agent.routes.v1.text_routes import router as text_router
+    from app.multi_agent.routes.v1.risk_routes import router as risk_router
+    from app.multi_agent.routes.v1.compliance_routes import router as compliance_router
+    from app.multi_agent.routes.v1.agents_routes import router as agents_router
+    from app.multi_agent.routes.v1.knowledge_routes import router as knowledge_router
+    from app.multi_agent.routes.pure_strands_routes import pure_strands_router
+    from app.multi_agent.routes.v1.health_routes import router as health_router
+    
+    # Routes are rebuilt in full when main.py includes this router, so the
+    # sub-router includes below only copy them; dict results serialize via orjson
+    router = FlatAPIRouter(default_response_class=ORJSONResponse)
+    
+    # Health endpoints - highest priority
+    router.include_router(
+        health_router, 
+        prefix="/v1/health", 
+        tags=["Health Checks"]
+    )
+    
+    # Core service endpoints
+    router.include_router(
+        conversation_router, 
+        prefix="/v1/conversation", 
+        tags=["Conversation Management"]
+    )
+    
+    router.include_router(
+        text_router, 
+        prefix="/v1/text", 
+        tags=["Text Processing & NLP"]
+    )
+    
+    router.include_router(
+        risk_router, 
+        prefix="/v1/risk", 
+        tags=["Risk Assessment"]
+    )
+    
+    router.include_router(
+        compliance_router, 
+        prefix="/v1/compliance", 
+        tags=["Compliance Validation"]
+    )
+    
+    router.include_router(
+        agents_router, 
+        prefix="/v1/agents", 
+        tags=["Multi-Agent Coordination"]
+    )
+    
+    router.include_router(
+        knowledge_router, 
+        prefix="/v1/knowledge", 
+        tags=["Knowledge Base"]
+    )
+    
+    # Include Pure Strands VPBank System
+    router.include_router(pure_strands_router, prefix="/v1", tags=["Pure Strands VPBank System"])
+    
+    # Add comprehensive API info endpoint
+    router.add_api_route("/v1/info", api_info, methods=["GET"])
+    
+    return router
 
-router.include_router(
-    agents_router, 
-    prefix="/v1/agents", 
-    tags=["Multi-Agent Coordination"]
-)
 
-router.include_router(
-    knowledge_router, 
-    prefix="/v1/knowledge", 
-    tags=["Knowledge Base"]
-)
+_router = None
 
-# Include Pure Strands VPBank System
-router.include_router(pure_strands_router, prefix="/v1", tags=["Pure Strands VPBank System"])
 
-# Add comprehensive API info endpoint
-@router.get("/v1/info")
-async def api_info():
-    """Get comprehensive API information"""
-    return {
-        "api_version": "v1",
-        "service": "VPBank K-MULT Agent Studio",
-        "version": "2.0.0",
-        "description": "Multi-Agent AI for Banking Process Automation",
-        "endpoints": {
-            "health": {
-                "comprehensive": "/v1/health/health",
-                "detailed": "/v1/health/health/detailed",
-                "document": "/v1/health/health/document",
-                "risk": "/v1/health/health/risk",
-                "compliance": "/v1/health/health/compliance",
-                "text": "/v1/health/health/text",
-                "agents": "/v1/health/health/agents",
-                "knowledge": "/v1/health/health/knowledge"
-            },
-            "conversation": {
-                "create": "/v1/conversation/create",
-                "list": "/v1/conversation/list",
-                "get": "/v1/conversation/{conversation_id}",
-                "send_message": "/v1/conversation/{conversation_id}/message"
-            },
-            "text": {
-                "summarize_document": "/v1/text/summary/document",
-                "extract_text": "/v1/text/extract",
-                "analyze": "/v1/text/analyze",
-                "health": "/v1/text/summary/health"
-            },
-            "risk": {
-                "assess": "/v1/risk/assess",
-                "assess_file": "/v1/risk/assess-file",
-                "monitor": "/v1/risk/monitor",
-                "history": "/v1/risk/history",
-                "market_data": "/v1/risk/market-data"
-            },
-            "compliance": {
-                "validate": "/v1/compliance/validate",
-                "validate_lc": "/v1/compliance/validate-lc",
-                "check_regulations": "/v1/compliance/regulations",
-                "health": "/v1/compliance/health"
-            },
-            "agents": {
-                "coordinate": "/v1/agents/coordinate",
-                "status": "/v1/agents/status",
-                "list": "/v1/agents/list",
-                "assign_task": "/v1/agents/assign"
-            },
-            "knowledge": {
-                "search": "/v1/knowledge/search",
-                "add_document": "/v1/knowledge/documents",
-                "query": "/v1/knowledge/query"
-            }
-        },
-        "features": {
-            "multi_agent_coordination": True,
-            "document_intelligence": True,
-            "risk_assessment": True,
-            "compliance_validation": True,
-            "vietnamese_nlp": True,
-            "text_summarization": True,
-            "lc_processing": True,
-            "credit_assessment": True
-        },
-        "supported_formats": {
-            "documents": ["PDF", "DOCX", "TXT"],
-            "images": ["JPG", "PNG", "TIFF"],
-            "languages": ["Vietnamese", "English"]
-        },
-        "performance_metrics": {
-            "processing_time_reduction": "60-80%",
-            "error_rate": "<1%",
-            "ocr_accuracy": "99.5%",
-            "availability": "99.9%"
-        }
-    }
+def __getattr__(name: str):
+    # Module-level ``router`` is built on first access
+    global _router
+    if name == "router":
+        if _router is None:
+            _router = build_router()
+        return _router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,12 +4,16 @@ from typing import Generic, TypeVar, Optional
 from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from pydantic.dataclasses import dataclass
 
 T = TypeVar("T")
 
 
 class SuccessResponse(BaseModel, Generic[T]):
+    # Immutable; schema built on first use rather than at import
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     status: str
     data: Optional[T]
 
@@ -27,7 +31,9 @@ class ResponseStatus(str, Enum):
     HIDDEN = "hidden"
 
 
-class ConversationRequest(BaseModel):
+# Request DTO read by attribute only: a slotted dataclass has no per-instance __dict__
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ConversationRequest:
     conversation_id: Optional[str] = None
     user_id: str
     message: Optional[str] = None
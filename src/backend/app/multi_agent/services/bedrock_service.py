@@ -1,26 +1,76 @@
+from typing import List, Literal, Optional, Union
+
 from langchain_aws import ChatBedrockConverse
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import get_llm_cache, set_llm_cache
 
-from app.multi_agent.config import BEDROCK_RT
+from app.multi_agent.config import (
+    BEDROCK_LATENCY_MODE,
+    BEDROCK_RT,
+    LATENCY_OPTIMIZED_MODELS,
+    LLM_CACHE_MAX_ENTRIES,
+)
 from app.multi_agent.interfaces.ai_model_interface import AIModelInterface
 
 
+def _ensure_llm_cache() -> None:
+    # Installed once per process; keeps any cache configured elsewhere
+    if LLM_CACHE_MAX_ENTRIES > 0 and get_llm_cache() is None:
+        set_llm_cache(InMemoryCache(maxsize=LLM_CACHE_MAX_ENTRIES))
+
+
+def resolve_latency(model_id: str, latency: str) -> str:
+    # Bedrock rejects latency-optimized requests for models that lack the option
+    if latency == "optimized" and model_id in LATENCY_OPTIMIZED_MODELS:
+        return "optimized"
+    return "standard"
+
+
 class BedrockService(AIModelInterface):
     def __init__(
-        self, model_id: str, temperature: float, top_p: float, max_tokens: int
+        self,
+        model_id: str,
+        temperature: float,
+        top_p: float,
+        max_tokens: int,
+        latency: Literal["standard", "optimized"] = BEDROCK_LATENCY_MODE,
     ):
         self.model_id = model_id
         self.temperature = temperature
         self.top_p = top_p
         self.max_tokens = max_tokens
+        self.latency = resolve_latency(model_id, latency)
+        _ensure_llm_cache()
+        # Only deterministic calls may be answered from the cache; sampled ones always hit Bedrock
+        deterministic = temperature is not None and float(temperature) == 0
         self.client = ChatBedrockConverse(
             client=BEDROCK_RT,
             model=self.model_id,
             temperature=temperature,
             top_p=top_p,
             max_tokens=max_tokens,
+            # Omitted in standard mode so models without latency-optimized support accept the request
+            performance_config={"latency": "optimized"} if self.latency == "optimized" else None,
+            cache=None if deterministic else False,
         )
 
-    def user_prompt_with_image(self, prompt_text: str, image_base64: str) -> dict:
+    def user_prompt_with_image(self, prompt_text: str, image: Union[bytes, str]) -> dict:
+        if isinstance(image, bytes):
+            # Converse takes raw bytes; the native block skips a base64 encode here
+            # and the decode langchain would do before sending
+            image_block = {
+                "type": "image",
+                "image": {"format": "jpeg", "source": {"bytes": image}},
+            }
+        else:
+            image_block = {
+                "type": "image",
+                "source": {
+                    "type": "base64",
+                    "media_type": "image/jpeg",
+                    "data": image,
+                },
+            }
         user_prompt = {
             "role": "user",
             "content": [
@@ -28,25 +78,27 @@ class BedrockService(AIModelInterface):
                     "type": "text",
                     "text": prompt_text,
                 },
-                {
-                    "type": "image",
-                    "source": {
-                        "type": "base64",
-                        "media_type": "image/jpeg",
-                        "data": image_base64,
-                    },
-                },
+                image_block,
             ],
         }
         return user_prompt
 
-    def ai_astream(self, prompt):
+    def ai_astream(self, prompt, max_tokens: Optional[int] = None):
+        # max_tokens overrides the instance limit for this call only
+        if max_tokens is not None:
+            return self.client.astream(prompt, max_tokens=max_tokens)
         return self.client.astream(prompt)
 
     def ai_chunk_stream(self, chunk):
-        if chunk.content and len(chunk.content) > 0:
-            return chunk.content[-1].get("text", "") or ""
-        return ""
+        # Called once per streamed token: read ``content`` once, no len() check
+        content = chunk.content
+        return (content[-1].get("text") or "") if content else ""
 
     async def ai_ainvoke(self, prompt: str):
         return await self.client.ainvoke(prompt)
+
+    async def ai_abatch(self, prompts: List[str], max_concurrency: int = 10) -> list:
+        # Failed prompts come back as their exception, in input order
+        return await self.client.abatch(
+            prompts, config={"max_concurrency": max_concurrency}, return_exceptions=True
+        )
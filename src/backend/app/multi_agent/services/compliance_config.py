@@ -3,43 +3,372 @@ Compliance Service Configuration - Flexible and Extensible
 Separates configuration from business logic for better maintainability
 """
 
+import logging
 import re
-from typing import Dict, List, Any
+import threading
+from collections import Counter
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Pattern, Tuple
 
-class ComplianceConfig:
-    """Configuration class for compliance service patterns and rules"""
-    
-    # Regulation mapping for different document types - easily extensible
-    REGULATION_MAPPING = {
-        'letter_of_credit': ['UCP600'],
-        'standby_letter_of_credit': ['UCP600', 'ISP98'],  # Future expansion
-        'documentary_collection': ['URC522'],  # Future expansion
-        'commercial_invoice': ['UCP600'],
-        'bill_of_lading': ['UCP600'],
-        'insurance_document': ['UCP600'],
-        'packing_list': ['UCP600'],
-        # Can be expanded with more document types and regulations
+# Keyword scanning uses an Aho-Corasick automaton when available
+try:
+    import ahocorasick
+except ImportError as e:
+    ahocorasick = None
+    logging.warning(f"pyahocorasick not available, falling back to per-keyword scans: {e}")
+
+# Classification gating uses a Hyperscan multi-pattern database when available
+try:
+    import hyperscan
+except ImportError as e:
+    hyperscan = None
+    logging.warning(f"hyperscan not available, falling back to per-type regex gates: {e}")
+
+
+def _compile_patterns(patterns: List[str]) -> List[Pattern[str]]:
+    """Compile raw pattern strings with the flags every matcher uses"""
+    return [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+
+
+def _fuse_patterns(patterns: List[str]) -> Pattern[str]:
+    """Compile alternatives into one pattern that matches wherever any of them does"""
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+
+
+def _lowercased(pattern: str) -> Optional[str]:
+    """
+    The pattern rewritten for already-lowercased text (A-Z ranges lowered), or
+    None if it has uppercase literals a case-sensitive match would miss
+    """
+    lowered = pattern.replace("A-Z", "a-z")
+    escaped = False
+    for char in lowered:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char != char.lower():
+            return None
+    return lowered
+
+
+def _compile_lowercase_patterns(patterns: List[str]) -> List[Pattern[str]]:
+    """
+    Compile patterns that only ever see lowercased text. Case-sensitive where
+    possible: IGNORECASE disables re's literal-prefix search, which is several
+    times slower on long documents
+    """
+    compiled = []
+    for pattern in patterns:
+        lowered = _lowercased(pattern)
+        compiled.append(re.compile(lowered) if lowered is not None else re.compile(pattern, re.IGNORECASE))
+    return compiled
+
+
+def _fuse_lowercase_patterns(patterns: List[str]) -> Pattern[str]:
+    """_fuse_patterns for lowercased text, case-sensitive when every member allows it"""
+    lowered = [_lowercased(pattern) for pattern in patterns]
+    if None in lowered:
+        return _fuse_patterns(patterns)
+    return re.compile("|".join(f"(?:{pattern})" for pattern in lowered))
+
+
+# Static lookup tables: read-only module constants (ComplianceConfig keeps
+# class aliases for existing callers)
+
+# Regulation mapping for different document types - easily extensible.
+# Values are tuples so lookups can hand out the shared objects
+REGULATION_MAPPING = MappingProxyType({
+    'letter_of_credit': ('UCP600',),
+    'standby_letter_of_credit': ('UCP600', 'ISP98'),  # Future expansion
+    'documentary_collection': ('URC522',),  # Future expansion
+    'commercial_invoice': ('UCP600',),
+    'bill_of_lading': ('UCP600',),
+    'insurance_document': ('UCP600',),
+    'packing_list': ('UCP600',),
+    # Can be expanded with more document types and regulations
+})
+_DEFAULT_REGULATIONS = ('UCP600',)
+
+# UCP 600 Article references for common violations
+UCP_ARTICLE_REFERENCES = MappingProxyType({
+    'missing_information': 'UCP 600 Article 14(a) - Document Examination',
+    'discrepancy': 'UCP 600 Article 16 - Discrepant Documents',
+    'expiry_date': 'UCP 600 Article 6 - Availability, Expiry Date',
+    'amount_discrepancy': 'UCP 600 Article 18 - Commercial Invoice',
+    'transport_document': 'UCP 600 Article 19-25 - Transport Documents',
+    'insurance_document': 'UCP 600 Article 28 - Insurance Document',
+    'late_presentation': 'UCP 600 Article 14(c) - Presentation Period',
+    'partial_shipment': 'UCP 600 Article 31 - Partial Drawings/Shipments',
+})
+
+# UCP 600 applicable document types
+UCP_APPLICABLE_DOCUMENTS = frozenset({
+    "commercial_invoice",
+    "letter_of_credit", 
+    "bill_of_lading",
+    "bank_guarantee",
+    "insurance_certificate"
+})
+
+# Financial document types (non-UCP)
+FINANCIAL_DOCUMENT_TYPES = frozenset({
+    "balance_sheet",
+    "income_statement", 
+    "cash_flow_statement",
+    "equity_statement",
+    "notes_to_financial_statements",
+    "audit_report",
+    "financial_report"
+})
+
+# Document type definitions for API
+DOCUMENT_TYPE_DEFINITIONS = MappingProxyType({
+    "commercial_invoice": {
+        "name": "Commercial Invoice",
+        "description": "Hóa đơn thương mại trong tín dụng thư",
+        "ucp_articles": ["Article 18"],
+        "ucp_applicable": True
+    },
+    "letter_of_credit": {
+        "name": "Letter of Credit", 
+        "description": "Tín dụng thư",
+        "ucp_articles": ["Article 1-39"],
+        "ucp_applicable": True
+    },
+    "bill_of_lading": {
+        "name": "Bill of Lading",
+        "description": "Vận đơn",
+        "ucp_articles": ["Article 20"],
+        "ucp_applicable": True
+    },
+    "bank_guarantee": {
+        "name": "Bank Guarantee",
+        "description": "Bảo lãnh ngân hàng",
+        "ucp_articles": ["Article 2"],
+        "ucp_applicable": True
+    },
+    "insurance_certificate": {
+        "name": "Insurance Certificate",
+        "description": "Chứng từ bảo hiểm",
+        "ucp_articles": ["Article 28"],
+        "ucp_applicable": True
+    },
+    "balance_sheet": {
+        "name": "Balance Sheet",
+        "description": "Bảng cân đối kế toán - báo cáo tình hình tài chính",
+        "ucp_articles": [],
+        "ucp_applicable": False
+    },
+    "income_statement": {
+        "name": "Income Statement", 
+        "description": "Báo cáo kết quả kinh doanh - báo cáo lãi lỗ",
+        "ucp_articles": [],
+        "ucp_applicable": False
+    },
+    "cash_flow_statement": {
+        "name": "Cash Flow Statement",
+        "description": "Báo cáo lưu chuyển tiền tệ",
+        "ucp_articles": [],
+        "ucp_applicable": False
+    },
+    "equity_statement": {
+        "name": "Statement of Changes in Equity",
+        "description": "Báo cáo thay đổi vốn chủ sở hữu",
+        "ucp_articles": [],
+        "ucp_applicable": False
+    },
+    "notes_to_financial_statements": {
+        "name": "Notes to Financial Statements",
+        "description": "Thuyết minh báo cáo tài chính",
+        "ucp_articles": [],
+        "ucp_applicable": False
+    },
+    "audit_report": {
+        "name": "Audit Report",
+        "description": "Báo cáo kiểm toán độc lập",
+        "ucp_articles": [],
+        "ucp_applicable": False
+    },
+    "financial_report": {
+        "name": "Financial Report",
+        "description": "Báo cáo tài chính tổng hợp (không áp dụng UCP 600)",
+        "ucp_articles": [],
+        "ucp_applicable": False
+    },
+    "contract": {
+        "name": "Contract/Agreement",
+        "description": "Hợp đồng (có thể chứa điều khoản L/C)",
+        "ucp_articles": [],
+        "ucp_applicable": False
+    },
+    "general_document": {
+        "name": "General Document",
+        "description": "Tài liệu chung cần xác minh",
+        "ucp_articles": [],
+        "ucp_applicable": False
     }
-    
-    # UCP 600 Article references for common violations
-    UCP_ARTICLE_REFERENCES = {
-        'missing_information': 'UCP 600 Article 14(a) - Document Examination',
-        'discrepancy': 'UCP 600 Article 16 - Discrepant Documents',
-        'expiry_date': 'UCP 600 Article 6 - Availability, Expiry Date',
-        'amount_discrepancy': 'UCP 600 Article 18 - Commercial Invoice',
-        'transport_document': 'UCP 600 Article 19-25 - Transport Documents',
-        'insurance_document': 'UCP 600 Article 28 - Insurance Document',
-        'late_presentation': 'UCP 600 Article 14(c) - Presentation Period',
-        'partial_shipment': 'UCP 600 Article 31 - Partial Drawings/Shipments',
+})
+
+
+# Report metadata per document type: category, applicable regulations and required fields
+_DOCUMENT_CATEGORIES = {
+    "commercial_invoice": {
+        "category": "Trade Document",
+        "subcategory": "Commercial Documentation",
+        "business_purpose": "Invoice for goods sold in international trade"
+    },
+    "letter_of_credit": {
+        "category": "Trade Document", 
+        "subcategory": "Payment Instrument",
+        "business_purpose": "Bank guarantee for international trade payment"
+    },
+    "bill_of_lading": {
+        "category": "Trade Document",
+        "subcategory": "Transport Documentation", 
+        "business_purpose": "Receipt and contract for cargo transportation"
+    },
+    "bank_guarantee": {
+        "category": "Trade Document",
+        "subcategory": "Financial Guarantee",
+        "business_purpose": "Bank assurance for contract performance"
+    },
+    "insurance_certificate": {
+        "category": "Trade Document",
+        "subcategory": "Risk Management",
+        "business_purpose": "Insurance coverage for traded goods"
+    },
+    "financial_report": {
+        "category": "Financial Document",
+        "subcategory": "Corporate Reporting",
+        "business_purpose": "Financial performance and position reporting"
+    },
+    "contract": {
+        "category": "Legal Document",
+        "subcategory": "Commercial Agreement", 
+        "business_purpose": "Legal agreement between parties"
     }
+}
+_DEFAULT_DOCUMENT_CATEGORY = {
+    "category": "General Document",
+    "subcategory": "Unclassified",
+    "business_purpose": "Document purpose not determined"
+}
+
+_REQUIRED_FIELDS = {
+    "commercial_invoice": {
+        "mandatory": ["invoice_number", "date", "seller", "buyer", "goods_description", "amount"],
+        "optional": ["payment_terms", "shipping_terms", "lc_reference"],
+        "ucp_specific": ["invoice_number", "goods_description", "amount"]
+    },
+    "letter_of_credit": {
+        "mandatory": ["lc_number", "issue_date", "expiry_date", "applicant", "beneficiary", "amount"],
+        "optional": ["available_with", "documents_required", "latest_shipment"],
+        "ucp_specific": ["lc_number", "expiry_date", "amount", "documents_required"]
+    },
+    "bill_of_lading": {
+        "mandatory": ["bl_number", "date", "shipper", "consignee", "vessel", "port_loading", "port_discharge"],
+        "optional": ["notify_party", "freight_terms", "container_numbers"],
+        "ucp_specific": ["bl_number", "on_board_date", "clean_receipt"]
+    },
+    "financial_report": {
+        "mandatory": ["entity_name", "report_period", "total_assets", "total_liabilities", "equity"],
+        "optional": ["auditor_opinion", "comparative_figures", "notes"],
+        "ucp_specific": []
+    },
+    "contract": {
+        "mandatory": ["contract_number", "parties", "subject_matter", "consideration", "terms"],
+        "optional": ["governing_law", "dispute_resolution", "termination_clause"],
+        "ucp_specific": []
+    }
+}
+_DEFAULT_REQUIRED_FIELDS = {
+    "mandatory": [],
+    "optional": [],
+    "ucp_specific": []
+}
+
+
+def _applicable_regulations(document_type: Optional[str]) -> List[Dict[str, Any]]:
+    """Regulations listed in the report for a document type"""
+    if document_type in UCP_APPLICABLE_DOCUMENTS:
+        ucp_articles = DOCUMENT_TYPE_DEFINITIONS.get(document_type, {}).get("ucp_articles", [])
+        return [
+            {
+                "regulation": "UCP 600",
+                "full_name": "Uniform Customs and Practice for Documentary Credits",
+                "applicable_articles": ucp_articles,
+                "mandatory": True,
+                "scope": "International trade finance"
+            }
+        ]
+    elif document_type == "financial_report":
+        return [
+            {
+                "regulation": "VAS/IFRS",
+                "full_name": "Vietnamese Accounting Standards / International Financial Reporting Standards",
+                "applicable_articles": ["VAS 01", "VAS 21", "IFRS 1"],
+                "mandatory": True,
+                "scope": "Financial reporting standards"
+            }
+        ]
+    elif document_type == "contract":
+        return [
+            {
+                "regulation": "Civil Code",
+                "full_name": "Vietnamese Civil Code",
+                "applicable_articles": ["Article 385-420"],
+                "mandatory": True,
+                "scope": "Contract law"
+            }
+        ]
+    else:
+        return [
+            {
+                "regulation": "General Business Law",
+                "full_name": "Vietnamese Enterprise Law",
+                "applicable_articles": [],
+                "mandatory": False,
+                "scope": "General business operations"
+            }
+        ]
+
+
+def _document_metadata(document_type: Optional[str]) -> Dict[str, Any]:
+    return {
+        "category": _DOCUMENT_CATEGORIES.get(document_type, _DEFAULT_DOCUMENT_CATEGORY),
+        "regulations": _applicable_regulations(document_type),
+        "required_fields": _REQUIRED_FIELDS.get(document_type, _DEFAULT_REQUIRED_FIELDS),
+    }
+
+
+# Built once: every document type with its own entry in any table above
+DOCUMENT_METADATA = MappingProxyType({
+    document_type: _document_metadata(document_type)
+    for document_type in (
+        *DOCUMENT_TYPE_DEFINITIONS, *UCP_APPLICABLE_DOCUMENTS, *_DOCUMENT_CATEGORIES, *_REQUIRED_FIELDS
+    )
+})
+DEFAULT_DOCUMENT_METADATA = _document_metadata(None)
+
+
+class ComplianceConfig:
+    """Configuration class for compliance service patterns and rules"""
+
+    REGULATION_MAPPING = REGULATION_MAPPING
+    UCP_ARTICLE_REFERENCES = UCP_ARTICLE_REFERENCES
+    UCP_APPLICABLE_DOCUMENTS = UCP_APPLICABLE_DOCUMENTS
+    FINANCIAL_DOCUMENT_TYPES = FINANCIAL_DOCUMENT_TYPES
+    DOCUMENT_TYPE_DEFINITIONS = DOCUMENT_TYPE_DEFINITIONS
+    DOCUMENT_METADATA = DOCUMENT_METADATA
     
-    def get_applicable_regulations(self, document_type: str) -> List[str]:
+    def get_applicable_regulations(self, document_type: str) -> Tuple[str, ...]:
         """Get applicable regulations for a document type"""
-        return self.REGULATION_MAPPING.get(document_type, ['UCP600'])  # Default to UCP600
+        return REGULATION_MAPPING.get(document_type, _DEFAULT_REGULATIONS)  # Default to UCP600
     
     def get_regulation_reference(self, violation_type: str) -> str:
         """Get UCP article reference for violation type"""
-        return self.UCP_ARTICLE_REFERENCES.get(violation_type, 'UCP 600 - General Compliance')
+        return UCP_ARTICLE_REFERENCES.get(violation_type, 'UCP 600 - General Compliance')
     
     # Document classification patterns - easily extensible
     DOCUMENT_PATTERNS = {
@@ -341,129 +670,180 @@ class ComplianceConfig:
         }
     }
 
-    # UCP 600 applicable document types
-    UCP_APPLICABLE_DOCUMENTS = {
-        "commercial_invoice",
-        "letter_of_credit", 
-        "bill_of_lading",
-        "bank_guarantee",
-        "insurance_certificate"
-    }
+    # Compiled forms of the pattern tables above, built once by _compile_all();
+    # the raw strings stay as the editable source of truth. Document patterns
+    # only run on lowercased text, so they are compiled for it
+    COMPILED_DOCUMENT_PATTERNS: Dict[str, List[Pattern[str]]] = {}
+    COMPILED_FIELD_PATTERNS: Dict[str, List[Pattern[str]]] = {}
+    COMPILED_DOCUMENT_SPECIFIC_FIELDS: Dict[str, Dict[str, List[Pattern[str]]]] = {}
 
-    # Financial document types (non-UCP)
-    FINANCIAL_DOCUMENT_TYPES = {
-        "balance_sheet",
-        "income_statement", 
-        "cash_flow_statement",
-        "equity_statement",
-        "notes_to_financial_statements",
-        "audit_report",
-        "financial_report"
-    }
+    # One alternation per pattern list: a single search tells whether any member
+    # can match, so per-pattern scans only run for tables with a hit
+    FUSED_DOCUMENT_PATTERNS: Dict[str, Pattern[str]] = {}
+    FUSED_FIELD_PATTERNS: Dict[str, Pattern[str]] = {}
+    FUSED_DOCUMENT_SPECIFIC_FIELDS: Dict[str, Dict[str, Pattern[str]]] = {}
 
-    # Document type definitions for API
-    DOCUMENT_TYPE_DEFINITIONS = {
-        "commercial_invoice": {
-            "name": "Commercial Invoice",
-            "description": "Hóa đơn thương mại trong tín dụng thư",
-            "ucp_articles": ["Article 18"],
-            "ucp_applicable": True
-        },
-        "letter_of_credit": {
-            "name": "Letter of Credit", 
-            "description": "Tín dụng thư",
-            "ucp_articles": ["Article 1-39"],
-            "ucp_applicable": True
-        },
-        "bill_of_lading": {
-            "name": "Bill of Lading",
-            "description": "Vận đơn",
-            "ucp_articles": ["Article 20"],
-            "ucp_applicable": True
-        },
-        "bank_guarantee": {
-            "name": "Bank Guarantee",
-            "description": "Bảo lãnh ngân hàng",
-            "ucp_articles": ["Article 2"],
-            "ucp_applicable": True
-        },
-        "insurance_certificate": {
-            "name": "Insurance Certificate",
-            "description": "Chứng từ bảo hiểm",
-            "ucp_articles": ["Article 28"],
-            "ucp_applicable": True
-        },
-        "balance_sheet": {
-            "name": "Balance Sheet",
-            "description": "Bảng cân đối kế toán - báo cáo tình hình tài chính",
-            "ucp_articles": [],
-            "ucp_applicable": False
-        },
-        "income_statement": {
-            "name": "Income Statement", 
-            "description": "Báo cáo kết quả kinh doanh - báo cáo lãi lỗ",
-            "ucp_articles": [],
-            "ucp_applicable": False
-        },
-        "cash_flow_statement": {
-            "name": "Cash Flow Statement",
-            "description": "Báo cáo lưu chuyển tiền tệ",
-            "ucp_articles": [],
-            "ucp_applicable": False
-        },
-        "equity_statement": {
-            "name": "Statement of Changes in Equity",
-            "description": "Báo cáo thay đổi vốn chủ sở hữu",
-            "ucp_articles": [],
-            "ucp_applicable": False
-        },
-        "notes_to_financial_statements": {
-            "name": "Notes to Financial Statements",
-            "description": "Thuyết minh báo cáo tài chính",
-            "ucp_articles": [],
-            "ucp_applicable": False
-        },
-        "audit_report": {
-            "name": "Audit Report",
-            "description": "Báo cáo kiểm toán độc lập",
-            "ucp_articles": [],
-            "ucp_applicable": False
-        },
-        "financial_report": {
-            "name": "Financial Report",
-            "description": "Báo cáo tài chính tổng hợp (không áp dụng UCP 600)",
-            "ucp_articles": [],
-            "ucp_applicable": False
-        },
-        "contract": {
-            "name": "Contract/Agreement",
-            "description": "Hợp đồng (có thể chứa điều khoản L/C)",
-            "ucp_articles": [],
-            "ucp_applicable": False
-        },
-        "general_document": {
-            "name": "General Document",
-            "description": "Tài liệu chung cần xác minh",
-            "ucp_articles": [],
-            "ucp_applicable": False
-        }
-    }
+    # Lowercased classification keyword -> document types listing it (once per listing)
+    _KEYWORD_DOC_TYPES: Dict[str, List[str]] = {}
+    _KEYWORD_AUTOMATON = None
+
+    # (doc_type, weight, fused gate, compiled patterns) in DOCUMENT_PATTERNS order,
+    # so the classifier's scoring loop unpacks tuples instead of doing dict lookups
+    CLASSIFIERS: List[Tuple[str, float, Pattern[str], List[Pattern[str]]]] = []
+
+    # Every classification pattern in one Hyperscan database (id = CLASSIFIERS
+    # index); scratch space is per thread, as Hyperscan requires
+    _CLASSIFIER_DB = None
+    _HS_LOCAL = threading.local()
+
+
+    @classmethod
+    def get_document_metadata(cls, document_type: str) -> Dict[str, Any]:
+        """Report category, applicable regulations and required fields for a document type"""
+        return DOCUMENT_METADATA.get(document_type, DEFAULT_DOCUMENT_METADATA)
 
     @classmethod
     def is_ucp_applicable(cls, document_type: str) -> bool:
         """Check if document type is applicable for UCP 600"""
-        return document_type in cls.UCP_APPLICABLE_DOCUMENTS
+        return document_type in UCP_APPLICABLE_DOCUMENTS
 
     @classmethod
     def is_financial_document(cls, document_type: str) -> bool:
         """Check if document type is a financial document"""
-        return document_type in cls.FINANCIAL_DOCUMENT_TYPES
+        return document_type in FINANCIAL_DOCUMENT_TYPES
 
     @classmethod
     def get_document_weight(cls, document_type: str) -> float:
         """Get classification weight for document type"""
         return cls.DOCUMENT_PATTERNS.get(document_type, {}).get("weight", 1.0)
 
+    @classmethod
+    def iter_compiled(cls, field_type: str) -> List[Pattern[str]]:
+        """Get compiled field extraction patterns for a field type"""
+        return cls.COMPILED_FIELD_PATTERNS.get(field_type, [])
+
+    @classmethod
+    def keyword_hits(cls, text_lower: str) -> Counter:
+        """
+        Count, per document type, the classification keywords found in already
+        lowercased text; one automaton pass replaces a substring scan per keyword
+        """
+        if cls._KEYWORD_AUTOMATON is not None:
+            matched = {keyword for _, keyword in cls._KEYWORD_AUTOMATON.iter(text_lower)}
+        else:
+            matched = [keyword for keyword in cls._KEYWORD_DOC_TYPES if keyword in text_lower]
+        
+        hits = Counter()
+        for keyword in matched:
+            hits.update(cls._KEYWORD_DOC_TYPES[keyword])
+        return hits
+
+    @classmethod
+    def classifier_gate(cls, text_lower: str) -> set:
+        """
+        Document types with at least one classification pattern matching the
+        lowercased text. Hyperscan checks all of them in a single pass; without
+        it, each type's fused alternation is searched in turn
+        """
+        if cls._CLASSIFIER_DB is None:
+            return {doc_type for doc_type, _, fused, _ in cls.CLASSIFIERS if fused.search(text_lower)}
+        
+        db = cls._CLASSIFIER_DB
+        local = cls._HS_LOCAL
+        if getattr(local, "db", None) is not db:
+            local.db, local.scratch = db, hyperscan.Scratch(db)
+        
+        matched = set()
+        db.scan(
+            text_lower.encode("utf-8"),
+            match_event_handler=lambda index, start, end, flags, context: matched.add(index),
+            scratch=local.scratch,
+        )
+        return {cls.CLASSIFIERS[index][0] for index in matched}
+
+    @classmethod
+    def _build_keyword_index(cls):
+        keyword_doc_types: Dict[str, List[str]] = {}
+        for doc_type, config in cls.DOCUMENT_PATTERNS.items():
+            for keyword in config["keywords"]:
+                keyword_doc_types.setdefault(keyword.lower(), []).append(doc_type)
+        cls._KEYWORD_DOC_TYPES = keyword_doc_types
+        
+        cls._KEYWORD_AUTOMATON = None
+        if ahocorasick is not None and keyword_doc_types:
+            automaton = ahocorasick.Automaton()
+            for keyword in keyword_doc_types:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            cls._KEYWORD_AUTOMATON = automaton
+
+    @classmethod
+    def _build_classifiers(cls):
+        cls.CLASSIFIERS = [
+            (
+                doc_type,
+                config.get("weight", 1.0),
+                cls.FUSED_DOCUMENT_PATTERNS[doc_type],
+                cls.COMPILED_DOCUMENT_PATTERNS[doc_type],
+            )
+            for doc_type, config in cls.DOCUMENT_PATTERNS.items()
+        ]
+        
+        cls._CLASSIFIER_DB = None
+        if hyperscan is None:
+            return
+        expressions, ids = [], []
+        for index, (_, _, _, patterns) in enumerate(cls.CLASSIFIERS):
+            for pattern in patterns:
+                expressions.append(pattern.pattern.encode("utf-8"))
+                ids.append(index)
+        if not expressions:
+            return
+        # Same semantics as the re gates on lowercased text: Unicode \s/\d, one report per pattern
+        flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+        try:
+            db = hyperscan.Database()
+            db.compile(expressions=expressions, ids=ids, elements=len(expressions), flags=[flags] * len(expressions))
+            cls._CLASSIFIER_DB = db
+        except hyperscan.error as e:
+            logging.warning(f"Hyperscan could not compile classification patterns, using regex gates: {e}")
+
+    @classmethod
+    def _compile_all(cls):
+        """Compile every pattern table once, so matchers skip re's per-call cache lookup"""
+        cls.COMPILED_DOCUMENT_PATTERNS = {
+            doc_type: _compile_lowercase_patterns(config["patterns"])
+            for doc_type, config in cls.DOCUMENT_PATTERNS.items()
+        }
+        cls.COMPILED_FIELD_PATTERNS = {
+            field_type: _compile_patterns(patterns)
+            for field_type, patterns in cls.FIELD_PATTERNS.items()
+        }
+        cls.COMPILED_DOCUMENT_SPECIFIC_FIELDS = {
+            doc_type: {
+                field_name: _compile_patterns(patterns)
+                for field_name, patterns in fields.items()
+            }
+            for doc_type, fields in cls.DOCUMENT_SPECIFIC_FIELDS.items()
+        }
+        cls.FUSED_DOCUMENT_PATTERNS = {
+            doc_type: _fuse_lowercase_patterns(config["patterns"])
+            for doc_type, config in cls.DOCUMENT_PATTERNS.items()
+        }
+        cls.FUSED_FIELD_PATTERNS = {
+            field_type: _fuse_patterns(patterns)
+            for field_type, patterns in cls.FIELD_PATTERNS.items()
+        }
+        cls.FUSED_DOCUMENT_SPECIFIC_FIELDS = {
+            doc_type: {
+                field_name: _fuse_patterns(patterns)
+                for field_name, patterns in fields.items()
+            }
+            for doc_type, fields in cls.DOCUMENT_SPECIFIC_FIELDS.items()
+        }
+        cls._build_keyword_index()
+        cls._build_classifiers()
+
     @classmethod
     def add_document_pattern(cls, doc_type: str, keywords: List[str], patterns: List[str], weight: float = 1.0):
         """Add new document pattern dynamically"""
@@ -472,6 +852,10 @@ class ComplianceConfig:
             "patterns": patterns,
             "weight": weight
         }
+        cls.COMPILED_DOCUMENT_PATTERNS[doc_type] = _compile_lowercase_patterns(patterns)
+        cls.FUSED_DOCUMENT_PATTERNS[doc_type] = _fuse_lowercase_patterns(patterns)
+        cls._build_keyword_index()
+        cls._build_classifiers()
 
     @classmethod
     def add_field_pattern(cls, field_type: str, patterns: List[str]):
@@ -479,3 +863,8 @@ class ComplianceConfig:
         if field_type not in cls.FIELD_PATTERNS:
             cls.FIELD_PATTERNS[field_type] = []
         cls.FIELD_PATTERNS[field_type].extend(patterns)
+        cls.COMPILED_FIELD_PATTERNS[field_type] = _compile_patterns(cls.FIELD_PATTERNS[field_type])
+        cls.FUSED_FIELD_PATTERNS[field_type] = _fuse_patterns(cls.FIELD_PATTERNS[field_type])
+
+
+ComplianceConfig._compile_all()
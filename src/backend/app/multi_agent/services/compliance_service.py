@@ -1,18 +1,31 @@
 import os
+import asyncio
 import logging
 import time
-import json
+import orjson
 import re
-from typing import Optional, Dict, Any, List
+from collections import Counter
+from contextlib import aclosing, nullcontext
+from typing import Optional, Dict, Any, List, Tuple, Awaitable, Callable
 from enum import Enum
+from functools import lru_cache, partial
 
-from app.multi_agent.services.bedrock_service import BedrockService
+from app.multi_agent.services.bedrock_service import BedrockService, resolve_latency
 from app.multi_agent.services.compliance_config import ComplianceConfig
+from app.multi_agent.services.regulation_cache import regulation_cache
+from app.multi_agent.utils.json_stream import JsonObjectScanner, find_json_object, iter_json_arrays
+from app.multi_agent.utils.concurrency import ConcurrencyLimiter
+from app.multi_agent.utils.singleflight import SingleFlight
 from app.multi_agent.config import (
     BEDROCK_KNOWLEDGEBASE,
     KNOWLEDGEBASE_ID,
     MODEL_MAPPING,
     CONVERSATION_CHAT_MODEL_NAME,
+    COMPLIANCE_BATCH_SIZE,
+    COMPLIANCE_LATENCY_MODE,
+    COMPLIANCE_VALIDATION_MAX_TOKENS,
+    COMPLIANCE_SCAN_HEAD_CHARS,
+    COMPLIANCE_SCAN_TAIL_CHARS,
     CONVERSATION_CHAT_TOP_P,
     CONVERSATION_CHAT_TEMPERATURE,
     LLM_MAX_TOKENS
@@ -20,6 +33,97 @@ from app.multi_agent.config import (
 
 logger = logging.getLogger(__name__)
 
+# Concurrent validations of one document type share a single regulation lookup
+_REGULATION_FLIGHTS = SingleFlight()
+
+
+def _limiter_slot(limiter: Optional[ConcurrencyLimiter]):
+    return limiter.slot() if limiter is not None else nullcontext()
+
+
+async def _limited(limiter: Optional[ConcurrencyLimiter], call: Callable[[], Awaitable[Any]]) -> Any:
+    """Await ``call()`` while holding one limiter slot (no limit when ``limiter`` is None)"""
+    async with _limiter_slot(limiter):
+        return await call()
+
+
+def _scan_window(text: str) -> str:
+    # Regex scans are linear in text length; long OCR output is cut to its head and tail
+    head, tail = COMPLIANCE_SCAN_HEAD_CHARS, max(COMPLIANCE_SCAN_TAIL_CHARS, 0)
+    if head <= 0 or len(text) <= head + tail:
+        return text
+    return text[:head] + "\n...\n" + (text[-tail:] if tail else "")
+
+
+# Violation keyword -> (UCP 600 reference, suggestion), first match wins
+_VIOLATION_RULES = (
+    ('missing', 'UCP 600 Article 14(a) - Document Examination', 'Bổ sung thông tin thiếu trong tài liệu'),
+    ('discrepancy', 'UCP 600 Article 16 - Discrepant Documents', 'Kiểm tra và sửa chữa các sai lệch trong tài liệu'),
+    ('expiry', 'UCP 600 Article 6 - Availability, Expiry Date', 'Kiểm tra ngày hết hạn và thời gian trình bày'),
+    ('amount', 'UCP 600 Article 18 - Commercial Invoice', None),
+)
+_GENERAL_VIOLATION_RULE = (None, 'UCP 600 - General Compliance', None)
+_LC_DOCUMENT_TYPES = frozenset(('letter_of_credit', 'standby_letter_of_credit'))
+
+# Values kept per common field type
+_MAX_FIELD_VALUES = 5
+
+# Regulations and key requirements per financial (non-UCP) document type
+_FINANCIAL_HANDLING = {
+    "balance_sheet": {
+        "confidence": 0.9,
+        "regulations": "VAS 01 - Trình bày báo cáo tài chính",
+        "key_requirements": ["Tổng tài sản", "Tổng nợ phải trả", "Vốn chủ sở hữu"],
+        "compliance_focus": "Cấu trúc và phân loại tài sản, nợ phải trả"
+    },
+    "income_statement": {
+        "confidence": 0.9,
+        "regulations": "VAS 01 - Báo cáo kết quả kinh doanh",
+        "key_requirements": ["Doanh thu", "Chi phí", "Lợi nhuận"],
+        "compliance_focus": "Ghi nhận doanh thu và chi phí theo nguyên tắc phù hợp"
+    },
+    "cash_flow_statement": {
+        "confidence": 0.85,
+        "regulations": "VAS 02 - Báo cáo lưu chuyển tiền tệ",
+        "key_requirements": ["Hoạt động kinh doanh", "Hoạt động đầu tư", "Hoạt động tài chính"],
+        "compliance_focus": "Phân loại và trình bày lưu chuyển tiền tệ"
+    },
+    "audit_report": {
+        "confidence": 0.95,
+        "regulations": "Chuẩn mực kiểm toán Việt Nam",
+        "key_requirements": ["Ý kiến kiểm toán", "Cơ sở ý kiến", "Trách nhiệm"],
+        "compliance_focus": "Tuân thủ chuẩn mực kiểm toán và báo cáo"
+    }
+}
+for _handling in _FINANCIAL_HANDLING.values():
+    _handling["key_requirements_lower"] = [req.lower() for req in _handling["key_requirements"]]
+
+# Model settings come from the environment and are fixed for the process, so
+# they are resolved once at import rather than on every service instantiation
+_MODEL_NAME = CONVERSATION_CHAT_MODEL_NAME or "claude-37-sonnet"
+# Handle the specific problematic model ID directly
+if _MODEL_NAME == "anthropic.claude-3-5-sonnet-20241022-v2:0":
+    _MODEL_NAME = "claude-37-sonnet"
+_BEDROCK_MODEL_ID = MODEL_MAPPING.get(_MODEL_NAME)
+if _BEDROCK_MODEL_ID is None:
+    logger.warning(f"Model {_MODEL_NAME} not found in MODEL_MAPPING, using claude-37-sonnet")
+    _BEDROCK_MODEL_ID = MODEL_MAPPING["claude-37-sonnet"]
+_TEMPERATURE = float(CONVERSATION_CHAT_TEMPERATURE or "0.6")
+_TOP_P = float(CONVERSATION_CHAT_TOP_P or "0.6")
+_MAX_TOKENS = int(LLM_MAX_TOKENS or "8192")
+
+
+@lru_cache(maxsize=4)
+def _get_bedrock_service(model_id: str, temperature: float, top_p: float, max_tokens: int) -> BedrockService:
+    # Services are created per request; they share one Bedrock client per model configuration
+    return BedrockService(
+        model_id=model_id,
+        temperature=temperature,
+        top_p=top_p,
+        max_tokens=max_tokens,
+        latency=COMPLIANCE_LATENCY_MODE,
+    )
+
 
 class ComplianceStatus(Enum):
     """Compliance validation status"""
@@ -39,36 +143,18 @@ class ComplianceValidationService:
         """Initialize the Compliance Validation Service"""
         self.bedrock_kb_client = BEDROCK_KNOWLEDGEBASE
         self.knowledge_base_id = KNOWLEDGEBASE_ID
-        self.bedrock_service = None
         self.config = ComplianceConfig()
+        self.bedrock_model_id = _BEDROCK_MODEL_ID
+        # Latency-optimized inference when the model supports it (LLM and KB generation)
+        self.latency = resolve_latency(self.bedrock_model_id, COMPLIANCE_LATENCY_MODE)
         
-        # Get model configuration
-        model_name = CONVERSATION_CHAT_MODEL_NAME or "claude-37-sonnet"
-        
-        # Handle the specific problematic model ID directly
-        if model_name == "anthropic.claude-3-5-sonnet-20241022-v2:0":
-            model_name = "claude-37-sonnet"
-        self.bedrock_model_id = MODEL_MAPPING.get(model_name, MODEL_MAPPING["claude-37-sonnet"])
-        
-        temperature = float(CONVERSATION_CHAT_TEMPERATURE or "0.6")
-        top_p = float(CONVERSATION_CHAT_TOP_P or "0.6")
-        max_tokens = int(LLM_MAX_TOKENS or "8192")
-        
-        logger.info(f"Initializing Clean Compliance Service with model: {model_name}")
+        logger.info(f"Initializing Clean Compliance Service with model: {_MODEL_NAME}")
         
         try:
-            if model_name in MODEL_MAPPING:
-                bedrock_model_id = MODEL_MAPPING[model_name]
-                self.bedrock_service = BedrockService(
-                    model_id=bedrock_model_id,
-                    temperature=temperature,
-                    top_p=top_p,
-                    max_tokens=max_tokens
-                )
-                logger.info(f"Bedrock service initialized")
-            else:
-                logger.warning(f"Model {model_name} not found in MODEL_MAPPING")
-                
+            self.bedrock_service = _get_bedrock_service(
+                self.bedrock_model_id, _TEMPERATURE, _TOP_P, _MAX_TOKENS
+            )
+            logger.info(f"Bedrock service initialized")
         except Exception as e:
             logger.error(f"Error initializing Compliance Service: {e}")
             raise
@@ -88,9 +174,14 @@ class ComplianceValidationService:
             if not ocr_text or len(ocr_text.strip()) < 50:
                 raise ValueError("Văn bản quá ngắn để kiểm tra tuân thủ")
             
+            # Classification and extraction scan a bounded window of the text,
+            # lowercased once for classification and its confidence score
+            scan_text = _scan_window(ocr_text)
+            text_lower = scan_text.lower()
+            
             # Step 1: Flexible Document Classification
             if not document_type:
-                document_type = await self._classify_document_flexible(ocr_text)
+                document_type = await asyncio.to_thread(self._classify_document_flexible, scan_text, text_lower)
             
             logger.info(f"Document classified as: {document_type}")
             
@@ -98,103 +189,211 @@ class ComplianceValidationService:
             is_trade_document = self.config.is_ucp_applicable(document_type)
             
             # Step 3: Flexible Field Extraction
-            extracted_fields = await self._extract_fields_flexible(ocr_text, document_type)
+            if is_trade_document:
+                # The regulation lookup only needs the document type, so its knowledge
+                # base round trip (started first, in a worker thread) overlaps extraction
+                ucp_regulations, extracted_fields = await asyncio.gather(
+                    self._query_ucp_regulations(document_type, {}),
+                    asyncio.to_thread(self._extract_fields_flexible, scan_text, document_type),
+                )
+            else:
+                extracted_fields = await asyncio.to_thread(self._extract_fields_flexible, scan_text, document_type)
             
             # Step 4: Handle based on document type
             if is_trade_document:
                 # Apply UCP 600 validation
-                ucp_regulations = await self._query_ucp_regulations(document_type, extracted_fields)
                 compliance_result = await self._validate_against_ucp(
                     ocr_text, document_type, extracted_fields, ucp_regulations
                 )
             else:
                 # Handle non-trade documents
-                ucp_regulations = {"regulations_summary": f"Tài liệu loại '{document_type}' không thuộc phạm vi áp dụng UCP 600"}
+                ucp_regulations = self._non_trade_regulations(document_type)
                 compliance_result = self._handle_non_trade_document(document_type, extracted_fields)
             
-            processing_time = time.time() - start_time
+            return self._build_validation_result(
+                ocr_text, text_lower, document_type, is_trade_document,
+                extracted_fields, ucp_regulations, compliance_result, start_time
+            )
             
-            # Enhance violations with regulation references
-            enhanced_violations = self._enhance_violations_with_references(
-                compliance_result.get("violations", []), 
-                document_type
+        except Exception as e:
+            logger.error(f"Error in flexible compliance validation: {e}")
+            return self._build_error_result(document_type, e, start_time if 'start_time' in locals() else None)
+
+    async def validate_documents_batch(
+        self,
+        documents: List[Tuple[str, Optional[str]]],
+        limiter: Optional[ConcurrencyLimiter] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate several (ocr_text, document_type) pairs. Regulations are looked up
+        once per document type, and trade documents are checked COMPLIANCE_BATCH_SIZE
+        at a time in a single Bedrock prompt instead of one call each.
+        Each knowledge base or Bedrock call holds its own ``limiter`` slot, so a
+        large batch queues behind the limit instead of fanning out past it.
+        Results are in input order, shaped like validate_document_compliance's
+        """
+        start_time = time.time()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(documents)
+        prepared = []  # (index, text, text_lower, document_type, is_trade, fields)
+        
+        for index, (ocr_text, document_type) in enumerate(documents):
+            try:
+                if not ocr_text or len(ocr_text.strip()) < 50:
+                    raise ValueError("Văn bản quá ngắn để kiểm tra tuân thủ")
+                scan_text = _scan_window(ocr_text)
+                text_lower = scan_text.lower()
+                if not document_type:
+                    document_type = await asyncio.to_thread(self._classify_document_flexible, scan_text, text_lower)
+                is_trade_document = self.config.is_ucp_applicable(document_type)
+                extracted_fields = await asyncio.to_thread(self._extract_fields_flexible, scan_text, document_type)
+                prepared.append((index, ocr_text, text_lower, document_type, is_trade_document, extracted_fields))
+            except Exception as e:
+                logger.error(f"Error preparing document {index} for batch validation: {e}")
+                results[index] = self._build_error_result(document_type, e, start_time)
+        
+        # One knowledge base lookup per trade document type
+        trade_types = list(dict.fromkeys(doc[3] for doc in prepared if doc[4]))
+        regulations_by_type = dict(zip(
+            trade_types,
+            await asyncio.gather(*(
+                _limited(limiter, partial(self._query_ucp_regulations, doc_type, {})) for doc_type in trade_types
+            ))
+        ))
+        
+        trade_docs = [doc for doc in prepared if doc[4]]
+        chunks = [trade_docs[i:i + COMPLIANCE_BATCH_SIZE] for i in range(0, len(trade_docs), COMPLIANCE_BATCH_SIZE)]
+        chunk_results = await asyncio.gather(*(
+            self._validate_batch_against_ucp(
+                [(text, doc_type, fields, regulations_by_type[doc_type]) for _, text, _, doc_type, _, fields in chunk],
+                limiter
             )
+            for chunk in chunks
+        ))
+        compliance_by_index = {
+            doc[0]: compliance_result
+            for chunk, compliance_results in zip(chunks, chunk_results)
+            for doc, compliance_result in zip(chunk, compliance_results)
+        }
+        
+        for index, ocr_text, text_lower, document_type, is_trade_document, extracted_fields in prepared:
+            try:
+                if is_trade_document:
+                    ucp_regulations = regulations_by_type[document_type]
+                    compliance_result = compliance_by_index[index]
+                else:
+                    ucp_regulations = self._non_trade_regulations(document_type)
+                    compliance_result = self._handle_non_trade_document(document_type, extracted_fields)
+                results[index] = self._build_validation_result(
+                    ocr_text, text_lower, document_type, is_trade_document,
+                    extracted_fields, ucp_regulations, compliance_result, start_time
+                )
+            except Exception as e:
+                logger.error(f"Error in batch compliance validation for document {index}: {e}")
+                results[index] = self._build_error_result(document_type, e, start_time)
+        
+        return results
+
+    def _non_trade_regulations(self, document_type: str) -> Dict[str, Any]:
+        return {"regulations_summary": f"Tài liệu loại '{document_type}' không thuộc phạm vi áp dụng UCP 600"}
+
+    def _build_validation_result(
+        self,
+        ocr_text: str,
+        text_lower: str,
+        document_type: str,
+        is_trade_document: bool,
+        extracted_fields: Dict[str, Any],
+        ucp_regulations: Dict[str, Any],
+        compliance_result: Dict[str, Any],
+        start_time: float
+    ) -> Dict[str, Any]:
+        """Assemble the validation report for one document"""
+        processing_time = time.time() - start_time
+        
+        # Enhance violations with regulation references, counting severities in the same pass
+        enhanced_violations, severity_counts = self._enhance_violations_with_references(
+            compliance_result.get("violations", []), 
+            document_type
+        )
+        
+        # Category, regulations and required fields in one lookup
+        document_meta = self.config.get_document_metadata(document_type)
+        
+        # Prepare enhanced final result with detailed report
+        result = {
+            "compliance_status": compliance_result["status"].value,
+            "confidence_score": compliance_result["confidence"],
+            "document_type": document_type,
+            "is_trade_document": is_trade_document,
+            "extracted_fields": extracted_fields,
+            "ucp_regulations_applied": ucp_regulations.get("regulations_summary", ""),
+            "violations": enhanced_violations,  # Use enhanced violations
+            "recommendations": compliance_result.get("recommendations", []),
+            "processing_time": round(processing_time, 2),
+            "timestamp": time.time(),
+            "knowledge_base_used": self.knowledge_base_id,
             
-            # Prepare enhanced final result with detailed report
-            result = {
-                "compliance_status": compliance_result["status"].value,
-                "confidence_score": compliance_result["confidence"],
-                "document_type": document_type,
-                "is_trade_document": is_trade_document,
-                "extracted_fields": extracted_fields,
-                "ucp_regulations_applied": ucp_regulations.get("regulations_summary", ""),
-                "violations": enhanced_violations,  # Use enhanced violations
-                "recommendations": compliance_result.get("recommendations", []),
-                "processing_time": round(processing_time, 2),
-                "timestamp": time.time(),
-                "knowledge_base_used": self.knowledge_base_id,
-                
-                # Enhanced report sections
-                "document_analysis": {
-                    "classification_confidence": self._get_classification_confidence(document_type, ocr_text),
-                    "document_category": self._get_document_category(document_type),
-                    "applicable_regulations": self._get_applicable_regulations(document_type),
-                    "required_fields": self._get_required_fields(document_type),
-                    "field_completeness": self._calculate_field_completeness(document_type, extracted_fields)
-                },
-                
-                "compliance_summary": {
-                    "overall_status": compliance_result["status"].value,
-                    "critical_issues": len([v for v in compliance_result.get("violations", []) if v.get("severity") == "HIGH"]),
-                    "warnings": len([v for v in compliance_result.get("violations", []) if v.get("severity") == "MEDIUM"]),
-                    "info_notes": len([v for v in compliance_result.get("violations", []) if v.get("severity") in ["LOW", "INFO"]]),
-                    "action_required": self._determine_action_required(compliance_result)
-                },
-                
-                "processing_details": {
-                    "text_length": len(ocr_text),
-                    "fields_extracted": len(extracted_fields),
-                    "kb_query_performed": is_trade_document,
-                    "ai_validation_used": is_trade_document,
-                    "processing_method": "ucp_validation" if is_trade_document else "non_trade_handling"
-                }
-            }
+            # Enhanced report sections
+            "document_analysis": {
+                "classification_confidence": self._get_classification_confidence(document_type, ocr_text, text_lower),
+                "document_category": document_meta["category"],
+                "applicable_regulations": document_meta["regulations"],
+                "required_fields": document_meta["required_fields"],
+                "field_completeness": self._calculate_field_completeness(document_type, extracted_fields)
+            },
             
-            logger.info(f"Flexible compliance validation completed: {result['compliance_status']} in {processing_time:.2f}s")
-            return result
+            "compliance_summary": {
+                "overall_status": compliance_result["status"].value,
+                "critical_issues": severity_counts["HIGH"],
+                "warnings": severity_counts["MEDIUM"],
+                "info_notes": severity_counts["LOW"] + severity_counts["INFO"],
+                "action_required": self._determine_action_required(compliance_result, severity_counts)
+            },
             
-        except Exception as e:
-            logger.error(f"Error in flexible compliance validation: {e}")
-            return {
-                "compliance_status": ComplianceStatus.INSUFFICIENT_DATA.value,
-                "confidence_score": 0.0,
-                "document_type": document_type or "unknown",
-                "is_trade_document": False,
-                "error": str(e),
-                "processing_time": time.time() - start_time if 'start_time' in locals() else 0,
-                "timestamp": time.time()
+            "processing_details": {
+                "text_length": len(ocr_text),
+                "fields_extracted": len(extracted_fields),
+                "kb_query_performed": is_trade_document,
+                "ai_validation_used": is_trade_document,
+                "processing_method": "ucp_validation" if is_trade_document else "non_trade_handling"
             }
+        }
+        
+        logger.info(f"Flexible compliance validation completed: {result['compliance_status']} in {processing_time:.2f}s")
+        return result
 
-    async def _classify_document_flexible(self, text: str) -> str:
-        """Flexible document classification using configurable patterns"""
+    def _build_error_result(self, document_type: Optional[str], error: Exception, start_time: Optional[float]) -> Dict[str, Any]:
+        return {
+            "compliance_status": ComplianceStatus.INSUFFICIENT_DATA.value,
+            "confidence_score": 0.0,
+            "document_type": document_type or "unknown",
+            "is_trade_document": False,
+            "error": str(error),
+            "processing_time": time.time() - start_time if start_time is not None else 0,
+            "timestamp": time.time()
+        }
+
+    def _classify_document_flexible(self, text: str, text_lower: Optional[str] = None) -> str:
+        """Flexible document classification using configurable patterns (CPU-bound: callers run it in a worker thread)"""
         try:
-            text_lower = text.lower()
+            if text_lower is None:
+                text_lower = text.lower()
             classification_scores = {}
             
+            # Keyword matching for every document type in one pass
+            keyword_hits = self.config.keyword_hits(text_lower)
+            # Document types with any pattern match, found in one pass
+            pattern_hits = self.config.classifier_gate(text_lower)
+            
             # Score each document type based on keywords and patterns
-            for doc_type, config in self.config.DOCUMENT_PATTERNS.items():
-                score = 0
-                weight = config.get("weight", 1.0)
+            for doc_type, weight, _, patterns in self.config.CLASSIFIERS:
+                score = keyword_hits[doc_type]
                 
-                # Keyword matching
-                for keyword in config["keywords"]:
-                    if keyword.lower() in text_lower:
-                        score += 1
-                
-                # Pattern matching (higher weight)
-                for pattern in config["patterns"]:
-                    matches = re.findall(pattern, text_lower, re.IGNORECASE)
-                    score += len(matches) * 2  # Patterns have higher weight
+                # Pattern matching (higher weight), skipped when no pattern matches
+                if doc_type in pattern_hits:
+                    for pattern in patterns:
+                        matches = pattern.findall(text_lower)
+                        score += len(matches) * 2  # Patterns have higher weight
                 
                 # Apply document type weight
                 if score > 0:
@@ -213,51 +412,41 @@ class ComplianceValidationService:
             logger.error(f"Error in flexible document classification: {e}")
             return "unknown"
 
-    async def _extract_fields_flexible(self, text: str, document_type: str) -> Dict[str, Any]:
-        """Flexible field extraction using configurable patterns"""
+    def _extract_fields_flexible(self, text: str, document_type: str) -> Dict[str, Any]:
+        """Flexible field extraction using configurable patterns (CPU-bound: callers run it in a worker thread)"""
         try:
             fields = {}
             
             # Extract common fields using configurable patterns
-            for field_type, patterns in self.config.FIELD_PATTERNS.items():
-                extracted_values = []
+            for field_type in self.config.FIELD_PATTERNS:
+                if not self.config.FUSED_FIELD_PATTERNS[field_type].search(text):
+                    continue
                 
-                for pattern in patterns:
-                    matches = re.findall(pattern, text, re.IGNORECASE)
-                    for match in matches:
-                        if isinstance(match, tuple):
-                            # Handle tuple matches (multiple groups)
-                            if field_type == "dates":
-                                # Reconstruct date from tuple
-                                date_parts = [str(x) for x in match if str(x).isdigit()]
-                                if len(date_parts) >= 3:
-                                    date_str = '/'.join(date_parts[:3])
-                                    extracted_values.append(date_str)
-                            elif field_type == "amounts":
-                                # Reconstruct amount from tuple
-                                amount_str = ' '.join(str(x) for x in match if str(x).strip())
-                                extracted_values.append(amount_str)
-                            elif field_type == "reference_numbers":
-                                # Take the actual number part
-                                if len(match) >= 2:
-                                    ref_type = match[0].strip()
-                                    ref_number = match[1].strip()
-                                    extracted_values.append(f"{ref_type}: {ref_number}")
-                        else:
-                            extracted_values.append(str(match).strip())
+                # Unique values in match order; scanning stops once the cap is reached
+                unique_values = {}
+                for pattern in self.config.iter_compiled(field_type):
+                    for match in pattern.finditer(text):
+                        value = self._field_match_value(match, field_type)
+                        if value is not None:
+                            unique_values[value] = None
+                            if len(unique_values) >= _MAX_FIELD_VALUES:
+                                break
+                    if len(unique_values) >= _MAX_FIELD_VALUES:
+                        break
                 
-                # Store unique values, limit to reasonable number
-                if extracted_values:
-                    unique_values = list(dict.fromkeys(extracted_values))  # Preserve order, remove duplicates
-                    fields[field_type] = unique_values[:5]  # Limit to 5 items
+                if unique_values:
+                    fields[field_type] = list(unique_values)
             
             # Extract document-specific fields
-            if document_type in self.config.DOCUMENT_SPECIFIC_FIELDS:
-                specific_patterns = self.config.DOCUMENT_SPECIFIC_FIELDS[document_type]
+            if document_type in self.config.COMPILED_DOCUMENT_SPECIFIC_FIELDS:
+                specific_patterns = self.config.COMPILED_DOCUMENT_SPECIFIC_FIELDS[document_type]
+                fused_patterns = self.config.FUSED_DOCUMENT_SPECIFIC_FIELDS[document_type]
                 
                 for field_name, patterns in specific_patterns.items():
+                    if not fused_patterns[field_name].search(text):
+                        continue
                     for pattern in patterns:
-                        match = re.search(pattern, text, re.IGNORECASE)
+                        match = pattern.search(text)
                         if match:
                             # Take the last group (actual content)
                             #field_value = match.group(-1).strip()
@@ -278,6 +467,26 @@ class ComplianceValidationService:
             logger.error(f"Error in flexible field extraction: {e}")
             return {}
 
+    def _field_match_value(self, match: re.Match, field_type: str) -> Optional[str]:
+        """Value for one common-field match (as findall would report it), or None to skip it"""
+        groups = match.groups(default='')
+        if len(groups) <= 1:
+            return (groups[0] if groups else match.group(0)).strip()
+        
+        # Handle tuple matches (multiple groups)
+        if field_type == "dates":
+            # Reconstruct date from tuple
+            date_parts = [x for x in groups if x.isdigit()]
+            if len(date_parts) >= 3:
+                return '/'.join(date_parts[:3])
+        elif field_type == "amounts":
+            # Reconstruct amount from tuple
+            return ' '.join(x for x in groups if x.strip())
+        elif field_type == "reference_numbers":
+            # Take the actual number part
+            return f"{groups[0].strip()}: {groups[1].strip()}"
+        return None
+
     async def query_regulations_directly(self, query: str) -> Dict[str, Any]:
         """Direct query to UCP 600 knowledge base"""
         try:
@@ -290,8 +499,9 @@ class ComplianceValidationService:
             # Build UCP-specific query
             enhanced_query = self._build_ucp_query(query)
             
-            # Query knowledge base
-            response = self.bedrock_kb_client.retrieve_and_generate(
+            # Query knowledge base (boto3 is blocking - keep it off the event loop)
+            response = await asyncio.to_thread(
+                self.bedrock_kb_client.retrieve_and_generate,
                 input={"text": enhanced_query},
                 retrieveAndGenerateConfiguration={
                     "knowledgeBaseConfiguration": {
@@ -302,7 +512,8 @@ class ComplianceValidationService:
                                 "numberOfResults": 10,
                                 "overrideSearchType": "HYBRID"
                             }
-                        }
+                        },
+                        **self._kb_generation_configuration(),
                     },
                     "type": "KNOWLEDGE_BASE",
                 },
@@ -370,40 +581,16 @@ class ComplianceValidationService:
     def _handle_financial_document(self, document_type: str, fields: Dict[str, Any]) -> Dict[str, Any]:
         """Handle specific financial document types"""
         
-        financial_handling = {
-            "balance_sheet": {
-                "confidence": 0.9,
-                "regulations": "VAS 01 - Trình bày báo cáo tài chính",
-                "key_requirements": ["Tổng tài sản", "Tổng nợ phải trả", "Vốn chủ sở hữu"],
-                "compliance_focus": "Cấu trúc và phân loại tài sản, nợ phải trả"
-            },
-            "income_statement": {
-                "confidence": 0.9,
-                "regulations": "VAS 01 - Báo cáo kết quả kinh doanh",
-                "key_requirements": ["Doanh thu", "Chi phí", "Lợi nhuận"],
-                "compliance_focus": "Ghi nhận doanh thu và chi phí theo nguyên tắc phù hợp"
-            },
-            "cash_flow_statement": {
-                "confidence": 0.85,
-                "regulations": "VAS 02 - Báo cáo lưu chuyển tiền tệ",
-                "key_requirements": ["Hoạt động kinh doanh", "Hoạt động đầu tư", "Hoạt động tài chính"],
-                "compliance_focus": "Phân loại và trình bày lưu chuyển tiền tệ"
-            },
-            "audit_report": {
-                "confidence": 0.95,
-                "regulations": "Chuẩn mực kiểm toán Việt Nam",
-                "key_requirements": ["Ý kiến kiểm toán", "Cơ sở ý kiến", "Trách nhiệm"],
-                "compliance_focus": "Tuân thủ chuẩn mực kiểm toán và báo cáo"
-            }
-        }
+        config = _FINANCIAL_HANDLING.get(document_type, _FINANCIAL_HANDLING["balance_sheet"])
         
-        config = financial_handling.get(document_type, financial_handling.get("balance_sheet"))
-        
-        # Check field completeness
-        missing_fields = []
-        for req_field in config["key_requirements"]:
-            if not any(req_field.lower() in str(v).lower() for v in fields.values()):
-                missing_fields.append(req_field)
+        # Check field completeness: one substring test per requirement against all
+        # values (NUL-separated, so a requirement cannot straddle two values)
+        values_lower = "\0".join(str(v).lower() for v in fields.values())
+        missing_fields = [
+            req_field
+            for req_field, req_lower in zip(config["key_requirements"], config["key_requirements_lower"])
+            if req_lower not in values_lower
+        ]
         
         violations = []
         recommendations = []
@@ -448,6 +635,12 @@ class ComplianceValidationService:
         }
 
     # Helper methods (keeping existing implementation)
+    def _kb_generation_configuration(self) -> Dict[str, Any]:
+        """Knowledge base generation options; empty unless latency-optimized inference applies"""
+        if self.latency != "optimized":
+            return {}
+        return {"generationConfiguration": {"performanceConfig": {"latency": "optimized"}}}
+
     async def _query_ucp_regulations(self, document_type: str, fields: Dict[str, Any]) -> Dict[str, Any]:
         """Query relevant UCP 600 regulations"""
         try:
@@ -457,26 +650,40 @@ class ComplianceValidationService:
             # Build query based on document type
             query = self._build_regulation_query(document_type, fields)
             
-            response = self.bedrock_kb_client.retrieve_and_generate(
-                input={"text": query},
-                retrieveAndGenerateConfiguration={
-                    "knowledgeBaseConfiguration": {
-                        "knowledgeBaseId": self.knowledge_base_id,
-                        "modelArn": self.bedrock_model_id,
-                    },
-                    "type": "KNOWLEDGE_BASE",
-                },
-            )
+            cache_key = (self.knowledge_base_id, self.bedrock_model_id, query)
+            regulations = regulation_cache.get(cache_key)
+            if regulations is not None:
+                return regulations
             
-            return {
-                "regulations_summary": response.get('output', {}).get('text', ''),
-                "citations": response.get('citations', [])
-            }
+            regulations = await _REGULATION_FLIGHTS.do(cache_key, lambda: self._retrieve_regulations(query))
+            # Failed lookups raise, so only real answers are cached
+            regulation_cache.put(cache_key, regulations)
+            return regulations
             
         except Exception as e:
             logger.error(f"Error querying UCP regulations: {e}")
             return {"regulations_summary": f"Error querying regulations: {str(e)}"}
 
+    async def _retrieve_regulations(self, query: str) -> Dict[str, Any]:
+        """Run a regulation query against the knowledge base"""
+        response = await asyncio.to_thread(
+            self.bedrock_kb_client.retrieve_and_generate,
+            input={"text": query},
+            retrieveAndGenerateConfiguration={
+                "knowledgeBaseConfiguration": {
+                    "knowledgeBaseId": self.knowledge_base_id,
+                    "modelArn": self.bedrock_model_id,
+                    **self._kb_generation_configuration(),
+                },
+                "type": "KNOWLEDGE_BASE",
+            },
+        )
+        
+        return {
+            "regulations_summary": response.get('output', {}).get('text', ''),
+            "citations": response.get('citations', [])
+        }
+
     async def _validate_against_ucp(
         self, 
         text: str, 
@@ -492,9 +699,8 @@ class ComplianceValidationService:
             # Build validation prompt
             validation_prompt = self._build_validation_prompt(text, document_type, fields, regulations)
             
-            # Get AI validation
-            response = await self.bedrock_service.ai_ainvoke(validation_prompt)
-            validation_text = self._extract_response_content(response)
+            # Get AI validation, streamed so reading stops once the verdict object closes
+            validation_text = await self._stream_validation_reply(validation_prompt)
             
             # Parse validation result
             return self._parse_validation_result(validation_text)
@@ -508,6 +714,71 @@ class ComplianceValidationService:
                 "recommendations": [{"description": f"Lỗi kiểm tra: {str(e)}"}]
             }
 
+    async def _validate_batch_against_ucp(
+        self,
+        items: List[Tuple[str, str, Dict[str, Any], Dict[str, Any]]],
+        limiter: Optional[ConcurrencyLimiter] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate (text, document_type, fields, regulations) items in one AI call.
+        Items the reply leaves out or garbles are validated on their own; every
+        Bedrock call, retries included, takes its own ``limiter`` slot
+        """
+        if len(items) == 1:
+            return [await _limited(limiter, partial(self._validate_against_ucp, *items[0]))]
+        
+        # Slot taken outside the try so a queue timeout (503) reaches the route
+        async with _limiter_slot(limiter):
+            try:
+                if not self.bedrock_service:
+                    raise ValueError("Bedrock service not available")
+                
+                validation_prompt = self._build_batch_validation_prompt(items)
+                response = await self.bedrock_service.ai_ainvoke(validation_prompt)
+                results = self._parse_batch_validation_result(self._extract_response_content(response), len(items))
+                
+            except Exception as e:
+                logger.error(f"Error in batch UCP validation: {e}")
+                return [
+                    {
+                        "status": ComplianceStatus.INSUFFICIENT_DATA,
+                        "confidence": 0.0,
+                        "violations": [],
+                        "recommendations": [{"description": f"Lỗi kiểm tra: {str(e)}"}]
+                    }
+                    for _ in items
+                ]
+        
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing:
+            logger.warning(f"Batch validation reply missing {len(missing)} of {len(items)} documents, validating them individually")
+            retried = await asyncio.gather(*(
+                _limited(limiter, partial(self._validate_against_ucp, *items[index])) for index in missing
+            ))
+            for index, result in zip(missing, retried):
+                results[index] = result
+        return results
+
+    async def _stream_validation_reply(self, prompt: str) -> str:
+        """
+        Stream a validation reply and return its JSON verdict as soon as the
+        object is complete; the whole text if no complete object arrives
+        """
+        scanner = JsonObjectScanner()
+        stream = self.bedrock_service.ai_astream(prompt, max_tokens=COMPLIANCE_VALIDATION_MAX_TOKENS)
+        async with aclosing(stream):
+            async for chunk in stream:
+                verdict = scanner.feed(self.bedrock_service.ai_chunk_stream(chunk))
+                while verdict is not None:
+                    try:
+                        orjson.loads(verdict)
+                    except ValueError:
+                        # Not the verdict (e.g. a brace in leading prose): keep scanning
+                        verdict = scanner.feed()
+                        continue
+                    return verdict
+        return scanner.text
+
     def _build_ucp_query(self, query: str) -> str:
         """Build enhanced query for UCP 600"""
         return f"""
@@ -556,7 +827,7 @@ Bạn là chuyên gia kiểm tra tuân thủ UCP 600. Hãy phân tích tài li
 LOẠI TÀI LIỆU: {document_type}
 
 THÔNG TIN TRÍCH XUẤT:
-{json.dumps(fields, ensure_ascii=False, indent=2)}
+{orjson.dumps(fields, option=orjson.OPT_INDENT_2).decode()}
 
 QUY ĐỊNH UCP 600 LIÊN QUAN:
 {regulations.get('regulations_summary', 'Không có quy định cụ thể')}
@@ -584,14 +855,90 @@ Hãy đánh giá tuân thủ và trả lời theo format JSON:
 }}
 """
 
+    def _build_batch_validation_prompt(
+        self,
+        items: List[Tuple[str, str, Dict[str, Any], Dict[str, Any]]]
+    ) -> str:
+        """Build one prompt asking for a compliance verdict per document"""
+        sections = "\n".join(
+            f"""
+=== TÀI LIỆU id={index} ===
+LOẠI TÀI LIỆU: {document_type}
+
+THÔNG TIN TRÍCH XUẤT:
+{orjson.dumps(fields, option=orjson.OPT_INDENT_2).decode()}
+
+QUY ĐỊNH UCP 600 LIÊN QUAN:
+{regulations.get('regulations_summary', 'Không có quy định cụ thể')}
+
+NỘI DUNG TÀI LIỆU:
+{text[:2000]}...
+"""
+            for index, (text, document_type, fields, regulations) in enumerate(items)
+        )
+        return f"""
+Bạn là chuyên gia kiểm tra tuân thủ UCP 600. Hãy phân tích từng tài liệu sau một cách độc lập:
+{sections}
+Hãy đánh giá tuân thủ của từng tài liệu và trả lời bằng một mảng JSON, mỗi phần tử ứng với một tài liệu (giữ nguyên id):
+[
+    {{
+        "id": 0,
+        "status": "COMPLIANT/NON_COMPLIANT/REQUIRES_REVIEW",
+        "confidence": 0.85,
+        "violations": [
+            {{
+                "type": "Missing Information",
+                "description": "Thiếu thông tin bắt buộc",
+                "severity": "HIGH"
+            }}
+        ],
+        "recommendations": [
+            {{
+                "description": "Khuyến nghị cụ thể",
+                "priority": "HIGH"
+            }}
+        ]
+    }}
+]
+"""
+
+    def _parse_batch_validation_result(self, validation_text: str, count: int) -> List[Optional[Dict[str, Any]]]:
+        """Parse a batched AI validation reply into per-document results (None where unusable)"""
+        results: List[Optional[Dict[str, Any]]] = [None] * count
+        # The first balanced [...] that is a JSON array; prose brackets are skipped
+        entries = None
+        for candidate in iter_json_arrays(validation_text):
+            try:
+                parsed = orjson.loads(candidate)
+            except ValueError:
+                continue
+            if isinstance(parsed, list):
+                entries = parsed
+                break
+        if entries is None:
+            logger.error("Error parsing batch validation result: no JSON array in reply")
+            return results
+        
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            index = entry.pop("id", None)
+            if not isinstance(index, int) or not 0 <= index < count or "confidence" not in entry:
+                continue
+            try:
+                entry["status"] = ComplianceStatus(entry.get("status", "INSUFFICIENT_DATA"))
+            except ValueError:
+                continue
+            results[index] = entry
+        return results
+
     def _parse_validation_result(self, validation_text: str) -> Dict[str, Any]:
         """Parse AI validation result"""
         try:
             # Try to extract JSON from response
-            json_match = re.search(r'\{.*\}', validation_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(0)
-                result = json.loads(json_str)
+            json_str = find_json_object(validation_text)
+            if json_str:
+                result = orjson.loads(json_str)
                 
                 # Convert status string to enum
                 status_str = result.get("status", "INSUFFICIENT_DATA")
@@ -620,42 +967,44 @@ Hãy đánh giá tuân thủ và trả lời theo format JSON:
             'suggestion': suggestion
         }
 
-    def _enhance_violations_with_references(self, violations: List[Dict], document_type: str) -> List[Dict]:
-        """Enhance violations with regulation references"""
+    def _enhance_violations_with_references(self, violations: List[Dict], document_type: str) -> Tuple[List[Dict], Counter]:
+        """
+        Enhance violations with regulation references; also returns the count of
+        each severity as reported by the model (before MEDIUM is filled in)
+        """
         enhanced_violations = []
+        severity_counts = Counter()
+        is_letter_of_credit = document_type in _LC_DOCUMENT_TYPES
         
         for violation in violations:
+            severity_counts[violation.get('severity')] += 1
             enhanced_violation = violation.copy()
+            needs_suggestion = not enhanced_violation.get('suggestion')
+            
+            # One keyword match per violation serves both the reference and the suggestion
+            reference = suggestion = None
+            if is_letter_of_credit or needs_suggestion:
+                description = violation.get('description', '').lower()
+                _, reference, suggestion = next(
+                    (rule for rule in _VIOLATION_RULES if rule[0] in description),
+                    _GENERAL_VIOLATION_RULE,
+                )
             
             # Add regulation reference based on violation type and document type
-            if document_type in ['letter_of_credit', 'standby_letter_of_credit']:
-                if 'missing' in violation.get('description', '').lower():
-                    enhanced_violation['regulation_reference'] = 'UCP 600 Article 14(a) - Document Examination'
-                elif 'discrepancy' in violation.get('description', '').lower():
-                    enhanced_violation['regulation_reference'] = 'UCP 600 Article 16 - Discrepant Documents'
-                elif 'expiry' in violation.get('description', '').lower():
-                    enhanced_violation['regulation_reference'] = 'UCP 600 Article 6 - Availability, Expiry Date'
-                elif 'amount' in violation.get('description', '').lower():
-                    enhanced_violation['regulation_reference'] = 'UCP 600 Article 18 - Commercial Invoice'
-                else:
-                    enhanced_violation['regulation_reference'] = 'UCP 600 - General Compliance'
+            if is_letter_of_credit:
+                enhanced_violation['regulation_reference'] = reference
             
             # Add severity if not present
             if 'severity' not in enhanced_violation:
                 enhanced_violation['severity'] = 'MEDIUM'
             
             # Add suggestion based on violation type
-            if not enhanced_violation.get('suggestion'):
-                if 'missing' in violation.get('description', '').lower():
-                    enhanced_violation['suggestion'] = 'Bổ sung thông tin thiếu trong tài liệu'
-                elif 'discrepancy' in violation.get('description', '').lower():
-                    enhanced_violation['suggestion'] = 'Kiểm tra và sửa chữa các sai lệch trong tài liệu'
-                elif 'expiry' in violation.get('description', '').lower():
-                    enhanced_violation['suggestion'] = 'Kiểm tra ngày hết hạn và thời gian trình bày'
+            if needs_suggestion and suggestion:
+                enhanced_violation['suggestion'] = suggestion
             
             enhanced_violations.append(enhanced_violation)
         
-        return enhanced_violations
+        return enhanced_violations, severity_counts
 
     def _fallback_parse_validation(self, text: str) -> Dict[str, Any]:
         """Fallback validation parsing"""
@@ -728,18 +1077,19 @@ Hãy đánh giá tuân thủ và trả lời theo format JSON:
         except:
             return 0.5
 
-    def _get_classification_confidence(self, document_type: str, text: str) -> float:
+    def _get_classification_confidence(self, document_type: str, text: str, text_lower: Optional[str] = None) -> float:
         """Calculate classification confidence based on pattern matches"""
         try:
             if document_type not in self.config.DOCUMENT_PATTERNS:
                 return 0.5
             
             config = self.config.DOCUMENT_PATTERNS[document_type]
-            text_lower = text.lower()
+            if text_lower is None:
+                text_lower = text.lower()
             
-            keyword_matches = sum(1 for keyword in config["keywords"] if keyword.lower() in text_lower)
-            pattern_matches = sum(len(re.findall(pattern, text_lower, re.IGNORECASE)) 
-                                for pattern in config["patterns"])
+            keyword_matches = self.config.keyword_hits(text_lower)[document_type]
+            pattern_matches = sum(len(pattern.findall(text_lower))
+                                for pattern in self.config.COMPILED_DOCUMENT_PATTERNS[document_type])
             
             total_possible = len(config["keywords"]) + len(config["patterns"])
             actual_matches = keyword_matches + pattern_matches
@@ -753,129 +1103,15 @@ Hãy đánh giá tuân thủ và trả lời theo format JSON:
 
     def _get_document_category(self, document_type: str) -> Dict[str, Any]:
         """Get document category information"""
-        categories = {
-            "commercial_invoice": {
-                "category": "Trade Document",
-                "subcategory": "Commercial Documentation",
-                "business_purpose": "Invoice for goods sold in international trade"
-            },
-            "letter_of_credit": {
-                "category": "Trade Document", 
-                "subcategory": "Payment Instrument",
-                "business_purpose": "Bank guarantee for international trade payment"
-            },
-            "bill_of_lading": {
-                "category": "Trade Document",
-                "subcategory": "Transport Documentation", 
-                "business_purpose": "Receipt and contract for cargo transportation"
-            },
-            "bank_guarantee": {
-                "category": "Trade Document",
-                "subcategory": "Financial Guarantee",
-                "business_purpose": "Bank assurance for contract performance"
-            },
-            "insurance_certificate": {
-                "category": "Trade Document",
-                "subcategory": "Risk Management",
-                "business_purpose": "Insurance coverage for traded goods"
-            },
-            "financial_report": {
-                "category": "Financial Document",
-                "subcategory": "Corporate Reporting",
-                "business_purpose": "Financial performance and position reporting"
-            },
-            "contract": {
-                "category": "Legal Document",
-                "subcategory": "Commercial Agreement", 
-                "business_purpose": "Legal agreement between parties"
-            }
-        }
-        
-        return categories.get(document_type, {
-            "category": "General Document",
-            "subcategory": "Unclassified",
-            "business_purpose": "Document purpose not determined"
-        })
+        return self.config.get_document_metadata(document_type)["category"]
 
     def _get_applicable_regulations(self, document_type: str) -> List[Dict[str, Any]]:
         """Get applicable regulations for document type"""
-        if document_type in self.config.UCP_APPLICABLE_DOCUMENTS:
-            ucp_articles = self.config.DOCUMENT_TYPE_DEFINITIONS.get(document_type, {}).get("ucp_articles", [])
-            return [
-                {
-                    "regulation": "UCP 600",
-                    "full_name": "Uniform Customs and Practice for Documentary Credits",
-                    "applicable_articles": ucp_articles,
-                    "mandatory": True,
-                    "scope": "International trade finance"
-                }
-            ]
-        elif document_type == "financial_report":
-            return [
-                {
-                    "regulation": "VAS/IFRS",
-                    "full_name": "Vietnamese Accounting Standards / International Financial Reporting Standards",
-                    "applicable_articles": ["VAS 01", "VAS 21", "IFRS 1"],
-                    "mandatory": True,
-                    "scope": "Financial reporting standards"
-                }
-            ]
-        elif document_type == "contract":
-            return [
-                {
-                    "regulation": "Civil Code",
-                    "full_name": "Vietnamese Civil Code",
-                    "applicable_articles": ["Article 385-420"],
-                    "mandatory": True,
-                    "scope": "Contract law"
-                }
-            ]
-        else:
-            return [
-                {
-                    "regulation": "General Business Law",
-                    "full_name": "Vietnamese Enterprise Law",
-                    "applicable_articles": [],
-                    "mandatory": False,
-                    "scope": "General business operations"
-                }
-            ]
+        return self.config.get_document_metadata(document_type)["regulations"]
 
     def _get_required_fields(self, document_type: str) -> Dict[str, Any]:
         """Get required fields for document type"""
-        required_fields = {
-            "commercial_invoice": {
-                "mandatory": ["invoice_number", "date", "seller", "buyer", "goods_description", "amount"],
-                "optional": ["payment_terms", "shipping_terms", "lc_reference"],
-                "ucp_specific": ["invoice_number", "goods_description", "amount"]
-            },
-            "letter_of_credit": {
-                "mandatory": ["lc_number", "issue_date", "expiry_date", "applicant", "beneficiary", "amount"],
-                "optional": ["available_with", "documents_required", "latest_shipment"],
-                "ucp_specific": ["lc_number", "expiry_date", "amount", "documents_required"]
-            },
-            "bill_of_lading": {
-                "mandatory": ["bl_number", "date", "shipper", "consignee", "vessel", "port_loading", "port_discharge"],
-                "optional": ["notify_party", "freight_terms", "container_numbers"],
-                "ucp_specific": ["bl_number", "on_board_date", "clean_receipt"]
-            },
-            "financial_report": {
-                "mandatory": ["entity_name", "report_period", "total_assets", "total_liabilities", "equity"],
-                "optional": ["auditor_opinion", "comparative_figures", "notes"],
-                "ucp_specific": []
-            },
-            "contract": {
-                "mandatory": ["contract_number", "parties", "subject_matter", "consideration", "terms"],
-                "optional": ["governing_law", "dispute_resolution", "termination_clause"],
-                "ucp_specific": []
-            }
-        }
-        
-        return required_fields.get(document_type, {
-            "mandatory": [],
-            "optional": [],
-            "ucp_specific": []
-        })
+        return self.config.get_document_metadata(document_type)["required_fields"]
 
     def _calculate_field_completeness(self, document_type: str, extracted_fields: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate field completeness score"""
@@ -893,10 +1129,11 @@ Hãy đánh giá tuân thủ và trả lời theo format JSON:
         
         # Map extracted fields to required fields (flexible matching)
         found_mandatory = []
+        keys_lower = [key.lower() for key in extracted_fields]
         for field in mandatory_fields:
             # Check if field or similar field exists
-            if any(field.lower() in key.lower() or key.lower() in field.lower() 
-                   for key in extracted_fields.keys()):
+            field_lower = field.lower()
+            if any(field_lower in key or key in field_lower for key in keys_lower):
                 found_mandatory.append(field)
         
         missing_mandatory = [field for field in mandatory_fields if field not in found_mandatory]
@@ -910,13 +1147,14 @@ Hãy đánh giá tuân thủ và trả lời theo format JSON:
             "found_mandatory": len(found_mandatory)
         }
 
-    def _determine_action_required(self, compliance_result: Dict[str, Any]) -> str:
+    def _determine_action_required(self, compliance_result: Dict[str, Any], severity_counts: Optional[Counter] = None) -> str:
         """Determine what action is required based on compliance result"""
         status = compliance_result.get("status")
-        violations = compliance_result.get("violations", [])
+        if severity_counts is None:
+            severity_counts = Counter(v.get("severity") for v in compliance_result.get("violations", []))
         
-        high_severity = [v for v in violations if v.get("severity") == "HIGH"]
-        medium_severity = [v for v in violations if v.get("severity") == "MEDIUM"]
+        high_severity = severity_counts["HIGH"]
+        medium_severity = severity_counts["MEDIUM"]
         
         if status == ComplianceStatus.COMPLIANT:
             return "No action required - document is compliant"
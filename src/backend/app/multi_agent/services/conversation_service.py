@@ -1,9 +1,10 @@
 import io
-import json
 import asyncio
 from contextlib import asynccontextmanager
 from uuid import UUID
 
+import orjson
+
 from app.multi_agent.agents.conversation_agent.state import ConversationState
 from app.multi_agent.agents.conversation_agent.workflow import get_conversation_workflow
 from app.multi_agent.config import (
@@ -67,7 +68,7 @@ async def stream_chat(
                     },
                 }
 
-                yield f"data: {json.dumps(data_response, ensure_ascii=False)}\n\n"
+                yield b"data: " + orjson.dumps(data_response) + b"\n\n"
                 await asyncio.sleep(0.01)
 
         # Save message to DynamoDB (no session needed)
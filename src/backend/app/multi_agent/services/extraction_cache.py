@@ -0,0 +1,70 @@
+"""
+Cache of text extracted from uploaded documents.
+
+Users often re-upload the same file (e.g. to try another summary_type), and
+PDF parsing / OCR is the slowest step of those requests. Extracted text is
+keyed on the SHA-256 of the raw file bytes plus the extension and page limit,
+so a repeat upload skips extraction entirely.
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.multi_agent.config import (
+    EXTRACTION_CACHE_MAX_CHARS,
+    EXTRACTION_CACHE_MAX_ENTRIES,
+    EXTRACTION_CACHE_TTL
+)
+
+
+def extraction_cache_key(file_content: bytes, file_extension: str, max_pages: Optional[int] = None) -> str:
+    """Key on the file hash plus the options that change the extracted text."""
+    digest = hashlib.sha256(file_content).hexdigest()
+    return f"extract:{digest}:{file_extension}:{max_pages or 'all'}"
+
+
+class ExtractionCache:
+    """In-process LRU cache of extracted text, bounded by entry count and total size."""
+
+    def __init__(
+        self,
+        max_entries: int = EXTRACTION_CACHE_MAX_ENTRIES,
+        max_chars: int = EXTRACTION_CACHE_MAX_CHARS,
+        ttl: float = EXTRACTION_CACHE_TTL
+    ):
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._chars = 0
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached text for ``key``, or None on miss/expiry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, text = entry
+        if time.monotonic() >= expires_at:
+            self._evict(key)
+            return None
+        self._entries.move_to_end(key)
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """Store extracted text, evicting least recently used entries past either bound."""
+        if len(text) > self.max_chars:
+            return
+        if key in self._entries:
+            self._evict(key)
+        self._entries[key] = (time.monotonic() + self.ttl, text)
+        self._chars += len(text)
+        while len(self._entries) > self.max_entries or self._chars > self.max_chars:
+            self._evict(next(iter(self._entries)))
+
+    def _evict(self, key: str) -> None:
+        _, text = self._entries.pop(key)
+        self._chars -= len(text)
+
+
+extraction_cache = ExtractionCache()
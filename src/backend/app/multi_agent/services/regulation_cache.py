@@ -0,0 +1,47 @@
+"""
+Cache of knowledge-base regulation lookups for compliance validation.
+
+The UCP regulation query is built from the document type, so every document
+of a type sends the same retrieve-and-generate request. Answers are keyed on
+the knowledge base, generation model and query text, and kept for a TTL so
+repeat validations skip the knowledge-base round trip.
+"""
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from app.multi_agent.config import REGULATION_CACHE_MAX_ENTRIES, REGULATION_CACHE_TTL
+
+
+class RegulationCache:
+    """In-process LRU cache of regulation lookups with a per-entry TTL."""
+
+    def __init__(self, max_entries: int = REGULATION_CACHE_MAX_ENTRIES, ttl: float = REGULATION_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached lookup for ``key``, or None on miss/expiry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def put(self, key: Hashable, result: Dict[str, Any]) -> None:
+        """Store a lookup result, evicting the least recently used entry when full."""
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, copy.deepcopy(result))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+regulation_cache = RegulationCache()
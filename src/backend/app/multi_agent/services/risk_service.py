@@ -36,6 +36,40 @@ bedrock_service = BedrockService(
     max_tokens=max_tokens
 )
 
+# Patterns for parsing the credit assessment reply, compiled once at import
+_SECTION_PATTERNS = {
+    key: re.compile(pattern, re.DOTALL)
+    for key, pattern in {
+        "summary": r"Tóm tắt hồ sơ khách hàng:(.*?)(?=##2. Phân tích lịch sử tín dụng:|$)",
+        "creditHistory": r"Phân tích lịch sử tín dụng:(.*?)(?=##3. Phân tích tài chính|$)",
+        "financialAnalysis": r"Phân tích tài chính.*?:\s*(.*?)(?=##4. Phân tích rủi ro tổng thể:|$)",
+        "riskAnalysis": r"Phân tích rủi ro tổng thể:(.*?)(?=##5. Đề xuất phê duyệt tín dụng:|$)",
+        "recommendation": r"Đề xuất phê duyệt tín dụng:(.*?)(?=##6. Số tiền vay tối đa đề xuất:|$)",
+        "maxLoanAmount": r"Số tiền vay tối đa đề xuất:(.*?)(?=##7. Lãi suất đề xuất:|$)",
+        "interestRate": r"Lãi suất đề xuất:(.*?)(?=##8. Mức độ tin cậy:|$)",
+        "confidence": r"Mức độ tin cậy:(.*?)(?=##9. Khuyến nghị|$)",
+        "notes": r"Khuyến nghị.*?:\s*(.*?)(?='|$)"
+    }.items()
+}
+_CONFIDENCE_RE = re.compile(r'([0-9][0-9\.,]*)\s*%?')
+_REPEATED_QUOTES_RE = re.compile(r'("{2,})')
+# <br>, </li>, </p> and </td> all become line breaks; one pass covers them
+_LINE_BREAK_TAG_RE = re.compile(r'<(/)?br[^/>]*(/)?>|</li[^>]*>|</p>|</td>', re.IGNORECASE)
+_LINK_OPEN_TAG_RE = re.compile(r'<a[\t ]*(?!href)*(href="?)([^" \t>]*)[" \t]*[^>]*>', re.IGNORECASE)
+_LINK_CLOSE_TAG_RE = re.compile(r'</a>', re.IGNORECASE)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_INLINE_SPACE_RE = re.compile(r'[\t ]+')
+_BLANK_LINE_RE = re.compile(r'(?m)^[ \t]*\r?\n')
+_REPEATED_NEWLINES_RE = re.compile(r'\n{2,}')
+_CONTENT_PREFIX_RE = re.compile(r'^content[=:\-\s]*', re.IGNORECASE)
+# Log/metadata trailers echoed after the report; everything from the first one on is cut
+_REPORT_TRAILER_RE = re.compile(
+    r"'?HTTPStatusCode|response_metadata|metrics|input_tokens|output_tokens|total_tokens",
+    re.IGNORECASE,
+)
+_APPROVAL_RE = re.compile(r"đ[oơ]ng[\s\-\_\.,]*y")
+
+
 async def call_claude_sonnet(prompt: str) -> str:
     response = await bedrock_service.ai_ainvoke(prompt)
     # Nếu response là dict hoặc object, lấy text phù hợp
@@ -124,7 +158,6 @@ Hồ sơ khách hàng: (đúng format như bên dưới, có gạch đầu dòng
     ai_text = await call_claude_sonnet(prompt)
 
     # Hàm tách các phần từ text AI trả về
-    import re
     def extract_number(text):
         # Lấy toàn bộ cụm số và đơn vị tiền tệ trước dấu chấm đầu tiên
         idx = text.find('.')
@@ -140,8 +173,7 @@ Hồ sơ khách hàng: (đúng format như bên dưới, có gạch đầu dòng
         return text.strip()
 
     def extract_confidence(text):
-        import re
-        match = re.search(r'([0-9][0-9\.,]*)\s*%?', text)
+        match = _CONFIDENCE_RE.search(text)
         if match:
             num = match.group(1).replace('.', '').replace(',', '.')
             return f"{num}%"
@@ -159,19 +191,8 @@ Hồ sơ khách hàng: (đúng format như bên dưới, có gạch đầu dòng
             "confidence": 0.0,
             "notes": ""
         }
-        patterns = {
-            "summary": r"Tóm tắt hồ sơ khách hàng:(.*?)(?=##2. Phân tích lịch sử tín dụng:|$)",
-            "creditHistory": r"Phân tích lịch sử tín dụng:(.*?)(?=##3. Phân tích tài chính|$)",
-            "financialAnalysis": r"Phân tích tài chính.*?:\s*(.*?)(?=##4. Phân tích rủi ro tổng thể:|$)",
-            "riskAnalysis": r"Phân tích rủi ro tổng thể:(.*?)(?=##5. Đề xuất phê duyệt tín dụng:|$)",
-            "recommendation": r"Đề xuất phê duyệt tín dụng:(.*?)(?=##6. Số tiền vay tối đa đề xuất:|$)",
-            "maxLoanAmount": r"Số tiền vay tối đa đề xuất:(.*?)(?=##7. Lãi suất đề xuất:|$)",
-            "interestRate": r"Lãi suất đề xuất:(.*?)(?=##8. Mức độ tin cậy:|$)",
-            "confidence": r"Mức độ tin cậy:(.*?)(?=##9. Khuyến nghị|$)",
-            "notes": r"Khuyến nghị.*?:\s*(.*?)(?='|$)"
-        }
-        for key, pat in patterns.items():
-            m = re.search(pat, text, re.DOTALL)
+        for key, pattern in _SECTION_PATTERNS.items():
+            m = pattern.search(text)
             if m:
                 val = m.group(1).strip()
                 if key == "maxLoanAmount":
@@ -186,7 +207,6 @@ Hồ sơ khách hàng: (đúng format như bên dưới, có gạch đầu dòng
 
     # Hàm làm sạch text giống _clean_text của text_service
     def clean_text_field(text):
-        import re
         if not isinstance(text, str):
             return text
         # Unescape HTML entities
@@ -194,23 +214,20 @@ Hồ sơ khách hàng: (đúng format như bên dưới, có gạch đầu dòng
         # Unescape common escape sequences
         text = text.replace("\\r", "\r").replace("\\n", "\n").replace("\\t", "\t").replace('\\"', '"')
         # Loại bỏ các dấu nháy kép thừa
-        text = re.sub(r'("{2,})', '"', text)
+        text = _REPEATED_QUOTES_RE.sub('"', text)
         # Loại bỏ các tag <br>, </li>, </p>, </td> và chuyển thành xuống dòng
-        text = re.sub(r'<(/)?br[^/>]*(/)?>', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'</li[^>]*>', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'</p>', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'</td>', '\n', text, flags=re.IGNORECASE)
+        text = _LINE_BREAK_TAG_RE.sub('\n', text)
         # Loại bỏ các tag <a ...> và </a>
-        text = re.sub(r'<a[\t ]*(?!href)*(href="?)([^" \t>]*)[" \t]*[^>]*>', r' \2 ', text, flags=re.IGNORECASE)
-        text = re.sub(r'</a>', ' ', text, flags=re.IGNORECASE)
+        text = _LINK_OPEN_TAG_RE.sub(r' \2 ', text)
+        text = _LINK_CLOSE_TAG_RE.sub(' ', text)
         # Loại bỏ các tag HTML còn lại
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _HTML_TAG_RE.sub('', text)
         # Loại bỏ nhiều tab, space liên tiếp
-        text = re.sub(r'[\t ]+', ' ', text)
+        text = _INLINE_SPACE_RE.sub(' ', text)
         # Loại bỏ dòng trống
-        text = re.sub(r'(?m)^[ \t]*\r?\n', '', text)
+        text = _BLANK_LINE_RE.sub('', text)
         # Thay thế nhiều dòng trắng liên tiếp bằng 1 dòng trắng
-        text = re.sub(r'\n{2,}', '\n', text)
+        text = _REPEATED_NEWLINES_RE.sub('\n', text)
         # Loại bỏ khoảng trắng đầu/cuối
         text = text.strip('\n ')
         return text
@@ -224,25 +241,16 @@ Hồ sơ khách hàng: (đúng format như bên dưới, có gạch đầu dòng
     def clean_ai_report(text):
         text = clean_text_field(text)
         # Xóa 'content=' ở đầu nếu có
-        text = re.sub(r'^content[=:\-\s]*', '', text, flags=re.IGNORECASE)
+        text = _CONTENT_PREFIX_RE.sub('', text)
         # Cắt phần sau nếu có các chuỗi log/trailer
-        cut_patterns = [
-            r"HTTPStatusCode.*",
-            r"'HTTPStatusCode.*",
-            r"response_metadata.*",
-            r"metrics.*",
-            r"input_tokens.*",
-            r"output_tokens.*",
-            r"total_tokens.*"
-        ]
-        for pat in cut_patterns:
-            text = re.split(pat, text, flags=re.IGNORECASE)[0]
+        trailer = _REPORT_TRAILER_RE.search(text)
+        if trailer:
+            text = text[:trailer.start()]
         # Loại bỏ trailing dấu nháy đơn hoặc dấu xuống dòng thừa
         text = text.strip("'\n ")
         return text
     sections["ai_report"] = clean_ai_report(ai_text)
     # Thêm trường approved: chỉ cần có từ "đồng ý" (cho phép khoảng trắng/dấu giữa các ký tự)
-    import re
     import unicodedata
     def normalize_text(text):
         if not isinstance(text, str):
@@ -256,7 +264,7 @@ Hồ sơ khách hàng: (đúng format như bên dưới, có gạch đầu dòng
     recommendation_text = sections.get("recommendation", "")
     norm = normalize_text(recommendation_text)
     # Regex: chỉ cần có "đồng ý" (cho phép khoảng trắng/dấu giữa các ký tự)
-    match = re.search(r"đ[oơ]ng[\s\-\_\.,]*y", norm)
+    match = _APPROVAL_RE.search(norm)
     approved = bool(match)
     sections["approved"] = approved
     # Thêm creditScore random, creditRank theo bảng, scoringDate là hôm nay
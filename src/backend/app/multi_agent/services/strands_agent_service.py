@@ -5,19 +5,27 @@ Multi-Agent Hackathon 2025 - Group 181
 Service layer for integrating Strands Agents with FastAPI backend
 """
 
+import asyncio
 import json
 import logging
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
+from fastapi import HTTPException
+from strands import Agent
+
 # Import Strands Agent tools
 from app.multi_agent.agents.strands_tools import (
     compliance_validation_agent,
     risk_assessment_agent,
     document_intelligence_agent,
     vpbank_supervisor_agent,
-    supervisor_agent
+    supervisor_agent,
+    create_supervisor_agent,
+    run_supervisor,
+    AgentEventCallback
 )
+from app.multi_agent.utils.concurrency import LLM_LIMITER
 
 # Initialize logging
 logging.basicConfig(level=logging.INFO)
@@ -182,10 +190,25 @@ class StrandsAgentService:
                 "agent_type": "document_intelligence"
             }
     
+    async def prepare_supervisor(self) -> Optional[Agent]:
+        """
+        Build the supervisor agent (Bedrock client, tool registry) in a worker thread,
+        so callers can overlap it with work the agent does not depend on such as
+        document extraction; returns None on failure so the request builds its own
+        """
+        try:
+            return await asyncio.to_thread(create_supervisor_agent)
+        except Exception as e:
+            logger.warning(f"⚠️ Supervisor agent prebuild failed: {str(e)}")
+            return None
+    
     async def process_supervisor_request(
         self,
         user_request: str,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        parallel: bool = True,
+        on_event: Optional[AgentEventCallback] = None,
+        supervisor: Optional[Agent] = None
     ) -> Dict[str, Any]:
         """
         Process request through supervisor agent
@@ -193,6 +216,9 @@ class StrandsAgentService:
         Args:
             user_request: User's request or question
             context: Optional context information
+            parallel: Dispatch routed specialist agents concurrently
+            on_event: Optional progress hook (called from the worker thread)
+            supervisor: Optional agent from prepare_supervisor()
             
         Returns:
             Supervisor agent response
@@ -200,8 +226,11 @@ class StrandsAgentService:
         try:
             logger.info(f"🎯 Processing supervisor request: {user_request[:100]}...")
             
-            # Call Strands Agent tool
-            result_json = vpbank_supervisor_agent(user_request, context)
+            # Run the blocking supervisor workflow off the event loop, within the LLM concurrency cap
+            async with LLM_LIMITER.slot():
+                result_json = await asyncio.to_thread(
+                    run_supervisor, user_request, context, parallel, on_event, supervisor
+                )
             result = json.loads(result_json)
             
             # Add service metadata
@@ -214,6 +243,9 @@ class StrandsAgentService:
             
             return result
             
+        except HTTPException:
+            # Load shedding (503) propagates to the route unchanged
+            raise
         except Exception as e:
             logger.error(f"❌ Supervisor request error: {str(e)}")
             return {
@@ -222,6 +254,36 @@ class StrandsAgentService:
                 "agent_type": "supervisor_orchestrator"
             }
     
+    async def process_supervisor_request_stream(
+        self,
+        user_request: str,
+        context: Optional[Dict[str, Any]] = None,
+        parallel: bool = True,
+        supervisor: Optional[Agent] = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Streaming variant of process_supervisor_request
+        
+        Yields ``(event, data)`` pairs as the supervisor works: ``agent_start`` /
+        ``agent_complete`` per sub-agent, ``delta`` for model text, and a final
+        ``result`` carrying the same payload as the non-streaming call.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        
+        def on_event(event: str, data: Dict[str, Any]) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, (event, data))
+        
+        task = asyncio.ensure_future(
+            self.process_supervisor_request(user_request, context, parallel, on_event, supervisor)
+        )
+        # Events are queued before the worker thread returns, so the sentinel always comes last
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+        
+        while (item := await queue.get()) is not None:
+            yield item
+        yield "result", task.result()
+    
     async def get_agent_status(self) -> Dict[str, Any]:
         """
         Get status of all available Strands Agents
@@ -251,6 +313,7 @@ class StrandsAgentService:
                 "status": "success",
                 "agents": agent_status,
                 "total_agents": len(self.available_agents),
+                "llm_concurrency": LLM_LIMITER.stats(),
                 "service_info": {
                     "service": "strands_agent_service",
                     "version": "1.0.0",
@@ -0,0 +1,53 @@
+"""
+Response cache for LLM-backed text summaries.
+
+Summaries are keyed on a SHA-256 of the whitespace-normalized text plus the
+summary parameters, so resubmitting the same content (or the same document)
+returns the stored summary instead of invoking Bedrock again.
+"""
+import copy
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.multi_agent.config import SUMMARY_CACHE_MAX_ENTRIES, SUMMARY_CACHE_TTL
+
+
+def summary_cache_key(text: str, summary_type: str, max_length: int, language: str) -> str:
+    """Exact-match key: normalized text hash combined with the summary parameters."""
+    normalized = " ".join(text.split())
+    payload = f"{summary_type}|{max_length}|{language}|{normalized}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SummaryCache:
+    """In-process LRU cache of summary results with a per-entry TTL."""
+
+    def __init__(self, max_entries: int = SUMMARY_CACHE_MAX_ENTRIES, ttl: float = SUMMARY_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached summary for ``key``, or None on miss/expiry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        # Callers decorate the result (e.g. document_info); keep the stored copy clean
+        return copy.deepcopy(result)
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a summary result, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl, copy.deepcopy(result))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+summary_cache = SummaryCache()
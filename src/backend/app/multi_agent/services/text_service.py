@@ -3,7 +3,9 @@ import logging
 import asyncio
 import aiohttp
 import time
-from typing import Optional, Dict, Any
+from datetime import datetime
+from enum import IntEnum
+from typing import AsyncIterator, Optional, Dict, Any, Tuple
 from io import BytesIO
 import re
 
@@ -14,9 +16,15 @@ try:
 except ImportError as e:
     logging.warning(f"Document processing libraries not available: {e}")
 
+from fastapi import Request
+
 from app.multi_agent.services.bedrock_service import BedrockService
-from app.multi_agent.helpers.improved_pdf_extractor import ImprovedPDFExtractor
 from app.multi_agent.helpers.dynamic_summary_config import DynamicSummaryConfig
+from app.multi_agent.helpers.document_chunking_helper import DocumentChunkingHelper
+from app.multi_agent.helpers.extraction_pool import extract_pdf_async
+from app.multi_agent.services.extraction_cache import extraction_cache, extraction_cache_key
+from app.multi_agent.utils.singleflight import SingleFlight
+from app.multi_agent.utils.concurrency import LLM_LIMITER
 
 from app.multi_agent.config import (
     BEDROCK_RT, 
@@ -29,6 +37,31 @@ from app.multi_agent.config import (
 
 logger = logging.getLogger(__name__)
 
+# Concurrent uploads of the same file share one extraction
+_EXTRACTION_FLIGHT = SingleFlight()
+
+
+class Lang(IntEnum):
+    """Supported summary output languages"""
+    VI = 0
+    EN = 1
+
+
+# Accepted spellings, looked up once per request instead of compared downstream
+_LANG_MAP = {
+    "vietnamese": Lang.VI,
+    "vi": Lang.VI,
+    "tiếng việt": Lang.VI,
+    "english": Lang.EN,
+    "en": Lang.EN,
+}
+_LANG_CODES = ("vietnamese", "english")
+
+
+def resolve_language(language: Optional[str]) -> str:
+    """Canonical language code for ``language``; unknown values fall back to Vietnamese"""
+    return _LANG_CODES[_LANG_MAP.get((language or "").strip().lower(), Lang.VI)]
+
 
 class TextSummaryService:
     """
@@ -92,53 +125,62 @@ class TextSummaryService:
             # Clean and prepare text
             cleaned_text = self._clean_text(text)
             
-            # Performance optimization: Skip expensive operations for small documents
-            FAST_PROCESSING_THRESHOLD = 10000  # 10K chars - process directly without analysis
-            
-            if len(cleaned_text) < FAST_PROCESSING_THRESHOLD:
-                # Fast path for small documents (most banking documents)
-                logger.info(f"🚀 Fast processing for small document ({len(cleaned_text):,} chars)")
-                return await self._summarize_direct(
-                    cleaned_text, summary_type, max_length, language, None
-                )
-            
-            # Standard processing with analysis for medium documents
-            document_analysis = None
-            if auto_adjust_length:
-                optimal_max_length, analysis = DynamicSummaryConfig.calculate_optimal_max_length(
-                    cleaned_text, summary_type, max_length
-                )
-                
-                # Use optimal length if significantly different from user input
-                if abs(optimal_max_length - max_length) > max_length * 0.5:
-                    logger.info(f"Auto-adjusting max_length: {max_length} → {optimal_max_length}")
-                    max_length = optimal_max_length
-                
-                document_analysis = analysis
-            
-            # Import chunking helper only when needed
-            from app.multi_agent.helpers.document_chunking_helper import DocumentChunkingHelper
-            
-            # Initialize chunking helper
-            chunking_helper = DocumentChunkingHelper()
-            
-            # Smart chunking decision - now with 100K threshold (doubled from 50K)
-            if chunking_helper.should_chunk_document(cleaned_text):
-                logger.info(f"📚 Large document detected ({len(cleaned_text):,} chars), using optimized chunking approach")
-                return await self._summarize_with_chunking(
-                    cleaned_text, summary_type, max_length, language, 
-                    document_analysis, chunking_helper
-                )
-            else:
-                logger.info(f"📄 Standard document processing ({len(cleaned_text):,} chars) - skipping chunking")
-                return await self._summarize_direct(
-                    cleaned_text, summary_type, max_length, language, document_analysis
-                )
+            async with LLM_LIMITER.slot():
+                return await self._summarize_cleaned(cleaned_text, summary_type, max_length, language, auto_adjust_length)
                 
         except Exception as e:
             logger.error(f"Error in text summarization: {str(e)}")
             raise
 
+    async def _summarize_cleaned(
+        self,
+        cleaned_text: str,
+        summary_type: str,
+        max_length: int,
+        language: str,
+        auto_adjust_length: bool
+    ) -> Dict[str, Any]:
+        """Pick the direct or chunked strategy for already-cleaned text"""
+        # Performance optimization: Skip expensive operations for small documents
+        FAST_PROCESSING_THRESHOLD = 10000  # 10K chars - process directly without analysis
+        
+        if len(cleaned_text) < FAST_PROCESSING_THRESHOLD:
+            # Fast path for small documents (most banking documents)
+            logger.info(f"🚀 Fast processing for small document ({len(cleaned_text):,} chars)")
+            return await self._summarize_direct(
+                cleaned_text, summary_type, max_length, language, None
+            )
+        
+        # Standard processing with analysis for medium documents
+        document_analysis = None
+        if auto_adjust_length:
+            optimal_max_length, analysis = DynamicSummaryConfig.calculate_optimal_max_length(
+                cleaned_text, summary_type, max_length
+            )
+            
+            # Use optimal length if significantly different from user input
+            if abs(optimal_max_length - max_length) > max_length * 0.5:
+                logger.info(f"Auto-adjusting max_length: {max_length} → {optimal_max_length}")
+                max_length = optimal_max_length
+            
+            document_analysis = analysis
+        
+        # Initialize chunking helper
+        chunking_helper = DocumentChunkingHelper()
+        
+        # Smart chunking decision - now with 100K threshold (doubled from 50K)
+        if chunking_helper.should_chunk_document(cleaned_text):
+            logger.info(f"📚 Large document detected ({len(cleaned_text):,} chars), using optimized chunking approach")
+            return await self._summarize_with_chunking(
+                cleaned_text, summary_type, max_length, language, 
+                document_analysis, chunking_helper
+            )
+        else:
+            logger.info(f"📄 Standard document processing ({len(cleaned_text):,} chars) - skipping chunking")
+            return await self._summarize_direct(
+                cleaned_text, summary_type, max_length, language, document_analysis
+            )
+
     async def _summarize_with_chunking(
         self,
         text: str,
@@ -264,7 +306,23 @@ class TextSummaryService:
         end_time = time.time()
         processing_time = end_time - start_time
         
-        # Prepare response
+        return self._direct_response(
+            text, summary, summary_type, max_length, language,
+            model_used, processing_time, document_analysis
+        )
+
+    def _direct_response(
+        self,
+        text: str,
+        summary: str,
+        summary_type: str,
+        max_length: int,
+        language: str,
+        model_used: str,
+        processing_time: float,
+        document_analysis: Optional[Dict]
+    ) -> Dict[str, Any]:
+        """Build the response payload for a single-call (non-chunked) summary"""
         response = {
             "summary": summary,
             "summary_type": summary_type,
@@ -289,6 +347,66 @@ class TextSummaryService:
         logger.info(f"✅ Direct summarization complete: {processing_time:.2f}s using {model_used}")
         return response
 
+    async def summarize_text_stream(
+        self,
+        text: str,
+        summary_type: str = "general",
+        max_length: int = 3000,
+        language: str = "vietnamese",
+        auto_adjust_length: bool = True
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Streaming variant of summarize_text yielding ``(event, data)`` pairs:
+        ``delta`` events with summary text as Bedrock generates it, then a final
+        ``result`` with the same payload summarize_text returns. Documents that
+        need chunking are summarized in one go and only emit ``progress`` + ``result``.
+        """
+        if not text or len(text.strip()) < 50:
+            raise ValueError("Văn bản quá ngắn để tóm tắt (tối thiểu 50 ký tự)")
+        
+        cleaned_text = self._clean_text(text)
+        
+        if not self.bedrock_service or DocumentChunkingHelper().should_chunk_document(cleaned_text):
+            yield "progress", {"stage": "chunked_summarization", "original_length": len(cleaned_text)}
+            yield "result", await self.summarize_text(
+                text, summary_type, max_length, language, auto_adjust_length
+            )
+            return
+        
+        # Same length adjustment as summarize_text applies above the fast-path threshold
+        document_analysis = None
+        if auto_adjust_length and len(cleaned_text) >= 10000:
+            optimal_max_length, document_analysis = DynamicSummaryConfig.calculate_optimal_max_length(
+                cleaned_text, summary_type, max_length
+            )
+            if abs(optimal_max_length - max_length) > max_length * 0.5:
+                max_length = optimal_max_length
+        
+        prompt = self._generate_summary_prompt(
+            text=cleaned_text,
+            summary_type=summary_type,
+            max_length=max_length,
+            language=language
+        )
+        
+        start_time = time.time()
+        parts = []
+        async with LLM_LIMITER.slot():
+            async for chunk in self.bedrock_service.ai_astream(prompt):
+                delta = self.bedrock_service.ai_chunk_stream(chunk)
+                if delta:
+                    parts.append(delta)
+                    yield "delta", {"text": delta}
+        
+        summary = "".join(parts).strip()
+        if not summary:
+            raise ValueError("Không có AI service nào khả dụng để tóm tắt")
+        
+        yield "result", self._direct_response(
+            cleaned_text, summary, summary_type, max_length, language,
+            "bedrock_claude", time.time() - start_time, document_analysis
+        )
+
     def _extract_summary_from_response(self, response) -> str:
         """Extract summary text from AI service response"""
         try:
@@ -312,33 +430,54 @@ class TextSummaryService:
         max_pages: Optional[int] = None
     ) -> str:
         """
-        Extract text from various document formats
+        Extract text from various document formats. PDF/DOCX results are cached
+        by file hash, so re-uploading the same document skips parsing and OCR.
         """
         try:
             if file_extension == '.txt':
                 return file_content.decode('utf-8')
             
-            elif file_extension == '.pdf':
-                return self._extract_text_from_pdf(file_content, max_pages)
+            if file_extension not in ['.pdf', '.docx', '.doc']:
+                raise ValueError(f"Unsupported file format: {file_extension}")
             
-            elif file_extension in ['.docx', '.doc']:
-                return self._extract_text_from_docx(file_content)
+            # hashlib releases the GIL on large buffers, so hash in a worker thread
+            cache_key = await asyncio.to_thread(extraction_cache_key, file_content, file_extension, max_pages)
+            cached_text = extraction_cache.get(cache_key)
+            if cached_text is not None:
+                logger.info(f"♻️ Reusing cached extraction for {filename} ({len(cached_text)} characters)")
+                return cached_text
             
-            else:
-                raise ValueError(f"Unsupported file format: {file_extension}")
+            async def extract() -> str:
+                text = await self._extract_uncached(file_content, file_extension, max_pages)
+                extraction_cache.put(cache_key, text)
+                return text
+            
+            return await _EXTRACTION_FLIGHT.do(cache_key, extract)
                 
         except Exception as e:
             logger.error(f"Error extracting text from {filename}: {str(e)}")
             raise
 
-    def _extract_text_from_pdf(self, file_content: bytes, max_pages: Optional[int] = None) -> str:
+    async def _extract_uncached(
+        self,
+        file_content: bytes,
+        file_extension: str,
+        max_pages: Optional[int] = None
+    ) -> str:
+        """Parse a PDF/DOCX upload off the event loop"""
+        # PDF parsing and the OCR fallback are CPU-bound and hold the GIL, so they run
+        # in the extractor process pool (large PDFs split by page batch); DOCX parsing
+        # is light enough for a thread
+        if file_extension == '.pdf':
+            extraction_result = await extract_pdf_async(file_content, max_pages)
+            return await asyncio.to_thread(self._handle_pdf_extraction, extraction_result)
+        return await asyncio.to_thread(self._extract_text_from_docx, file_content)
+
+    def _handle_pdf_extraction(self, extraction_result: Dict[str, Any]) -> str:
         """
-        Extract text from PDF file using ImprovedPDFExtractor
+        Validate and log an ImprovedPDFExtractor result produced in the extractor pool
         """
         try:
-            extractor = ImprovedPDFExtractor()
-            extraction_result = extractor.extract_text_from_pdf(file_content, max_pages=max_pages)
-            
             # Extract text and source information
             extracted_text = extraction_result['text']
             source = extraction_result['source']
@@ -379,8 +518,6 @@ class TextSummaryService:
         Save extracted text to logs directory for debugging
         """
         try:
-            from datetime import datetime
-            
             # Create logs directory if it doesn't exist (Docker path)
             logs_dir = "/app/logs"
             os.makedirs(logs_dir, exist_ok=True)
@@ -450,3 +587,14 @@ NỘI DUNG CẦN TÓM TẮT:
 TÓM TẮT:"""
         
         return prompt
+
+
+def get_text_service(request: Request) -> TextSummaryService:
+    """
+    FastAPI dependency returning the app-wide TextSummaryService created in the
+    lifespan, so Bedrock clients are built once rather than per request
+    """
+    service = getattr(request.app.state, "text_service", None)
+    if service is None:
+        service = request.app.state.text_service = TextSummaryService()
+    return service
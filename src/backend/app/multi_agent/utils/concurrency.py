@@ -0,0 +1,56 @@
+"""
+Bounded concurrency for expensive upstream calls (Bedrock, OCR, ...).
+
+Excess requests queue in-process instead of fanning out to the upstream
+service; requests that wait longer than the queue timeout, or arrive while
+the wait queue is full, are shed with 503.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+
+from fastapi import HTTPException
+
+from app.multi_agent.config import BEDROCK_QUEUE_TIMEOUT, LLM_QUEUE_LIMIT, MAX_INFLIGHT_LLM
+
+OVERLOADED_DETAIL = "Hệ thống đang quá tải, vui lòng thử lại sau"
+
+
+class ConcurrencyLimiter:
+    """asyncio.Semaphore with an optional bounded wait and bounded wait queue."""
+
+    def __init__(self, limit: int, queue_timeout: Optional[float] = None, max_waiters: Optional[int] = None):
+        self.limit = limit
+        self.queue_timeout = queue_timeout
+        self.max_waiters = max_waiters
+        self._semaphore = asyncio.Semaphore(limit)
+        self._waiters = 0
+        self._in_flight = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Gauge snapshot: requests holding a slot and requests waiting for one."""
+        return {"limit": self.limit, "in_flight": self._in_flight, "waiting": self._waiters}
+
+    @asynccontextmanager
+    async def slot(self):
+        if (self.max_waiters is not None and self._semaphore.locked()
+                and self._waiters >= self.max_waiters):
+            raise HTTPException(status_code=503, detail=OVERLOADED_DETAIL)
+        self._waiters += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=503, detail=OVERLOADED_DETAIL)
+        finally:
+            self._waiters -= 1
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
+
+
+# Shared by the supervisor and summarization paths so together they stay within
+# the provisioned Bedrock throughput
+LLM_LIMITER = ConcurrencyLimiter(MAX_INFLIGHT_LLM, BEDROCK_QUEUE_TIMEOUT, LLM_QUEUE_LIMIT)
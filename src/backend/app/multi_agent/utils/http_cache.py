@@ -0,0 +1,43 @@
+"""
+HTTP caching helpers for read-only endpoints.
+
+Lets browsers, reverse proxies and CloudFront revalidate with
+If-None-Match and receive 304 Not Modified instead of the full body.
+"""
+import hashlib
+from typing import Any, Dict
+
+import orjson
+from fastapi import Request
+from fastapi.responses import Response
+
+DEFAULT_MAX_AGE = 30
+
+
+def compute_etag(content: Any, weak: bool = False) -> str:
+    """Build a quoted ETag from raw bytes or any orjson-serializable payload."""
+    if not isinstance(content, bytes):
+        content = orjson.dumps(content, option=orjson.OPT_SORT_KEYS)
+    tag = f'"{hashlib.md5(content).hexdigest()}"'
+    return f"W/{tag}" if weak else tag
+
+
+def cache_headers(etag: str, max_age: int = DEFAULT_MAX_AGE) -> Dict[str, str]:
+    """Standard caching headers for a public, briefly cacheable response."""
+    return {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check the request's If-None-Match header against an ETag (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in header.split(","))
+
+
+def not_modified(etag: str, max_age: int = DEFAULT_MAX_AGE) -> Response:
+    """Empty 304 response carrying the caching headers."""
+    return Response(status_code=304, headers=cache_headers(etag, max_age))
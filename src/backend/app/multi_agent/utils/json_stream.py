@@ -0,0 +1,113 @@
+"""
+Incremental detection of a complete JSON object in streamed model output.
+
+Validation replies are a single JSON object, sometimes wrapped in prose. Feeding
+the text deltas through ``JsonObjectScanner`` tells the caller the moment that
+object closes, so it can stop reading the stream instead of waiting for any
+trailing commentary. ``find_json_object`` and ``iter_json_arrays`` apply the same
+string-aware bracket matching to a complete reply.
+"""
+from typing import Iterator, List, Optional
+
+
+class JsonObjectScanner:
+    """Track brace depth (ignoring braces inside strings) across text deltas."""
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._length = 0
+        self._start: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        # Unscanned remainder of the last delta (after an object closed in it)
+        self._pending = ""
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        return "".join(self._parts)
+
+    def feed(self, delta: str = "") -> Optional[str]:
+        """
+        Add a delta; return a top-level ``{...}`` once it has closed, otherwise
+        None. Scanning then resumes for the next object; ``feed()`` with no
+        delta continues through whatever followed the returned object.
+        """
+        if delta:
+            self._parts.append(delta)
+            self._length += len(delta)
+        chunk = self._pending + delta
+        self._pending = ""
+        offset = self._length - len(chunk)
+
+        for i, char in enumerate(chunk):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                if self._start is not None:
+                    self._in_string = True
+            elif char == "{":
+                if self._start is None:
+                    self._start = offset + i
+                self._depth += 1
+            elif char == "}" and self._start is not None:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._pending = chunk[i + 1:]
+                    start, self._start = self._start, None
+                    return self.text[start:offset + i + 1]
+        return None
+
+
+def find_json_object(text: str) -> Optional[str]:
+    """
+    Return the first balanced top-level ``{...}`` in ``text``, or None.
+
+    A single linear pass; unlike a greedy ``{.*}`` regex it neither backtracks
+    nor spans from the first brace to the last.
+    """
+    return JsonObjectScanner().feed(text)
+
+
+def _balanced_end(text: str, start: int, open_char: str, close_char: str) -> Optional[int]:
+    """Index just past the bracket closing ``text[start]``, skipping string contents"""
+    depth = 0
+    in_string = escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == open_char:
+            depth += 1
+        elif char == close_char:
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return None
+
+
+def iter_json_arrays(text: str) -> Iterator[str]:
+    """
+    Yield balanced ``[...]`` spans of ``text`` in order of their opening
+    bracket. Brackets in surrounding prose (``[Note]``, ``[Art. 14]``) come out
+    as their own spans, so the caller takes the first one that parses.
+    """
+    start = text.find("[")
+    while start != -1:
+        end = _balanced_end(text, start, "[", "]")
+        if end is not None:
+            yield text[start:end]
+        start = text.find("[", start + 1)
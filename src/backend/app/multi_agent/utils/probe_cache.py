@@ -0,0 +1,62 @@
+"""
+Per-key cache for dependency probe results with per-endpoint TTL policies.
+
+Reachability of DynamoDB/S3/Bedrock changes rarely, so probe results are
+reused for their freshness lifetime. When a refresh fails, the last good
+value can be served stale so a transient AWS blip does not flip /health
+to degraded.
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+logger = logging.getLogger(__name__)
+
+HIT = "HIT"
+MISS = "MISS"
+STALE = "STALE"
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Freshness bounds for one kind of cached result (seconds)."""
+    min_ttl: float
+    max_ttl: float
+    buffer: float = 0.0
+
+    def freshness_lifetime(self, generation_time: float) -> float:
+        """Slow-to-produce results stay fresh longer, clamped to [min_ttl, max_ttl]."""
+        return min(max(generation_time + self.buffer, self.min_ttl), self.max_ttl)
+
+
+class PolicyCache:
+    """Cache of probe results keyed by name, refreshed according to a CachePolicy."""
+
+    def __init__(self, stale_on_error: bool = True):
+        self.stale_on_error = stale_on_error
+        # key -> (stored at, fresh until, value)
+        self._entries: Dict[Hashable, Tuple[float, float, Any]] = {}
+
+    async def get(self, key: Hashable, policy: CachePolicy,
+                  probe: Callable[[], Awaitable[Any]]) -> Tuple[Any, str]:
+        """
+        Return ``(value, state)`` where state is HIT, MISS or STALE.
+        Probe errors propagate unless a previous value can be served stale.
+        """
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and now < entry[1]:
+            return entry[2], HIT
+
+        try:
+            value = await probe()
+        except Exception as e:
+            if entry is not None and self.stale_on_error:
+                logger.warning("Probe %s failed, serving stale result: %s", key, e)
+                return entry[2], STALE
+            raise
+
+        done = time.monotonic()
+        self._entries[key] = (done, done + policy.freshness_lifetime(done - now), value)
+        return value, MISS
@@ -0,0 +1,54 @@
+"""
+In-process TTL cache for pre-serialized JSON responses.
+
+Health endpoints are polled every few seconds by load balancers, Kubernetes
+probes and monitoring; serving a recently built body avoids rebuilding the
+payload (and re-probing dependencies) on every poll.
+"""
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from app.multi_agent.utils.singleflight import SingleFlight
+
+# key -> (monotonic build time, serialized body)
+_HEALTH_CACHE: Dict[str, Tuple[float, bytes]] = {}
+# Collapses concurrent rebuilds after expiry into a single builder call
+_INFLIGHT = SingleFlight()
+
+
+async def _cached(key: str, ttl: float, builder: Callable[[], Awaitable[Any]]) -> Tuple[bytes, bool]:
+    """Return ``(body, hit)`` for ``key``, rebuilding the body once it is older than ``ttl``."""
+    entry = _HEALTH_CACHE.get(key)
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        return entry[1], True
+
+    async def rebuild() -> bytes:
+        payload = await builder()
+        if isinstance(payload, BaseModel):
+            payload = payload.model_dump()
+        body = orjson.dumps(payload)
+        _HEALTH_CACHE[key] = (time.monotonic(), body)
+        return body
+
+    return await _INFLIGHT.do(key, rebuild), False
+
+
+async def cached_json_response(key: str, ttl: float, builder: Callable[[], Awaitable[Any]]) -> Response:
+    """
+    Serve the cached JSON body for ``key`` with ``Cache-Control`` and
+    ``X-Cache: HIT/MISS`` headers. The body is returned as raw bytes, so
+    hits skip both the builder and response-model validation.
+    """
+    body, hit = await _cached(key, ttl, builder)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={
+            "Cache-Control": f"public, max-age={int(ttl)}",
+            "X-Cache": "HIT" if hit else "MISS"
+        }
+    )
@@ -0,0 +1,64 @@
+"""
+Router composition helpers.
+
+``APIRouter.include_router`` rebuilds every included ``APIRoute`` from scratch
+(dependency graph, response fields, body models), and the app does it once more
+when it includes the composite router. Intermediate composite routers only need
+to carry routes through to that final include, so they can copy them instead.
+"""
+import copy
+from enum import Enum
+from typing import Any, List, Optional, Union
+
+from fastapi import APIRouter
+from fastapi.routing import APIRoute
+from fastapi.utils import get_value_or_default
+from starlette.routing import compile_path
+
+
+class FlatAPIRouter(APIRouter):
+    """
+    APIRouter whose ``include_router`` appends shallow copies of the included
+    routes with the prefix and tags applied, instead of re-running
+    ``APIRoute.__init__`` for each of them.
+
+    Only valid for routers that are themselves included into the app (or another
+    ``APIRouter``), whose ``include_router`` rebuilds the routes in full. Includes
+    with options other than ``prefix``/``tags``, or of routers holding non-API
+    routes, use the regular implementation.
+    """
+
+    def include_router(
+        self,
+        router: APIRouter,
+        *,
+        prefix: str = "",
+        tags: Optional[List[Union[str, Enum]]] = None,
+        **kwargs: Any
+    ) -> None:
+        if kwargs or not prefix or not all(isinstance(route, APIRoute) for route in router.routes):
+            super().include_router(router, prefix=prefix, tags=tags, **kwargs)
+            return
+
+        assert prefix.startswith("/"), "A path prefix must start with '/'"
+        assert not prefix.endswith("/"), "A path prefix must not end with '/', as the routes will start with '/'"
+
+        for route in router.routes:
+            flat_route = copy.copy(route)
+            flat_route.path = prefix + route.path
+            flat_route.path_regex, flat_route.path_format, flat_route.param_convertors = compile_path(flat_route.path)
+            flat_route.tags = [*(tags or []), *route.tags]
+            flat_route.dependencies = list(route.dependencies)
+            # Resolve router-level defaults now, as the regular include does
+            flat_route.response_class = get_value_or_default(
+                route.response_class, router.default_response_class, self.default_response_class
+            )
+            flat_route.generate_unique_id_function = get_value_or_default(
+                route.generate_unique_id_function, router.generate_unique_id_function
+            )
+            self.routes.append(flat_route)
+
+        for handler in router.on_startup:
+            self.add_event_handler("startup", handler)
+        for handler in router.on_shutdown:
+            self.add_event_handler("shutdown", handler)
@@ -0,0 +1,52 @@
+"""
+Single-flight coalescing for concurrent identical async calls.
+
+While a call for a given key is in flight, later callers with the same key
+await the leader's result instead of issuing their own upstream request.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one execution."""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, _Flight] = {}
+
+    async def do(self, key: Hashable, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``coro_factory()`` for ``key`` unless an identical call is already
+        running, in which case wait for and return that call's result.
+
+        The call runs in its own task that every caller awaits through a shield:
+        cancelling one caller (the first one included) does not cancel the call
+        for the others. It is cancelled only once no caller is left waiting.
+        """
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(coro_factory()))
+            self._inflight[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller gave up; later callers start a fresh call
+                self._forget(key, flight)
+                flight.task.cancel()
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
@@ -0,0 +1,37 @@
+"""
+Server-sent events helpers for streaming endpoints.
+
+Long-running supervisor and summary calls report progress as ``(event, data)``
+pairs; these helpers frame them as ``text/event-stream`` so clients can render
+output as soon as the first event arrives instead of waiting for the full result.
+"""
+import logging
+from typing import Any, AsyncIterator, Tuple
+
+import orjson
+from fastapi.responses import StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+# Disable proxy buffering (nginx) so events are flushed to the client immediately
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def format_sse(event: str, data: Any) -> bytes:
+    """Frame one event as ``event: <name>\\ndata: <json>\\n\\n``."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+async def _encode_events(events: AsyncIterator[Tuple[str, Any]]) -> AsyncIterator[bytes]:
+    try:
+        async for event, data in events:
+            yield format_sse(event, data)
+    except Exception as e:
+        # Headers are already sent, so failures are reported in-band
+        logger.error("SSE stream failed: %s", e)
+        yield format_sse("error", {"message": str(e)})
+
+
+def sse_response(events: AsyncIterator[Tuple[str, Any]]) -> StreamingResponse:
+    """Stream ``(event, data)`` pairs as a ``text/event-stream`` response."""
+    return StreamingResponse(_encode_events(events), media_type="text/event-stream", headers=SSE_HEADERS)
@@ -0,0 +1,49 @@
+"""
+Bridges from blocking iterators to async iteration.
+
+boto3 streaming responses (EventStream) block on the socket between events;
+iterating one inside a coroutine stalls the event loop, so nothing else -
+including the SSE response relaying those events - runs until it ends.
+"""
+import asyncio
+import threading
+from typing import AsyncIterator, Iterable, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+async def iterate_in_thread(iterable: Iterable[T]) -> AsyncIterator[T]:
+    """
+    Consume a blocking iterable in a worker thread, yielding its items on the
+    event loop as they arrive. Exceptions raised by the iterable are re-raised
+    here; if the consumer stops early, the worker stops at the next item.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+
+    def pump() -> None:
+        try:
+            for item in iterable:
+                if stop.is_set():
+                    break
+                loop.call_soon_threadsafe(queue.put_nowait, (item, None))
+        except BaseException as e:
+            loop.call_soon_threadsafe(queue.put_nowait, (_DONE, e))
+        else:
+            loop.call_soon_threadsafe(queue.put_nowait, (_DONE, None))
+
+    worker = loop.run_in_executor(None, pump)
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                break
+            yield item
+    finally:
+        stop.set()
+    await worker
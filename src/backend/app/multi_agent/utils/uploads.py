@@ -0,0 +1,95 @@
+"""
+Helpers for consuming multipart uploads without buffering them in memory.
+
+Starlette already spools each UploadFile to a SpooledTemporaryFile, so
+callers that only need metadata can walk it in fixed-size chunks instead of
+materializing the whole body with ``await file.read()``.
+"""
+from typing import AsyncIterator, Collection, Optional, Tuple
+
+from fastapi import HTTPException, UploadFile
+
+UPLOAD_CHUNK_SIZE = 1 << 20
+BOUNDED_READ_CHUNK_SIZE = 64 * 1024
+
+DOCX_CONTENT_TYPES = frozenset({
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/msword",
+})
+_IMAGE_SIGNATURES = (b"\xff\xd8\xff", b"\x89PNG", b"GIF8", b"II*\x00", b"MM\x00*")
+
+
+def get_file_extension(filename: Optional[str]) -> str:
+    """
+    Lower-cased extension with its dot, or "" when there is none. Same result as
+    ``os.path.splitext(filename)[1].lower()`` (dotfiles such as ".env" have no
+    extension) using a single rpartition.
+    """
+    head, dot, ext = (filename or "").rpartition(".")
+    if not dot or "/" in ext or not head.rpartition("/")[2].lstrip("."):
+        return ""
+    return "." + ext.lower()
+
+
+async def iter_upload(file: UploadFile, chunk_size: int = UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Yield the upload body chunk by chunk from the start of the file."""
+    await file.seek(0)
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
+
+async def upload_size(file: UploadFile) -> int:
+    """Size of the upload in bytes, counted chunk by chunk; the file is rewound afterwards."""
+    size = 0
+    async for chunk in iter_upload(file):
+        size += len(chunk)
+    await file.seek(0)
+    return size
+
+
+async def read_upload_bounded(
+    file: UploadFile,
+    max_bytes: int,
+    allowed_ext: Collection[str],
+    too_large_detail: str,
+    unsupported_detail: str,
+) -> Tuple[bytes, str]:
+    """
+    Validate the extension, then read the upload in small chunks, rejecting it
+    with 400 as soon as it exceeds ``max_bytes`` rather than after buffering
+    the whole body. Returns ``(content, extension)``.
+    """
+    extension = get_file_extension(file.filename)
+    if extension not in allowed_ext:
+        raise HTTPException(status_code=400, detail=unsupported_detail)
+
+    chunks = []
+    total = 0
+    while chunk := await file.read(BOUNDED_READ_CHUNK_SIZE):
+        total += len(chunk)
+        if total > max_bytes:
+            raise HTTPException(status_code=400, detail=too_large_detail)
+        chunks.append(chunk)
+    return b"".join(chunks), extension
+
+
+def detect_file_kind(head: bytes, filename: Optional[str] = None,
+                     content_type: Optional[str] = None) -> Optional[str]:
+    """
+    Classify an upload as "pdf", "docx" or "image" from its leading bytes.
+    The client-supplied content type is only a fallback when the signature
+    is not recognised.
+    """
+    if head.startswith(b"%PDF"):
+        return "pdf"
+    if head.startswith(b"PK") and (filename or "").lower().endswith(".docx"):
+        return "docx"
+    if head.startswith(_IMAGE_SIGNATURES):
+        return "image"
+    if content_type == "application/pdf":
+        return "pdf"
+    if content_type in DOCX_CONTENT_TYPES:
+        return "docx"
+    if content_type and content_type.startswith("image/"):
+        return "image"
+    return None
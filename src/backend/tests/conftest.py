@@ -0,0 +1,12 @@
+"""
+Test setup: make ``app`` importable when pytest runs from src/backend, and give
+config.py the environment it requires at import time.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("MESSAGES_LIMIT", "20")
+os.environ.setdefault("AWS_REGION", "us-east-1")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
@@ -0,0 +1,92 @@
+"""
+Batch compliance validation must stay within the Bedrock limiter: every
+knowledge base or Bedrock call, retries included, holds its own slot.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.multi_agent.services.compliance_config import ComplianceConfig
+from app.multi_agent.services.compliance_service import ComplianceStatus, ComplianceValidationService
+from app.multi_agent.utils.concurrency import ConcurrencyLimiter
+
+DOCUMENT_TEXT = "Commercial invoice no. 123 for goods shipped under documentary credit. " * 3
+
+
+class _FakeBedrock:
+    """Answers only the first document of each batch so the rest are retried one by one."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+
+    def _enter(self):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+
+    async def ai_ainvoke(self, prompt):
+        self._enter()
+        try:
+            await asyncio.sleep(0.01)
+            return '[{"id": 0, "status": "COMPLIANT", "confidence": 0.9}]'
+        finally:
+            self.in_flight -= 1
+
+    def ai_astream(self, prompt, max_tokens=None):
+        async def stream():
+            self._enter()
+            try:
+                await asyncio.sleep(0.01)
+                yield SimpleNamespace(content=[{"text": '{"status": "COMPLIANT", "confidence": 0.8}'}])
+            finally:
+                self.in_flight -= 1
+        return stream()
+
+    def ai_chunk_stream(self, chunk):
+        return chunk.content[-1]["text"]
+
+
+def _service(bedrock):
+    service = ComplianceValidationService.__new__(ComplianceValidationService)
+    service.bedrock_kb_client = None
+    service.knowledge_base_id = None
+    service.config = ComplianceConfig()
+    service.bedrock_model_id = "test-model"
+    service.bedrock_service = bedrock
+    return service
+
+
+def test_batch_bedrock_calls_stay_within_limiter():
+    bedrock = _FakeBedrock()
+    limiter = ConcurrencyLimiter(2)
+    documents = [(DOCUMENT_TEXT, "commercial_invoice")] * 50
+
+    results = asyncio.run(_service(bedrock).validate_documents_batch(documents, limiter=limiter))
+
+    assert len(results) == 50
+    assert bedrock.calls > limiter.limit
+    assert bedrock.peak <= limiter.limit
+    assert limiter.stats()["in_flight"] == 0
+
+
+def test_batch_sheds_with_503_when_limiter_queue_times_out():
+    async def scenario():
+        limiter = ConcurrencyLimiter(1, queue_timeout=0.01)
+        documents = [(DOCUMENT_TEXT, "commercial_invoice")] * 10
+
+        async with limiter.slot():
+            with pytest.raises(HTTPException) as excinfo:
+                await _service(_FakeBedrock()).validate_documents_batch(documents, limiter=limiter)
+        assert excinfo.value.status_code == 503
+
+    asyncio.run(scenario())
+
+
+def test_batch_without_limiter_still_validates():
+    service = _service(_FakeBedrock())
+    results = asyncio.run(service.validate_documents_batch([(DOCUMENT_TEXT, "commercial_invoice")] * 3))
+    assert [result["compliance_status"] for result in results] == [ComplianceStatus.COMPLIANT.value] * 3
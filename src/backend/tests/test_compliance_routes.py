@@ -0,0 +1,48 @@
+"""
+Request validation on the compliance routes: too-short documents are rejected
+while parsing, before any single-flight, limiter or Bedrock work.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.multi_agent.main import app
+from app.multi_agent.routes.v1 import compliance_routes
+
+PADDED_SHORT_TEXT = "short invoice text" + " " * 100
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async def unexpected(*args, **kwargs):
+        raise AssertionError("validation work started for a rejected request")
+
+    monkeypatch.setattr(compliance_routes, "_validate_limited", unexpected)
+    monkeypatch.setattr(compliance_routes.ComplianceValidationService, "validate_documents_batch", unexpected)
+    return TestClient(app)
+
+
+def test_validate_rejects_whitespace_padded_short_text(client):
+    response = client.post("/mutil_agent/api/v1/compliance/validate", json={"text": PADDED_SHORT_TEXT})
+    assert response.status_code == 422
+
+
+def test_validate_batch_rejects_whitespace_padded_short_text(client):
+    response = client.post(
+        "/mutil_agent/api/v1/compliance/validate/batch",
+        json={"documents": [{"text": PADDED_SHORT_TEXT}]}
+    )
+    assert response.status_code == 422
+
+
+def test_validate_strips_text_before_validation(client, monkeypatch):
+    received = []
+
+    async def fake_validate(text, document_type):
+        received.append(text)
+        return {"compliance_status": "COMPLIANT"}
+
+    monkeypatch.setattr(compliance_routes, "_validate_limited", fake_validate)
+    text = "x" * 60
+    response = client.post("/mutil_agent/api/v1/compliance/validate", json={"text": f"  {text}\n"})
+    assert response.status_code == 200
+    assert received == [text]
@@ -0,0 +1,50 @@
+"""
+Response compression: bodies under GZIP_MINIMUM_SIZE go out as-is, larger ones
+are gzipped, and server-sent event streams are never buffered in the compressor.
+"""
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.multi_agent.config import GZIP_MINIMUM_SIZE
+from app.multi_agent.main import app
+from app.multi_agent.middleware.compression import CompressionMiddleware
+
+GZIP = {"Accept-Encoding": "gzip"}
+
+
+def test_body_under_threshold_is_not_compressed():
+    response = TestClient(app).get("/mutil_agent/public/api/v1/health-check/", headers=GZIP)
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert int(response.headers["content-length"]) < GZIP_MINIMUM_SIZE
+    assert response.json() == {"status": "success"}
+
+
+def test_body_over_threshold_is_compressed():
+    plain = TestClient(app).get("/mutil_agent/api/v1/info", headers={"Accept-Encoding": "identity"})
+    assert len(plain.content) >= GZIP_MINIMUM_SIZE
+    assert "content-encoding" not in plain.headers
+
+    response = TestClient(app).get("/mutil_agent/api/v1/info", headers=GZIP)
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert int(response.headers["content-length"]) < len(plain.content)
+    assert response.content == plain.content
+
+
+def test_event_stream_passes_through_uncompressed():
+    stream_app = FastAPI()
+    stream_app.add_middleware(CompressionMiddleware, minimum_size=1)
+
+    @stream_app.get("/events")
+    async def events():
+        async def generate():
+            for i in range(3):
+                yield f"data: {'x' * 512} {i}\n\n"
+        return StreamingResponse(generate(), media_type="text/event-stream")
+
+    response = TestClient(stream_app).get("/events", headers=GZIP)
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.text.count("data: ") == 3
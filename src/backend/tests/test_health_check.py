@@ -0,0 +1,27 @@
+"""
+The public health probes serve pre-serialized bodies; these tests run them
+through the application's real middleware stack.
+"""
+import orjson
+from fastapi.testclient import TestClient
+
+from app.multi_agent.main import app
+
+ROOT_PROBE = "/mutil_agent/public/api/v1/health-check/"
+
+
+def test_root_probe_survives_repeated_gzip_requests():
+    client = TestClient(app)
+    for accept_encoding in ("gzip", "gzip", "identity", "gzip"):
+        response = client.get(ROOT_PROBE, headers={"Accept-Encoding": accept_encoding})
+        assert response.status_code == 200
+        assert response.json() == {"status": "success"}
+
+
+def test_health_probe_payload():
+    response = TestClient(app).get(ROOT_PROBE + "health")
+    assert response.status_code == 200
+    body = orjson.loads(response.content)
+    assert body["status"] == "healthy"
+    assert isinstance(body["timestamp"], int)
+    assert response.headers["cache-control"] == "max-age=10"
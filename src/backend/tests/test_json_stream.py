@@ -0,0 +1,60 @@
+import orjson
+
+from app.multi_agent.utils.json_stream import JsonObjectScanner, find_json_object, iter_json_arrays
+
+
+def test_find_json_object_ignores_braces_and_escaped_quotes_in_strings():
+    text = 'Result: {"note": "a } and { inside", "quote": "say \\"}\\" ok"} trailing'
+    found = find_json_object(text)
+    assert found == '{"note": "a } and { inside", "quote": "say \\"}\\" ok"}'
+    assert orjson.loads(found)["quote"] == 'say "}" ok'
+
+
+def test_find_json_object_returns_first_of_several_objects():
+    assert find_json_object('{"a": {"b": 1}} then {"c": 2}') == '{"a": {"b": 1}}'
+
+
+def test_find_json_object_without_object():
+    assert find_json_object("no json here") is None
+    assert find_json_object("") is None
+    assert find_json_object('{"unterminated": 1') is None
+
+
+def test_scanner_yields_every_object_in_one_delta():
+    scanner = JsonObjectScanner()
+    assert scanner.feed('{bad} {"ok": 1} {"next": 2}') == "{bad}"
+    assert scanner.feed() == '{"ok": 1}'
+    assert scanner.feed() == '{"next": 2}'
+    assert scanner.feed() is None
+
+
+def test_scanner_object_split_across_deltas():
+    scanner = JsonObjectScanner()
+    deltas = ['Verdict: {"status": "COMP', 'LIANT", "text": "brace \\"{', '\\" here"', ", \"n\": [1, {\"x\": 2}]", "} done"]
+    results = [scanner.feed(delta) for delta in deltas]
+    assert results[:-1] == [None] * (len(deltas) - 1)
+    assert orjson.loads(results[-1]) == {"status": "COMPLIANT", "text": 'brace "{" here', "n": [1, {"x": 2}]}
+    assert scanner.text == "".join(deltas)
+
+
+def test_scanner_escape_split_across_deltas():
+    scanner = JsonObjectScanner()
+    assert scanner.feed('{"a": "x\\') is None
+    assert scanner.feed('"}') is None
+    found = scanner.feed('"}')
+    assert orjson.loads(found) == {"a": 'x"}'}
+
+
+def test_scanner_without_object():
+    scanner = JsonObjectScanner()
+    assert scanner.feed("plain ") is None
+    assert scanner.feed("text } only") is None
+    assert scanner.text == "plain text } only"
+
+
+def test_iter_json_arrays_skips_prose_brackets():
+    text = '[Note] see UCP 600 [Art. 14]: [{"id": 0, "ref": "[Art. 14]"}] end [x'
+    candidates = list(iter_json_arrays(text))
+    assert candidates[0] == "[Note]"
+    assert '[{"id": 0, "ref": "[Art. 14]"}]' in candidates
+    assert "[x" not in candidates
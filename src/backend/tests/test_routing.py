@@ -0,0 +1,118 @@
+"""
+FlatAPIRouter copies routes using FastAPI internals; these tests check that an
+app built with it is indistinguishable from one built with APIRouter.
+"""
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, FastAPI, Header, Query
+from fastapi.responses import ORJSONResponse, PlainTextResponse
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.multi_agent.utils.routing import FlatAPIRouter
+
+
+class Item(BaseModel):
+    name: str
+    tags: List[str] = []
+
+
+def _verify_token(x_token: Optional[str] = Header(default=None)):
+    return x_token
+
+
+def _sub_routers():
+    items = APIRouter()
+
+    @items.get("/")
+    async def list_items(limit: int = Query(10, ge=1)):
+        return {"limit": limit}
+
+    @items.get("/{item_id}", tags=["Item Detail"], dependencies=[Depends(_verify_token)])
+    async def get_item(item_id: int):
+        return {"item_id": item_id}
+
+    @items.post("/", response_model=Item, status_code=201)
+    async def create_item(item: Item):
+        return item
+
+    @items.get("/{item_id}/text", response_class=PlainTextResponse)
+    async def item_text(item_id: int):
+        return f"item {item_id}"
+
+    health = APIRouter(default_response_class=PlainTextResponse)
+
+    @health.get("/ping")
+    async def ping():
+        return "pong"
+
+    @health.api_route("/check", methods=["GET", "HEAD"])
+    async def check():
+        return "ok"
+
+    return items, health
+
+
+def _build_app(router_class) -> FastAPI:
+    items, health = _sub_routers()
+    composite = router_class(default_response_class=ORJSONResponse)
+    composite.include_router(health, prefix="/v1/health", tags=["Health Checks"])
+    composite.include_router(items, prefix="/v1/items", tags=["Items"])
+
+    app = FastAPI()
+    app.include_router(composite, prefix="/api", tags=["Private APIs"])
+    return app
+
+
+def _route_table(app: FastAPI):
+    return [
+        (route.path, sorted(route.methods), route.name, route.response_class.__name__, route.tags)
+        for route in app.routes
+        if isinstance(route, APIRoute)
+    ]
+
+
+def test_flat_router_matches_regular_router_openapi_and_routes():
+    flat_app = _build_app(FlatAPIRouter)
+    regular_app = _build_app(APIRouter)
+
+    assert flat_app.openapi() == regular_app.openapi()
+    assert _route_table(flat_app) == _route_table(regular_app)
+
+
+def test_flat_router_serves_requests_like_regular_router():
+    requests = [
+        ("get", "/api/v1/items/?limit=3", {}),
+        ("get", "/api/v1/items/?limit=0", {}),
+        ("get", "/api/v1/items/7", {"headers": {"x-token": "t"}}),
+        ("get", "/api/v1/items/abc", {}),
+        ("post", "/api/v1/items/", {"json": {"name": "a", "tags": ["x"]}}),
+        ("post", "/api/v1/items/", {"json": {"tags": []}}),
+        ("get", "/api/v1/items/7/text", {}),
+        ("get", "/api/v1/health/ping", {}),
+        ("head", "/api/v1/health/check", {}),
+        ("get", "/api/v1/missing", {}),
+    ]
+    clients = [TestClient(_build_app(FlatAPIRouter)), TestClient(_build_app(APIRouter))]
+    for method, url, kwargs in requests:
+        flat, regular = (getattr(client, method)(url, **kwargs) for client in clients)
+        assert (flat.status_code, flat.headers.get("content-type"), flat.content) == (
+            regular.status_code, regular.headers.get("content-type"), regular.content
+        ), url
+
+
+def test_v1_router_matches_regular_router(monkeypatch):
+    from app.multi_agent.routes import v1_routes
+
+    def build(router_class) -> FastAPI:
+        monkeypatch.setattr(v1_routes, "FlatAPIRouter", router_class)
+        app = FastAPI()
+        app.include_router(v1_routes.build_router(), prefix="/mutil_agent/api", tags=["Private APIs"])
+        return app
+
+    flat_app = build(FlatAPIRouter)
+    regular_app = build(APIRouter)
+
+    assert flat_app.openapi() == regular_app.openapi()
+    assert _route_table(flat_app) == _route_table(regular_app)